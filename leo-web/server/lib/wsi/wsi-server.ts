@@ -301,6 +301,7 @@ export interface ControlCommandMessage extends WSIMessage {
   type: 'control_command';
   command: 'pause' | 'resume' | 'cancel' | 'stop_request' | 'prepare_shutdown';
   reason?: string;
+  timeout_seconds?: number; // prepare_shutdown: seconds until force kill
 }
 
 // Graceful shutdown response from container
@@ -1337,6 +1338,7 @@ export class WSIServer extends EventEmitter {
       type: 'control_command',
       command: 'prepare_shutdown',
       reason: msg.reason || 'User requested stop',
+      timeout_seconds: this.SHUTDOWN_TIMEOUT_MS / 1000,
     });
 
     // Start timeout - force kill if container doesn't respond
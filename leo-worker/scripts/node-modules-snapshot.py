@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+node_modules Snapshot Builder
+
+Pre-builds node_modules snapshots (keyed by package-lock.json hash) so new
+apps copy them instead of running a full `npm install`. Run at image build
+time or against a shared volume (LEO_NODE_MODULES_SNAPSHOT_DIR).
+
+Usage:
+    python scripts/node-modules-snapshot.py build /path/to/template
+    python scripts/node-modules-snapshot.py list
+    python scripts/node-modules-snapshot.py restore /workspace/app/todo
+
+`build` runs `npm ci` in the template if it has no node_modules yet.
+"""
+
+import argparse
+import datetime
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from cc_tools.common.npm import npm_env  # noqa: E402
+from cc_tools.common import node_modules_snapshot as snapshots  # noqa: E402
+
+
+def build(project_dir: Path) -> int:
+    if not (project_dir / "package-lock.json").exists():
+        print(f"❌ No package-lock.json in {project_dir}")
+        return 1
+    if not (project_dir / "node_modules").exists():
+        print(f"Installing dependencies in {project_dir}...")
+        result = subprocess.run(["npm", "ci", "--prefer-offline"], cwd=project_dir, env=npm_env())
+        if result.returncode != 0:
+            print("❌ npm ci failed")
+            return 1
+    key = snapshots.save_node_modules(project_dir)
+    if key:
+        print(f"✅ Saved snapshot {key} in {snapshots.SNAPSHOT_DIR}")
+    else:
+        print(f"Snapshot for {snapshots.lockfile_key(project_dir)} already exists")
+    return 0
+
+
+def list_snapshots() -> int:
+    entries = snapshots._snapshots()
+    if not entries:
+        print(f"No snapshots in {snapshots.SNAPSHOT_DIR}")
+    for path, meta in entries:
+        last_used = datetime.datetime.fromtimestamp(meta.get("last_used", 0)).isoformat(timespec="seconds")
+        print(f"{path.name}  {meta.get('package')}  last used {last_used}")
+    return 0
+
+
+def restore(project_dir: Path) -> int:
+    restored = snapshots.restore_node_modules(project_dir)
+    if not restored:
+        print("Nothing restored (node_modules already present or no snapshot of this package)")
+        return 1
+    print(f"✅ Restored {restored['key']} (exact={restored['exact']}) in {restored['seconds']}s")
+    if not restored["exact"]:
+        print("   Run `npm install` to apply the delta against the snapshot")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["build", "list", "restore"])
+    parser.add_argument("project_dir", nargs="?", type=Path)
+    args = parser.parse_args()
+
+    if args.command == "list":
+        return list_snapshots()
+    if not args.project_dir:
+        parser.error(f"{args.command} needs a project directory")
+    project_dir = args.project_dir.resolve()
+    return build(project_dir) if args.command == "build" else restore(project_dir)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
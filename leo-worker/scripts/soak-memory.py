@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Memory Soak Test for Leo Container
+
+Simulates a long generation (default: 50 iterations ~ a 12-hour run) with
+synthetic SDK messages and checks that worker RSS stays flat. Drives the
+real long-lived structures:
+
+- Agent.run (AgentResult.tool_uses, assistant text buffer) with a fake
+  message stream in place of the Claude CLI
+- ConversationLogger callback -> LogCollector -> heuristic classifier
+- ScreenshotWatcher seen-file tracking
+- WSI StateMachine history
+- Unsplash IMAGE_METADATA (skipped if fastmcp/PIL aren't installed)
+
+Usage:
+    python scripts/soak-memory.py
+    python scripts/soak-memory.py --iterations 50 --turns 400 --payload-kb 16
+
+Exits non-zero if RSS grows more than --tolerance-mb after warm-up.
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+import psutil
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+# Keep the unsplash server from creating ./stock_photos or touching the shared photo store
+os.environ.setdefault("UNSPLASH_SAVE_DIR", tempfile.mkdtemp(prefix="soak-unsplash-"))
+os.environ.setdefault("UNSPLASH_STORE_DIR", tempfile.mkdtemp(prefix="soak-unsplash-store-"))
+
+from claude_agent_sdk import AssistantMessage, ResultMessage, TextBlock, ToolUseBlock  # noqa: E402
+
+import cc_agent.base as agent_base  # noqa: E402
+from cc_agent.base import Agent  # noqa: E402
+from cc_agent.conversation_logger import ConversationLogger  # noqa: E402
+from leo.monitor.collector import LogCollector  # noqa: E402
+from leo.monitor.heuristics import classify_trajectory  # noqa: E402
+from runtime.wsi.screenshot_watcher import ScreenshotWatcher  # noqa: E402
+from runtime.wsi.state_machine import ConnectionState, StateMachine  # noqa: E402
+
+try:
+    from cc_tools.unsplash import server as unsplash_server  # noqa: E402
+except ImportError:
+    unsplash_server = None
+
+WARMUP_ITERATIONS = 5
+
+# One 60s monitor window per this many turns (12h / 50 iterations ~ 14 windows each)
+WINDOWS_PER_ITERATION = 14
+
+SCREENSHOTS_PER_ITERATION = 20
+IMAGES_PER_ITERATION = 30
+
+CONNECTION_CYCLE = [
+    ConnectionState.ACTIVE,
+    ConnectionState.PROMPTING,
+    ConnectionState.ACTIVE,
+    ConnectionState.COMPLETED,
+]
+
+
+def rss_mb() -> float:
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def synthetic_stream(turns: int, payload_kb: int, iteration: int):
+    """Fake retry_async_generator: `turns` assistant messages and a result."""
+    payload = "x" * (payload_kb * 1024)
+
+    async def _stream(*args, **kwargs):
+        for turn in range(turns):
+            await asyncio.sleep(0)  # Let monitor window tasks run, as real I/O would
+            yield AssistantMessage(
+                content=[
+                    TextBlock(text=f"Iteration {iteration}, turn {turn}: working on the next file. " * 20),
+                    ToolUseBlock(
+                        id=f"toolu_{uuid.uuid4().hex}",
+                        name="Write" if turn % 3 else "Read",
+                        input={"file_path": f"/workspace/app/src/file_{turn}.ts", "content": payload},
+                    ),
+                ],
+                model="claude-sonnet",
+            )
+        yield ResultMessage(
+            subtype="success",
+            duration_ms=1000,
+            duration_api_ms=900,
+            is_error=False,
+            num_turns=turns,
+            session_id=f"soak-{iteration}",
+            total_cost_usd=0.5,
+            usage={"input_tokens": 1000, "output_tokens": 500},
+        )
+
+    return _stream
+
+
+async def run_iteration(
+    iteration: int,
+    args: argparse.Namespace,
+    log_dir: Path,
+    collector: LogCollector,
+    watcher: ScreenshotWatcher,
+    state_machine: StateMachine,
+) -> None:
+    agent_base.retry_async_generator = synthetic_stream(args.turns, args.payload_kb, iteration)
+
+    agent = Agent(name="AppGenerator", system_prompt="soak", max_turns=args.turns + 1, verbose=False)
+    agent.conversation_logger = ConversationLogger(
+        agent_name="AppGenerator",
+        log_dir=log_dir,
+        enable_jsonl=False,
+        enable_text=False,
+        on_log=collector.add_entry,
+    )
+
+    # Emit monitor windows while the agent runs, like the collector timer would
+    turns_per_window = max(1, args.turns // WINDOWS_PER_ITERATION)
+    original_add = collector.add_entry
+    added = 0
+
+    def add_and_window(entry):
+        nonlocal added
+        original_add(entry)
+        added += 1
+        if added % turns_per_window == 0:
+            asyncio.get_running_loop().create_task(collector._emit_batch("soak"))
+
+    agent.conversation_logger.on_log = add_and_window
+    result = await agent.run(f"Iteration {iteration}")
+    await collector._emit_batch("soak")
+    assert result.tool_use_count == args.turns, result.tool_use_count
+
+    for n in range(SCREENSHOTS_PER_ITERATION):
+        watcher._mark_seen(f"/workspace/leo-artifacts/screenshots/iteration_{iteration}/shot_{n}.png", 0)
+
+    for state in CONNECTION_CYCLE:
+        state_machine.transition_to(state)
+    state_machine.reset()
+
+    if unsplash_server:
+        for n in range(IMAGES_PER_ITERATION):
+            unsplash_server.remember_image(
+                f"unsplash_{iteration}_{n}.jpg",
+                {"id": f"{iteration}-{n}", "description": "synthetic photo " * 20},
+            )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=400, help="Agent turns per iteration")
+    parser.add_argument("--payload-kb", type=int, default=16, help="Write payload size per tool call")
+    parser.add_argument("--tolerance-mb", type=float, default=48.0, help="Allowed RSS growth after warm-up")
+    args = parser.parse_args()
+
+    classified = 0
+
+    def on_batch(batch) -> None:
+        nonlocal classified
+        if classify_trajectory(batch):
+            classified += 1
+
+    collector = LogCollector(batch_interval_seconds=60)
+    collector.set_batch_callback(on_batch)
+    watcher = ScreenshotWatcher(wsi_client=None, watch_dir=tempfile.mkdtemp(prefix="soak-screens-"))
+    state_machine = StateMachine(initial_state=ConnectionState.READY)
+
+    samples = []
+    with tempfile.TemporaryDirectory(prefix="soak-logs-") as log_dir:
+        for iteration in range(1, args.iterations + 1):
+            await run_iteration(iteration, args, Path(log_dir), collector, watcher, state_machine)
+            gc.collect()
+            samples.append(rss_mb())
+            print(f"iteration {iteration:3d}/{args.iterations}: rss={samples[-1]:7.1f} MB", flush=True)
+
+    baseline = samples[min(WARMUP_ITERATIONS, len(samples)) - 1]
+    growth = max(samples) - baseline
+    print()
+    print(f"Baseline (after {WARMUP_ITERATIONS} iterations): {baseline:.1f} MB")
+    print(f"Peak: {max(samples):.1f} MB, final: {samples[-1]:.1f} MB, growth: {growth:+.1f} MB")
+    print(f"Tracked screenshots: {len(watcher._seen_files)}, state history: {len(state_machine.state_history)}")
+    if unsplash_server:
+        print(f"Image metadata entries: {len(unsplash_server.IMAGE_METADATA)}")
+    print(f"Heuristically classified windows: {classified}")
+
+    if growth > args.tolerance_mb:
+        print(f"❌ RSS grew {growth:.1f} MB after warm-up (tolerance {args.tolerance_mb:.0f} MB)")
+        return 1
+    print("✅ RSS stayed flat")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
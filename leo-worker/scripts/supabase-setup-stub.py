@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Supabase Provisioning Against a Local Management API Stub
+
+Starts an aiohttp stub of the Supabase Management API endpoints used by the
+supabase_setup MCP server, runs the real provisioning pipeline against it
+and prints the per-phase timings. No Supabase account needed.
+
+The stub reports COMING_UP until --ready-after seconds have passed since
+project creation, and adds --latency to every request.
+
+Usage:
+    python scripts/supabase-setup-stub.py
+    python scripts/supabase-setup-stub.py --ready-after 12 --latency 0.3
+
+Exits non-zero if provisioning fails or the post-ready steps didn't overlap.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+PROJECT_REF = "stubprojectref0001"
+
+
+def build_stub(ready_after: float, latency: float) -> web.Application:
+    created_at = {}
+    calls = []
+
+    @web.middleware
+    async def slow(request, handler):
+        calls.append(f"{request.method} {request.path}")
+        await asyncio.sleep(latency)
+        return await handler(request)
+
+    async def organizations(request):
+        return web.json_response([{"id": "stub-org", "name": "Stub Org"}])
+
+    async def create_project(request):
+        body = await request.json()
+        created_at[PROJECT_REF] = time.monotonic()
+        return web.json_response({"id": PROJECT_REF, "name": body["name"]}, status=201)
+
+    async def project(request):
+        ready = time.monotonic() - created_at.get(PROJECT_REF, time.monotonic()) >= ready_after
+        return web.json_response({"id": PROJECT_REF, "status": "ACTIVE_HEALTHY" if ready else "COMING_UP"})
+
+    async def pooler(request):
+        return web.json_response([{
+            "db_host": "aws-0-us-east-1.pooler.stub.local",
+            "db_port": 6543,
+            "db_user": f"postgres.{PROJECT_REF}",
+            "db_name": "postgres"
+        }])
+
+    async def api_keys(request):
+        return web.json_response([
+            {"name": "anon", "api_key": "stub-anon-key-0123456789abcdef"},
+            {"name": "service_role", "api_key": "stub-service-key-0123456789abcdef"}
+        ])
+
+    async def auth_config(request):
+        return web.json_response(await request.json())
+
+    app = web.Application(middlewares=[slow])
+    app["calls"] = calls
+    app.router.add_get("/v1/organizations", organizations)
+    app.router.add_post("/v1/projects", create_project)
+    app.router.add_get("/v1/projects/{ref}", project)
+    app.router.add_get("/v1/projects/{ref}/config/database/pooler", pooler)
+    app.router.add_get("/v1/projects/{ref}/api-keys", api_keys)
+    app.router.add_patch("/v1/projects/{ref}/config/auth", auth_config)
+    return app
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ready-after", type=float, default=5.0, help="Seconds until the project is ACTIVE_HEALTHY")
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds added to every API call")
+    parser.add_argument("--port", type=int, default=8787)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SUPABASE_ACCESS_TOKEN", "stub-token")
+    from cc_tools.supabase_setup.server import SupabaseSetupMCPServer  # noqa: E402
+
+    stub = build_stub(args.ready_after, args.latency)
+    runner = web.AppRunner(stub)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", args.port).start()
+
+    try:
+        server = SupabaseSetupMCPServer(api_url=f"http://127.0.0.1:{args.port}/v1")
+        with tempfile.TemporaryDirectory(prefix="supabase-stub-app-") as app_dir:
+            result = await server.provision_project("stub-app", app_dir, schema_sql="create table t (id int);")
+            env_written = (Path(app_dir) / ".env").exists()
+    finally:
+        await runner.cleanup()
+
+    print(result["output"])
+    print()
+    print(f"Timings: {json.dumps(result.get('timings', {}), indent=2)}")
+    polls = sum(1 for call in stub["calls"] if call == f"GET /v1/projects/{PROJECT_REF}")
+    print(f"Status polls: {polls}")
+
+    if not result["success"] or not env_written:
+        print(f"❌ Provisioning failed: {result.get('error')}")
+        return 1
+
+    timings = result["timings"]
+    sequential = timings["pooler_info"] + timings["api_keys"] + timings["auth_config"]
+    if timings["post_ready"] >= sequential:
+        print(f"❌ Post-ready steps ran sequentially ({timings['post_ready']}s >= {sequential:.2f}s)")
+        return 1
+    print(f"✅ Provisioned in {timings['total']}s (post-ready {timings['post_ready']}s vs {sequential:.2f}s sequential)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,27 +1,40 @@
 """Claude Code Agent - Base classes for multi-agent systems."""
 
 from .base import Agent, AgentResult
-from .cost_tracker import CostTracker
+from .cost_tracker import CostTracker, CostSnapshot, UsageTotals
+from .client_pool import ClientPool
+from .prompt_layout import PromptLayout, PromptSegment, PromptPrefixRegistry
 from .session_utils import (
     SessionInfo,
+    SessionCatalog,
     encode_cwd_for_session_path,
     get_session_directory,
     find_sessions_for_cwd,
     find_latest_meaningful_session,
     session_exists,
     get_session_size,
+    read_last_messages,
 )
 
 __all__ = [
     "Agent",
     "AgentResult",
     "CostTracker",
+    "CostSnapshot",
+    "UsageTotals",
+    "ClientPool",
+    # Prompt layout (prompt caching)
+    "PromptLayout",
+    "PromptSegment",
+    "PromptPrefixRegistry",
     # Session utilities
     "SessionInfo",
+    "SessionCatalog",
     "encode_cwd_for_session_path",
     "get_session_directory",
     "find_sessions_for_cwd",
     "find_latest_meaningful_session",
     "session_exists",
     "get_session_size",
+    "read_last_messages",
 ]
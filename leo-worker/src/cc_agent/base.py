@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import os
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional, Any, Union, AsyncGenerator
 from pathlib import Path
@@ -15,6 +16,8 @@ from .logging import get_logger
 from .retry_handler import retry_async_generator
 from .conversation_logger import ConversationLogger, ConversationCallback
 from .cost_tracker import CostTracker
+from .prompt_layout import PromptPrefixRegistry, stable_hash, hash_agent_definitions
+from .client_pool import ClientPool
 
 # Global callback for conversation logging - allows WSI or other orchestrators
 # to receive real-time conversation events from all agents
@@ -40,6 +43,81 @@ def get_global_conversation_callback() -> Optional[ConversationCallback]:
     return _global_conversation_callback
 
 
+def is_client_alive(client: Optional[ClaudeSDKClient]) -> bool:
+    """Check if a ClaudeSDKClient's underlying subprocess is still running.
+
+    The ClaudeSDKClient uses a subprocess transport. This checks if that
+    subprocess is still alive to avoid "Cannot write to terminated process"
+    errors. Shared by Agent session handling and the helper client pool.
+
+    Returns:
+        True if client exists and process is alive, False otherwise
+    """
+    if not client:
+        return False
+
+    # Access the transport layer to check process status
+    try:
+        # ClaudeSDKClient uses _transport which has a process attribute
+        # (public `process` on older SDKs, anyio `_process` on newer ones)
+        transport = getattr(client, '_transport', None)
+        if transport:
+            process = getattr(transport, 'process', None) or getattr(transport, '_process', None)
+            if process:
+                if hasattr(process, 'poll'):
+                    # poll() returns None if running, exit code if terminated
+                    return process.poll() is None
+                return getattr(process, 'returncode', None) is None
+    except Exception:
+        pass
+
+    # If we can't determine, assume alive (let the actual call fail with clear error)
+    return True
+
+
+# Tool uses kept on AgentResult. Inputs are stored in full (Write/Edit
+# payloads), so long sessions only keep the most recent ones.
+MAX_RECORDED_TOOL_USES = 200
+
+# Assistant text kept per run; older text is dropped once this is exceeded
+MAX_CONTENT_CHARS = 256 * 1024
+
+
+class ContentBuffer:
+    """
+    Rolling buffer of assistant text blocks for one agent run.
+
+    Keeps the most recent blocks up to max_chars (the last block is always
+    kept whole) and remembers how much was dropped.
+    """
+
+    SEPARATOR = "\n\n"
+
+    def __init__(self, max_chars: int = MAX_CONTENT_CHARS) -> None:
+        self.max_chars = max_chars
+        self._blocks: deque[str] = deque()
+        self._chars = 0
+        self.dropped_chars = 0
+        self.total_chars = 0  # Length of the full joined text, dropped parts included
+
+    def append(self, text: str) -> None:
+        if self._blocks or self.dropped_chars:
+            self.total_chars += len(self.SEPARATOR)
+        self.total_chars += len(text)
+        self._blocks.append(text)
+        self._chars += len(text)
+        while self._chars > self.max_chars and len(self._blocks) > 1:
+            dropped = self._blocks.popleft()
+            self._chars -= len(dropped)
+            self.dropped_chars += len(dropped)
+
+    def text(self) -> str:
+        joined = self.SEPARATOR.join(self._blocks)
+        if self.dropped_chars:
+            return f"[... {self.dropped_chars:,} characters of earlier output omitted ...]{self.SEPARATOR}{joined}"
+        return joined
+
+
 @dataclass
 class AgentResult:
     """Structured result from an agent execution."""
@@ -47,13 +125,19 @@ class AgentResult:
     cost: float
     success: bool
     metadata: dict[str, Any] = field(default_factory=dict)
-    tool_uses: list[dict] = field(default_factory=list)
+    tool_uses: deque = field(default_factory=lambda: deque(maxlen=MAX_RECORDED_TOOL_USES))
+    tool_use_count: int = 0  # All tool uses, including ones rotated out of tool_uses
     # New fields for enhanced observability
     termination_reason: str = "unknown"  # "completed", "max_turns_reached", "error"
     turns_used: int = 0
     max_turns: int = 0
     error_details: Optional[dict[str, Any]] = None
 
+    def record_tool_uses(self, tool_uses: list[dict]) -> None:
+        """Add a turn's tool uses, keeping only the most recent MAX_RECORDED_TOOL_USES."""
+        self.tool_uses.extend(tool_uses)
+        self.tool_use_count += len(tool_uses)
+
 
 class Agent:
     """Base class for Claude Code agents with common execution pattern."""
@@ -76,7 +160,8 @@ class Agent:
         mcp_tools: Optional[list[str]] = None,
         mcp_servers: Optional[dict[str, Any]] = None,
         agents: Optional[dict[str, dict[str, Any]]] = None,
-        setting_sources: Optional[list[str]] = None
+        setting_sources: Optional[list[str]] = None,
+        use_client_pool: bool = False
     ):
         """Initialize an agent with configuration.
 
@@ -101,6 +186,10 @@ class Agent:
                    Format: {'agent-name': {'description': str, 'prompt': str, 'tools': list, 'model': str}}
             setting_sources: Sources to load settings from (e.g., ['user', 'project'])
                            Required for Skills to work - loads from ~/.claude/skills/ and .claude/skills/
+            use_client_pool: If True, run() reuses a warm ClaudeSDKClient from ClientPool
+                           instead of spawning a new CLI process per call. Meant for
+                           short, stateless helper agents (reprompter, summarizer, etc.)
+                           without MCP servers; agents with mcp_servers always spawn
         """
         self.name = name
         self.system_prompt = system_prompt
@@ -115,6 +204,7 @@ class Agent:
         self.model = model
         self.agents = agents
         self.setting_sources = setting_sources
+        self.use_client_pool = use_client_pool
 
         # Set up logger FIRST - needed for MCP configuration
         if logger is None:
@@ -193,41 +283,19 @@ class Agent:
             before passing it to the SDK. This prevents misleading "Claude Code not found"
             errors that actually occur when the cwd doesn't exist.
         """
+        if self.use_client_pool and not (mcp_servers or self.mcp_servers):
+            return await self._run_pooled(user_prompt, **kwargs)
+
         if self.verbose:
             self.logger.info(f"🤖 {self.name}: Starting...")
             
         # Build options with defaults and overrides
-        options_dict = {
-            "system_prompt": self.system_prompt,
-            "allowed_tools": self.allowed_tools,
-            "max_turns": self.max_turns,
-            "permission_mode": self.permission_mode,
-        }
-
-        # If restrict_to_allowed_tools is True, generate disallowed_tools list
-        if self.restrict_to_allowed_tools and self.allowed_tools:
-            options_dict["disallowed_tools"] = get_disallowed_tools(self.allowed_tools)
-
-        if self.max_thinking_tokens is not None:
-            options_dict["max_thinking_tokens"] = self.max_thinking_tokens
-
-        if self.cwd is not None:
-            # Ensure the working directory exists to avoid misleading "Claude Code not found" errors
-            cwd_path = Path(self.cwd)
-            if not cwd_path.exists():
-                self.logger.info(f"Creating working directory: {cwd_path}")
-                cwd_path.mkdir(parents=True, exist_ok=True)
-            options_dict["cwd"] = str(self.cwd)
-
-        if self.model is not None:
-            options_dict["model"] = self.model
+        options_dict = self._build_options_dict()
 
         # Note: Subagents can be configured programmatically via 'agents' parameter (SDK v0.1.4+)
         # or via filesystem (.claude/agents/) for backward compatibility
-        if self.agents is not None:
-            options_dict["agents"] = self.agents
-            if self.verbose:
-                self.logger.info(f"🤖 Subagents configured programmatically: {list(self.agents.keys())}")
+        if self.verbose and self.agents is not None:
+            self.logger.info(f"🤖 Subagents configured programmatically: {list(self.agents.keys())}")
 
         # Add setting_sources if specified (required for Skills to work)
         if self.setting_sources is not None:
@@ -251,6 +319,7 @@ class Agent:
         options_dict.update(kwargs)
 
         options = ClaudeAgentOptions(**options_dict)
+        self._record_prompt_prefixes()
         
         # Initialize result with enhanced fields
         result = AgentResult(
@@ -264,7 +333,7 @@ class Agent:
             error_details=None
         )
         
-        all_content = []
+        all_content = ContentBuffer()
         current_turn = 0
 
         # Log user prompt to conversation logger
@@ -320,7 +389,7 @@ class Agent:
                     # Extract and log tool uses
                     tool_uses = _extract_tool_uses(message)
                     if tool_uses:
-                        result.tool_uses.extend(tool_uses)
+                        result.record_tool_uses(tool_uses)
                         # Log tool usage at appropriate level
                         for tool in tool_uses:
                             tool_msg = f"🔧 [{self.name}] Turn {current_turn}/{self.max_turns} - Using tool: {tool['name']}"
@@ -334,7 +403,9 @@ class Agent:
                     result.cost = message.total_cost_usd or 0.0
 
                     # Register cost with global tracker
-                    await CostTracker.get_instance().add_cost(result.cost, self.name)
+                    await CostTracker.get_instance().add_cost(
+                        result.cost, self.name, model=self.model, usage=message.usage
+                    )
 
                     # Determine termination reason
                     if current_turn >= self.max_turns:
@@ -364,14 +435,14 @@ class Agent:
                 "error_type": type(e).__name__,
                 "error_message": str(e),
                 "turn_when_failed": current_turn,
-                "tools_attempted": len(result.tool_uses),
-                "partial_content_length": len("\n\n".join(all_content))
+                "tools_attempted": result.tool_use_count,
+                "partial_content_length": all_content.total_chars
             }
 
             # Log error to conversation logger
             if self.conversation_logger:
                 self.conversation_logger.log_error(
-                    e, current_turn, "\n\n".join(all_content)
+                    e, current_turn, all_content.text()
                 )
 
             if self.verbose:
@@ -383,9 +454,149 @@ class Agent:
                 self.conversation_logger.finalize()
 
         # Combine all content
-        result.content = "\n\n".join(all_content)
+        result.content = all_content.text()
         return result
 
+    async def _run_pooled(self, user_prompt: str, **kwargs) -> AgentResult:
+        """Execute a one-shot call on a warm client from ClientPool.
+
+        Same result semantics as run(), but the CLI subprocess outlives the
+        call: it is reset with /clear and returned to the pool afterwards.
+        """
+        if self.verbose:
+            self.logger.info(f"🤖 {self.name}: Starting (pooled client)...")
+
+        options_dict = self._pooled_options_dict()
+        options_dict.update(kwargs)
+        self._record_prompt_prefixes()
+
+        result = AgentResult(
+            content="",
+            cost=0.0,
+            success=False,
+            metadata={"agent_name": self.name, "pooled_client": True},
+            termination_reason="unknown",
+            turns_used=0,
+            max_turns=self.max_turns,
+            error_details=None
+        )
+
+        all_content = ContentBuffer()
+        current_turn = 0
+
+        if self.conversation_logger:
+            self.conversation_logger.log_user_prompt(user_prompt, metadata={"pooled_client": True})
+
+        try:
+            # Same retry handling as run(); each attempt gets its own client
+            async for message in retry_async_generator(
+                self._pooled_query,
+                prompt=user_prompt,
+                options_dict=options_dict,
+                logger=self.logger
+            ):
+                if isinstance(message, AssistantMessage):
+                    current_turn += 1
+                    result.turns_used = current_turn
+
+                    if self.conversation_logger:
+                        self.conversation_logger.log_assistant_message(
+                            message, current_turn, self.max_turns
+                        )
+
+                    text = _extract_text(message)
+                    if text:
+                        all_content.append(text)
+                        if self.verbose:
+                            self._log_content(text)
+
+                    tool_uses = _extract_tool_uses(message)
+                    if tool_uses:
+                        result.record_tool_uses(tool_uses)
+
+                elif isinstance(message, ResultMessage):
+                    result.cost = message.total_cost_usd or 0.0
+
+                    # Register cost with global tracker
+                    await CostTracker.get_instance().add_cost(
+                        result.cost, self.name, model=self.model, usage=message.usage
+                    )
+
+                    if current_turn >= self.max_turns:
+                        result.termination_reason = "max_turns_reached"
+                        result.success = False
+                    else:
+                        result.termination_reason = "completed"
+                        result.success = True
+
+                    if self.conversation_logger:
+                        self.conversation_logger.log_result(
+                            message, result.success, result.termination_reason
+                        )
+
+                    if self.verbose:
+                        self.logger.info(
+                            f"✅ {self.name} complete (pooled). "
+                            f"Turns: {current_turn}/{self.max_turns}, Cost: ${result.cost:.4f}"
+                        )
+
+        except Exception as e:
+            result.success = False
+            result.termination_reason = "error"
+            result.metadata["error"] = str(e)
+            result.error_details = {
+                "error_type": type(e).__name__,
+                "error_message": str(e),
+                "turn_when_failed": current_turn,
+                "tools_attempted": result.tool_use_count,
+                "partial_content_length": all_content.total_chars
+            }
+
+            if self.conversation_logger:
+                self.conversation_logger.log_error(
+                    e, current_turn, all_content.text()
+                )
+
+            if self.verbose:
+                self.logger.error(f"❌ {self.name} (pooled) failed at turn {current_turn}/{self.max_turns}: {e}")
+            raise
+        finally:
+            if self.conversation_logger:
+                self.conversation_logger.finalize()
+
+        result.content = all_content.text()
+        return result
+
+    async def _pooled_query(self, prompt: str, options_dict: dict):
+        """Stream one response from a pooled client, returning it to the pool afterwards.
+
+        Query-shaped (an async generator of messages) so retry_async_generator
+        can wrap it like query() in run(). A client that errors or is
+        abandoned mid-response is discarded rather than reused.
+        """
+        pool = ClientPool.get_instance()
+        client = await pool.acquire(self.name, options_dict)
+        try:
+            await client.query(prompt)
+            async for message in client.receive_response():
+                yield message
+        except BaseException:
+            await pool.discard(self.name, client)
+            raise
+        await pool.release(self.name, options_dict, client)
+
+    def _pooled_options_dict(self) -> dict:
+        """Options for pooled clients: run()'s options, setting_sources included (part of the pool fingerprint)."""
+        options_dict = self._build_options_dict()
+        if self.setting_sources is not None:
+            options_dict["setting_sources"] = self.setting_sources
+        return options_dict
+
+    async def prewarm_client(self) -> None:
+        """Spawn a pooled client ahead of the first run() (no-op unless use_client_pool)."""
+        if self.use_client_pool and not self.mcp_servers:
+            await ClientPool.get_instance().prewarm(self.name, self._pooled_options_dict())
+
     async def run_with_session(self, user_prompt: str, session_id: Optional[str] = None, **kwargs) -> AgentResult:
         """Execute the agent with session support for context preservation.
 
@@ -442,7 +653,7 @@ class Agent:
             error_details=None
         )
 
-        all_content = []
+        all_content = ContentBuffer()
         current_turn = 0
 
         # Log user prompt to conversation logger
@@ -521,7 +732,7 @@ class Agent:
                     # Extract tool uses
                     tool_uses = _extract_tool_uses(message)
                     if tool_uses:
-                        result.tool_uses.extend(tool_uses)
+                        result.record_tool_uses(tool_uses)
 
                 elif isinstance(message, ResultMessage):
                     # Capture final cost and status
@@ -530,7 +741,9 @@ class Agent:
                     result.termination_reason = "completed"
 
                     # Register cost with global tracker
-                    await CostTracker.get_instance().add_cost(result.cost, self.name)
+                    await CostTracker.get_instance().add_cost(
+                        result.cost, self.name, model=self.model, usage=message.usage
+                    )
 
                     # Log result to conversation logger
                     if self.conversation_logger:
@@ -556,7 +769,7 @@ class Agent:
             # Log error to conversation logger
             if self.conversation_logger:
                 self.conversation_logger.log_error(
-                    e, current_turn, "\n\n".join(all_content)
+                    e, current_turn, all_content.text()
                 )
 
             if self.verbose:
@@ -576,7 +789,7 @@ class Agent:
                 self.conversation_logger.finalize()
 
         # Combine all content
-        result.content = "\n\n".join(all_content)
+        result.content = all_content.text()
         result.metadata["session_id"] = self.session_id
         return result
 
@@ -600,6 +813,7 @@ class Agent:
             self.logger.info("📂 Starting new session...")
 
         options = ClaudeAgentOptions(**options_dict)
+        self._record_prompt_prefixes()
 
         # Create and connect client
         self.client = ClaudeSDKClient(options=options)
@@ -655,6 +869,12 @@ class Agent:
 
         return options_dict
 
+    def _record_prompt_prefixes(self) -> None:
+        """Record system prompt / subagent hashes so prefix drift (cache misses) is visible."""
+        registry = PromptPrefixRegistry.get_instance()
+        registry.record(self.name, "system_prompt", stable_hash(self.system_prompt or ""))
+        registry.record(self.name, "subagents", hash_agent_definitions(self.agents))
+
     def _log_content(self, text: str):
         """Helper to log content with truncation if needed."""
         msg_prefix = f"{self.name}: "
@@ -679,30 +899,10 @@ class Agent:
     def _is_client_alive(self) -> bool:
         """Check if the underlying client subprocess is still running.
 
-        The ClaudeSDKClient uses a subprocess transport. This method checks
-        if that subprocess is still alive to avoid "Cannot write to terminated
-        process" errors.
-
         Returns:
             True if client exists and process is alive, False otherwise
         """
-        if not self.client:
-            return False
-
-        # Access the transport layer to check process status
-        try:
-            # ClaudeSDKClient uses _transport which has a process attribute
-            transport = getattr(self.client, '_transport', None)
-            if transport:
-                process = getattr(transport, 'process', None)
-                if process:
-                    # poll() returns None if running, exit code if terminated
-                    return process.poll() is None
-        except Exception:
-            pass
-
-        # If we can't determine, assume alive (let the actual call fail with clear error)
-        return True
+        return is_client_alive(self.client)
 
     def get_session_id(self) -> Optional[str]:
         """Get the current session ID if a session is active."""
@@ -776,6 +976,7 @@ class Agent:
             self.logger.info(f"📂 Resuming session: {session_id[:8]}...")
         options_dict.update(kwargs)
         options = ClaudeAgentOptions(**options_dict)
+        self._record_prompt_prefixes()
 
         # Build result
         result = AgentResult(
@@ -792,7 +993,7 @@ class Agent:
             error_details=None
         )
 
-        all_content = []
+        all_content = ContentBuffer()
         current_turn = 0
 
         # Create async generator for streaming input
@@ -865,7 +1066,7 @@ class Agent:
                         # Extract tool uses
                         tool_uses = _extract_tool_uses(message)
                         if tool_uses:
-                            result.tool_uses.extend(tool_uses)
+                            result.record_tool_uses(tool_uses)
 
                     elif isinstance(message, ResultMessage):
                         # Capture final cost and status
@@ -874,7 +1075,9 @@ class Agent:
                         result.termination_reason = "completed"
 
                         # Register cost with global tracker
-                        await CostTracker.get_instance().add_cost(result.cost, self.name)
+                        await CostTracker.get_instance().add_cost(
+                            result.cost, self.name, model=self.model, usage=message.usage
+                        )
 
                         # Log result
                         if self.conversation_logger:
@@ -901,7 +1104,7 @@ class Agent:
 
             if self.conversation_logger:
                 self.conversation_logger.log_error(
-                    e, current_turn, "\n\n".join(all_content)
+                    e, current_turn, all_content.text()
                 )
 
             if self.verbose:
@@ -912,7 +1115,7 @@ class Agent:
             if self.conversation_logger:
                 self.conversation_logger.finalize()
 
-        result.content = "\n\n".join(all_content)
+        result.content = all_content.text()
         return result
 
     def with_options(self, **kwargs) -> "Agent":
@@ -934,6 +1137,7 @@ class Agent:
             "file_preview_length": self.file_preview_length,
             "logger": self.logger,
             "model": self.model,
+            "use_client_pool": self.use_client_pool,
         }
         # Apply overrides
         new_kwargs.update(kwargs)
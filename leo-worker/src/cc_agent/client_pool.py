@@ -0,0 +1,264 @@
+"""
+Client Pool - Warm ClaudeSDKClient connections for short helper agents.
+
+Helper roles (reprompter, changelog summarizer, prompt expander) make one
+short LLM call per iteration. Going through query() spawns a fresh CLI
+subprocess (plus MCP servers) every time, which costs seconds before the
+first token. The pool keeps connected clients per role between calls and
+clears their conversation with /clear instead of respawning. The /clear
+round-trip runs in a background task after release(), so it never sits on
+the caller's critical path.
+
+Clients are connected, used and reset from different tasks. That relies on
+claude-agent-sdk running its message reader as a detached loop task (see
+the version pin in requirements.txt); older SDKs bound the reader to the
+task group of the task that called connect().
+
+Same lifecycle as CostTracker: one pool per container, closed at
+generation end.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import structlog
+from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
+logger = structlog.get_logger(__name__)
+
+# Slash command that resets a client's conversation without respawning the CLI
+RESET_COMMAND = "/clear"
+
+# Upper bound for a reset round-trip before the client is considered unusable
+RESET_TIMEOUT_SECONDS = 15.0
+
+# Idle clients kept per role (helpers are called sequentially, 1 is enough)
+DEFAULT_MAX_IDLE_PER_KEY = 1
+
+# Recent spawn latencies kept for stats
+SPAWN_SAMPLES = 50
+
+
+def options_fingerprint(options_dict: dict[str, Any]) -> str:
+    """
+    Hash ClaudeAgentOptions kwargs so only identically-configured agents share clients.
+
+    Args:
+        options_dict: The kwargs that would be passed to ClaudeAgentOptions
+    """
+    encoded = json.dumps(options_dict, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class PoolStats:
+    """Hit/miss counters and spawn latency for one pool key (role)."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    spawn_latencies: deque = field(default_factory=lambda: deque(maxlen=SPAWN_SAMPLES))
+
+    @property
+    def avg_spawn_seconds(self) -> float:
+        if not self.spawn_latencies:
+            return 0.0
+        return sum(self.spawn_latencies) / len(self.spawn_latencies)
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "avg_spawn_seconds": round(self.avg_spawn_seconds, 3),
+            "last_spawn_seconds": round(self.spawn_latencies[-1], 3) if self.spawn_latencies else None,
+        }
+
+
+class ClientPool:
+    """
+    Singleton pool of connected ClaudeSDKClient instances keyed by role.
+
+    Usage:
+        pool = ClientPool.get_instance()
+        client = await pool.acquire(role, options_dict)
+        try:
+            await client.query(prompt)
+            async for message in client.receive_response():
+                ...
+            await pool.release(role, options_dict, client)
+        except Exception:
+            await pool.discard(role, client)
+            raise
+
+        # At generation end
+        await ClientPool.get_instance().close_all()
+    """
+
+    _instance: Optional['ClientPool'] = None
+
+    def __init__(self, max_idle_per_key: int = DEFAULT_MAX_IDLE_PER_KEY) -> None:
+        self.max_idle_per_key = max_idle_per_key
+        # (role, options fingerprint) -> idle connected clients
+        self._idle: dict[tuple[str, str], list[ClaudeSDKClient]] = {}
+        self._stats: dict[str, PoolStats] = {}
+        self._lock = asyncio.Lock()
+        # Background /clear resets of released clients
+        self._resets: set[asyncio.Task] = set()
+
+    @classmethod
+    def get_instance(cls) -> 'ClientPool':
+        """Get the singleton instance, creating if needed."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _stats_for(self, role: str) -> PoolStats:
+        return self._stats.setdefault(role, PoolStats())
+
+    async def acquire(self, role: str, options_dict: dict[str, Any]) -> ClaudeSDKClient:
+        """
+        Get a connected client for the role, reusing a warm one when possible.
+
+        Args:
+            role: Helper role / agent name (used for stats)
+            options_dict: ClaudeAgentOptions kwargs for a fresh client
+        """
+        # Imported lazily: base.py imports this module
+        from .base import is_client_alive
+
+        key = (role, options_fingerprint(options_dict))
+        stats = self._stats_for(role)
+
+        async with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                client = idle.pop()
+                if is_client_alive(client):
+                    stats.hits += 1
+                    logger.debug("client_pool.hit", role=role, idle=len(idle))
+                    return client
+                stats.evictions += 1
+                logger.info("client_pool.evict_dead", role=role)
+                await self._disconnect(client)
+            stats.misses += 1
+
+        # Spawn outside the lock so concurrent helpers don't serialize on startup
+        started = time.monotonic()
+        client = ClaudeSDKClient(options=ClaudeAgentOptions(**options_dict))
+        await client.connect()
+        elapsed = time.monotonic() - started
+        stats.spawn_latencies.append(elapsed)
+        logger.info("client_pool.spawn", role=role, seconds=f"{elapsed:.2f}")
+        return client
+
+    async def release(self, role: str, options_dict: dict[str, Any], client: ClaudeSDKClient) -> None:
+        """
+        Return a client to the pool once its conversation has been reset.
+
+        The reset runs in a background task so the caller's result isn't held
+        up by the /clear round-trip. Clients that fail to reset, are dead, or
+        exceed the idle limit are disconnected instead.
+        """
+        key = (role, options_fingerprint(options_dict))
+        task = asyncio.create_task(self._reset_and_return(role, key, client))
+        self._resets.add(task)
+        task.add_done_callback(self._resets.discard)
+
+    async def _reset_and_return(self, role: str, key: tuple[str, str], client: ClaudeSDKClient) -> None:
+        from .base import is_client_alive
+
+        try:
+            reset = is_client_alive(client) and await self._reset(client)
+        except asyncio.CancelledError:
+            await self._disconnect(client)
+            raise
+        if not reset:
+            self._stats_for(role).evictions += 1
+            await self._disconnect(client)
+            return
+
+        async with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_key:
+                idle.append(client)
+                return
+        await self._disconnect(client)
+
+    async def discard(self, role: str, client: ClaudeSDKClient) -> None:
+        """Drop a client that errored mid-call."""
+        self._stats_for(role).evictions += 1
+        await self._disconnect(client)
+
+    async def prewarm(self, role: str, options_dict: dict[str, Any]) -> None:
+        """Spawn a client ahead of time so the role's next call is a hit."""
+        key = (role, options_fingerprint(options_dict))
+        async with self._lock:
+            if self._idle.get(key):
+                return
+        try:
+            started = time.monotonic()
+            client = ClaudeSDKClient(options=ClaudeAgentOptions(**options_dict))
+            await client.connect()
+            self._stats_for(role).spawn_latencies.append(time.monotonic() - started)
+        except Exception as e:
+            logger.warning("client_pool.prewarm_failed", role=role, error=str(e))
+            return
+        async with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_key:
+                idle.append(client)
+                logger.info("client_pool.prewarmed", role=role)
+                return
+        await self._disconnect(client)
+
+    async def _reset(self, client: ClaudeSDKClient) -> bool:
+        """Clear conversation context on a warm client. Returns False if unusable."""
+        async def _drain() -> None:
+            await client.query(RESET_COMMAND)
+            async for _ in client.receive_response():
+                pass
+
+        try:
+            await asyncio.wait_for(_drain(), timeout=RESET_TIMEOUT_SECONDS)
+            return True
+        except Exception as e:
+            logger.info("client_pool.reset_failed", error=str(e) or type(e).__name__)
+            return False
+
+    async def _disconnect(self, client: ClaudeSDKClient) -> None:
+        try:
+            await client.disconnect()
+        except Exception:
+            pass  # Ignore disconnect errors
+
+    async def close_all(self) -> None:
+        """Disconnect every idle client and cancel pending resets (generation end / shutdown)."""
+        resets = list(self._resets)
+        for task in resets:
+            task.cancel()
+        if resets:
+            await asyncio.gather(*resets, return_exceptions=True)
+
+        async with self._lock:
+            clients = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for client in clients:
+            await self._disconnect(client)
+        if clients:
+            logger.info("client_pool.closed", clients=len(clients))
+
+    def idle_count(self, role: Optional[str] = None) -> int:
+        return sum(len(v) for (r, _), v in self._idle.items() if role is None or r == role)
+
+    def get_stats(self) -> dict[str, dict]:
+        """Per-role stats for logging/metrics."""
+        return {
+            role: {**stats.to_dict(), "idle": self.idle_count(role)}
+            for role, stats in self._stats.items()
+        }
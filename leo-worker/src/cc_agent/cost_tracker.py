@@ -4,18 +4,140 @@ Cost Tracker - Singleton for aggregating generation costs.
 Tracks total cost across all agent calls in a single generation.
 Reset at generation start, read total at generation end.
 
+Besides the running total, every call is recorded in a ledger keyed by
+(agent name, model, iteration) with token counts taken from the SDK's
+ResultMessage usage, so spend can be attributed to the main agent,
+reprompter, summarizer, etc.
+
 Design rationale: See DECISIONS.md (2025-12-24: CostTracker Design Pattern)
 - Singleton chosen because: 1 container = 1 generation (architectural constraint)
 - Upgrade path to contextvars if concurrent generations ever needed
 """
 
 import asyncio
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, asdict
+from typing import Any, Optional
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Model label used when an agent doesn't pin a model (SDK default)
+DEFAULT_MODEL_LABEL = "default"
+
+# Agent label used when add_cost() is called without an agent name
+UNKNOWN_AGENT_LABEL = "unknown"
+
+# Ledger key: (agent_name, model, iteration)
+LedgerKey = tuple[str, str, int]
+
+
+@dataclass
+class UsageTotals:
+    """Cost and token counts for one ledger bucket."""
+
+    cost_usd: float = 0.0
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @classmethod
+    def from_usage(cls, cost: float, usage: Optional[dict[str, Any]] = None) -> 'UsageTotals':
+        """
+        Build totals for a single call from ResultMessage.usage.
+
+        Args:
+            cost: Cost in USD (ResultMessage.total_cost_usd)
+            usage: Raw usage dict from the SDK (may be None or partial)
+        """
+        usage = usage or {}
+        return cls(
+            cost_usd=cost,
+            calls=1,
+            input_tokens=int(usage.get("input_tokens") or 0),
+            output_tokens=int(usage.get("output_tokens") or 0),
+            cache_read_tokens=int(usage.get("cache_read_input_tokens") or 0),
+            cache_write_tokens=int(usage.get("cache_creation_input_tokens") or 0),
+        )
+
+    def add(self, other: 'UsageTotals') -> None:
+        """Accumulate another bucket into this one (in place)."""
+        self.cost_usd += other.cost_usd
+        self.calls += other.calls
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_write_tokens += other.cache_write_tokens
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Fraction of prompt tokens served from the prompt cache (0.0 - 1.0)."""
+        prompt_tokens = self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+        if prompt_tokens == 0:
+            return 0.0
+        return self.cache_read_tokens / prompt_tokens
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "cache_hit_ratio": round(self.cache_hit_ratio, 4)}
+
+
+@dataclass(frozen=True)
+class CostSnapshot:
+    """
+    Immutable copy of the ledger at a point in time.
+
+    Take one with CostTracker.snapshot(); for_iteration() narrows it to what
+    was recorded while one iteration was current.
+    """
+
+    entries: dict[LedgerKey, UsageTotals]
+
+    @property
+    def total(self) -> UsageTotals:
+        totals = UsageTotals()
+        for bucket in self.entries.values():
+            totals.add(bucket)
+        return totals
+
+    @property
+    def total_cost(self) -> float:
+        return self.total.cost_usd
+
+    def by_agent(self) -> dict[str, UsageTotals]:
+        """Collapse model/iteration dimensions, keyed by agent name."""
+        return self._group(lambda key: key[0])
+
+    def by_model(self) -> dict[str, UsageTotals]:
+        """Collapse agent/iteration dimensions, keyed by model."""
+        return self._group(lambda key: key[1])
+
+    def by_iteration(self) -> dict[int, UsageTotals]:
+        """Collapse agent/model dimensions, keyed by iteration number."""
+        return self._group(lambda key: key[2])
+
+    def by_agent_model(self) -> dict[tuple[str, str], UsageTotals]:
+        """Collapse the iteration dimension, keyed by (agent, model)."""
+        return self._group(lambda key: (key[0], key[1]))
+
+    def for_iteration(self, iteration: int) -> 'CostSnapshot':
+        """Restrict the snapshot to entries recorded during one iteration."""
+        return CostSnapshot({k: v for k, v in self.entries.items() if k[2] == iteration})
+
+    def _group(self, key_fn) -> dict:
+        grouped: dict = {}
+        for key, bucket in self.entries.items():
+            grouped.setdefault(key_fn(key), UsageTotals()).add(bucket)
+        return grouped
+
+    def to_dict(self) -> dict:
+        """Serializable breakdown for logging/WSI."""
+        return {
+            "total": self.total.to_dict(),
+            "by_agent": {name: t.to_dict() for name, t in self.by_agent().items()},
+            "by_model": {model: t.to_dict() for model, t in self.by_model().items()},
+        }
+
 
 @dataclass
 class CostTracker:
@@ -26,8 +148,14 @@ class CostTracker:
         # At generation start (WSI client)
         CostTracker.reset()
 
+        # Before each iteration (WSI client)
+        CostTracker.get_instance().set_iteration(n)
+
         # After each agent run (base.py)
-        CostTracker.get_instance().add_cost(result.cost)
+        CostTracker.get_instance().add_cost(result.cost, agent_name, model=..., usage=...)
+
+        # Per-iteration breakdown (WSI client)
+        spent = CostTracker.get_instance().get_iteration_breakdown(n)
 
         # At generation end (WSI client)
         total = CostTracker.get_instance().get_total()
@@ -37,6 +165,8 @@ class CostTracker:
 
     total_cost: float = 0.0
     call_count: int = 0
+    current_iteration: int = 0
+    ledger: dict[LedgerKey, UsageTotals] = field(default_factory=dict)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
     @classmethod
@@ -54,36 +184,66 @@ class CostTracker:
         logger.info("cost_tracker.reset")
         return cls._instance
 
-    async def add_cost(self, cost: float, agent_name: Optional[str] = None) -> None:
+    def set_iteration(self, iteration: int) -> None:
+        """Attribute subsequent calls to the given iteration number."""
+        self.current_iteration = iteration
+
+    async def add_cost(
+        self,
+        cost: float,
+        agent_name: Optional[str] = None,
+        model: Optional[str] = None,
+        usage: Optional[dict[str, Any]] = None,
+    ) -> None:
         """
         Add cost from an agent run (async-safe).
 
         Args:
             cost: Cost in USD from AgentResult.cost
-            agent_name: Optional agent name for logging
+            agent_name: Agent name the cost is attributed to
+            model: Model the agent ran with (None = SDK default)
+            usage: ResultMessage.usage dict with token counts
         """
         async with self._lock:
-            self.total_cost += cost
-            self.call_count += 1
-            logger.debug(
-                "cost_tracker.add",
-                agent=agent_name,
-                cost=f"${cost:.4f}",
-                total=f"${self.total_cost:.4f}",
-                calls=self.call_count
-            )
-
-    def add_cost_sync(self, cost: float, agent_name: Optional[str] = None) -> None:
+            self._record(cost, agent_name, model, usage, "cost_tracker.add")
+
+    def add_cost_sync(
+        self,
+        cost: float,
+        agent_name: Optional[str] = None,
+        model: Optional[str] = None,
+        usage: Optional[dict[str, Any]] = None,
+    ) -> None:
         """
         Add cost synchronously (for non-async contexts).
         Note: Not lock-protected. Use add_cost() in async code.
         """
+        self._record(cost, agent_name, model, usage, "cost_tracker.add_sync")
+
+    def _record(
+        self,
+        cost: float,
+        agent_name: Optional[str],
+        model: Optional[str],
+        usage: Optional[dict[str, Any]],
+        event: str,
+    ) -> None:
+        call = UsageTotals.from_usage(cost, usage)
+        key = (agent_name or UNKNOWN_AGENT_LABEL, model or DEFAULT_MODEL_LABEL, self.current_iteration)
+        self.ledger.setdefault(key, UsageTotals()).add(call)
+
         self.total_cost += cost
         self.call_count += 1
         logger.debug(
-            "cost_tracker.add_sync",
-            agent=agent_name,
+            event,
+            agent=key[0],
+            model=key[1],
+            iteration=key[2],
             cost=f"${cost:.4f}",
+            input_tokens=call.input_tokens,
+            output_tokens=call.output_tokens,
+            cache_read_tokens=call.cache_read_tokens,
+            cache_write_tokens=call.cache_write_tokens,
             total=f"${self.total_cost:.4f}",
             calls=self.call_count
         )
@@ -92,11 +252,21 @@ class CostTracker:
         """Get the total accumulated cost in USD."""
         return self.total_cost
 
+    def snapshot(self) -> CostSnapshot:
+        """Return an immutable copy of the ledger."""
+        return CostSnapshot({key: UsageTotals(**asdict(bucket)) for key, bucket in self.ledger.items()})
+
+    def get_iteration_breakdown(self, iteration: int) -> CostSnapshot:
+        """Get everything recorded while the given iteration was current."""
+        return self.snapshot().for_iteration(iteration)
+
     def get_summary(self) -> dict:
         """Get a summary dict for logging/WSI."""
+        snapshot = self.snapshot()
         return {
             "total_cost_usd": self.total_cost,
             "agent_calls": self.call_count,
+            **snapshot.to_dict(),
         }
 
     def __repr__(self) -> str:
@@ -0,0 +1,165 @@
+"""
+Prompt Layout - Cache-friendly prompt assembly.
+
+Prompt caching only hits when the request prefix is byte-identical to a
+previous request. Prompts are therefore assembled from named segments:
+stable segments (pipeline prompt, subagent definitions, static guidance)
+always come first and form the cacheable prefix, volatile segments
+(timestamps, app paths, session IDs, user instructions) always come last.
+
+PromptPrefixRegistry records a hash of each agent's prefix per run so
+unexpected drift (= guaranteed cache miss) shows up in the logs.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, asdict, is_dataclass
+from typing import Any, Optional
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Separator between rendered segments
+SEGMENT_SEPARATOR = "\n\n"
+
+
+def stable_hash(text: str) -> str:
+    """Short, deterministic hash of a prompt prefix."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def hash_agent_definitions(agents: Optional[dict[str, Any]]) -> Optional[str]:
+    """
+    Hash subagent definitions independently of object identity.
+
+    Accepts AgentDefinition dataclasses or plain dicts (both are valid
+    inputs to ClaudeAgentOptions.agents).
+    """
+    if not agents:
+        return None
+    normalized = {
+        name: asdict(definition) if is_dataclass(definition) else definition
+        for name, definition in agents.items()
+    }
+    return stable_hash(json.dumps(normalized, sort_keys=True, default=str))
+
+
+@dataclass(frozen=True)
+class PromptSegment:
+    """A named piece of a prompt."""
+
+    name: str
+    text: str
+    stable: bool = True
+
+
+class PromptLayout:
+    """
+    Ordered collection of prompt segments.
+
+    Usage:
+        layout = (
+            PromptLayout()
+            .add_stable("pipeline", pipeline_prompt)
+            .add_volatile("app_location", f"Working in: `{app_path}`")
+        )
+        system_prompt = layout.render()
+        logger.info(f"prefix hash: {layout.prefix_hash}")
+    """
+
+    def __init__(self, segments: Optional[list[PromptSegment]] = None):
+        self.segments: list[PromptSegment] = list(segments or [])
+
+    def add_stable(self, name: str, text: str) -> 'PromptLayout':
+        """Add a segment that must be byte-identical across iterations."""
+        self.segments.append(PromptSegment(name=name, text=text, stable=True))
+        return self
+
+    def add_volatile(self, name: str, text: str) -> 'PromptLayout':
+        """Add a segment that may change per call (kept out of the prefix)."""
+        self.segments.append(PromptSegment(name=name, text=text, stable=False))
+        return self
+
+    @property
+    def prefix(self) -> str:
+        """Cacheable prefix: all stable segments, in insertion order."""
+        return SEGMENT_SEPARATOR.join(s.text for s in self.segments if s.stable and s.text)
+
+    @property
+    def suffix(self) -> str:
+        """Volatile tail: all volatile segments, in insertion order."""
+        return SEGMENT_SEPARATOR.join(s.text for s in self.segments if not s.stable and s.text)
+
+    @property
+    def prefix_hash(self) -> str:
+        return stable_hash(self.prefix)
+
+    def render(self) -> str:
+        """Render stable segments first, then volatile ones."""
+        return SEGMENT_SEPARATOR.join(part for part in (self.prefix, self.suffix) if part)
+
+    def __len__(self) -> int:
+        return len(self.render())
+
+
+class PromptPrefixRegistry:
+    """
+    Singleton record of prompt prefix hashes per agent for the current run.
+
+    Same lifecycle as CostTracker: reset at generation start, one
+    generation per container.
+    """
+
+    _instance: Optional['PromptPrefixRegistry'] = None
+
+    def __init__(self) -> None:
+        # (agent_name, part) -> list of distinct hashes seen, in order
+        self.hashes: dict[tuple[str, str], list[str]] = {}
+        self.observations: int = 0
+
+    @classmethod
+    def get_instance(cls) -> 'PromptPrefixRegistry':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> 'PromptPrefixRegistry':
+        cls._instance = cls()
+        return cls._instance
+
+    def record(self, agent_name: str, part: str, prefix_hash: Optional[str]) -> bool:
+        """
+        Record the prefix hash used for one request.
+
+        Returns:
+            True if the hash differs from the previous one for this agent/part
+            (the prompt cache cannot hit for that request).
+        """
+        if prefix_hash is None:
+            return False
+        self.observations += 1
+        seen = self.hashes.setdefault((agent_name, part), [])
+        if seen and seen[-1] == prefix_hash:
+            return False
+        drifted = bool(seen)
+        seen.append(prefix_hash)
+        if drifted:
+            logger.warning(
+                "prompt_prefix.drift",
+                agent=agent_name,
+                part=part,
+                previous=seen[-2],
+                current=prefix_hash,
+                versions=len(seen),
+            )
+        else:
+            logger.debug("prompt_prefix.recorded", agent=agent_name, part=part, hash=prefix_hash)
+        return drifted
+
+    def get_summary(self) -> dict:
+        """Per-agent prefix hashes for logging/WSI."""
+        return {
+            f"{agent}:{part}": {"current": seen[-1], "versions": len(seen)}
+            for (agent, part), seen in self.hashes.items()
+        }
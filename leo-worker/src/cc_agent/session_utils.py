@@ -4,12 +4,36 @@ Claude stores sessions locally at:
     ~/.claude/projects/<encoded-cwd>/<session-id>.jsonl
 
 This module provides utilities to discover and manage existing sessions.
+
+Session lookup runs on every resume, and session directories fill up with
+subagent (agent-*) transcripts. SessionCatalog keeps a small index per
+session directory (id, size, mtime, turn count, last message timestamp):
+the directory is only re-listed when its mtime changes and only main
+sessions are stat'ed. Listing and lookups use stat data alone; turn counts
+are computed on request, streaming only the bytes appended since the last
+scan.
 """
 
+import json
+import os
+import tempfile
+import threading
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+# Session catalogs (one JSON file per session directory)
+CATALOG_DIR = Path(os.getenv("LEO_SESSION_CATALOG_DIR", Path.home() / ".cache" / "leo" / "sessions"))
+
+# Bump when the catalog format changes
+CATALOG_VERSION = 1
+
+# Message types counted as conversation turns
+TURN_TYPES = ("user", "assistant")
+
+# Bytes read per step when scanning a session (backwards from EOF or counting turns)
+TAIL_BLOCK_BYTES = 64 * 1024
 
 
 @dataclass
@@ -19,6 +43,8 @@ class SessionInfo:
     path: Path
     size: int  # bytes
     modified: float  # timestamp
+    turns: Optional[int] = None  # user + assistant messages (None unless counted)
+    last_timestamp: Optional[str] = None  # timestamp of the last message (ISO 8601)
 
 
 def encode_cwd_for_session_path(cwd: str) -> str:
@@ -53,11 +79,205 @@ def get_session_directory(cwd: str) -> Path:
     return Path.home() / ".claude" / "projects" / encoded
 
 
+def _is_main_session_file(name: str) -> bool:
+    """Main session transcripts are <uuid>.jsonl; subagent (agent-*) files are skipped."""
+    if not name.endswith(".jsonl") or name.startswith("agent-"):
+        return False
+    try:
+        uuid.UUID(name[:-len(".jsonl")])
+    except ValueError:
+        return False
+    return True
+
+
+class SessionCatalog:
+    """
+    Persistent index of the main sessions in one session directory.
+
+    Entries: {session_id: {"size", "mtime", "turns", "last_timestamp",
+    "scanned"}} where "scanned" is the byte offset up to which turns were
+    counted. refresh() only stats files; turns are counted by
+    count_turns() / sessions(with_turns=True). Catalogs are shared per directory within a process; use
+    SessionCatalog.for_cwd().
+    """
+
+    _catalogs: Dict[str, "SessionCatalog"] = {}
+    _catalogs_lock = threading.Lock()
+
+    def __init__(self, session_dir: Path, catalog_path: Optional[Path] = None):
+        self.session_dir = session_dir
+        self.catalog_path = catalog_path or CATALOG_DIR / f"{session_dir.name or 'root'}.json"
+        self._lock = threading.Lock()
+        self._dir_mtime: Optional[int] = None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @classmethod
+    def for_cwd(cls, cwd: str) -> "SessionCatalog":
+        session_dir = get_session_directory(cwd)
+        key = str(session_dir)
+        with cls._catalogs_lock:
+            if key not in cls._catalogs:
+                cls._catalogs[key] = cls(session_dir)
+            return cls._catalogs[key]
+
+    def _load(self) -> None:
+        try:
+            with open(self.catalog_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CATALOG_VERSION and data.get("session_dir") == str(self.session_dir):
+            self._dir_mtime = data.get("dir_mtime")
+            self._entries = data.get("sessions", {})
+
+    def _save(self) -> None:
+        self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.catalog_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "version": CATALOG_VERSION,
+                "session_dir": str(self.session_dir),
+                "dir_mtime": self._dir_mtime,
+                "sessions": self._entries
+            }, f)
+        os.replace(tmp_path, self.catalog_path)
+
+    def _count_turns(self, path: Path, entry: Dict[str, Any], size: int) -> None:
+        """Count turns in the bytes appended since the last scan (from 0 if the file shrank)."""
+        start = entry.get("scanned", 0)
+        if size < start:
+            start, entry["turns"], entry["last_timestamp"] = 0, 0, None
+        scanned = start
+        remaining = size - start
+        carry = b""
+        with open(path, "rb") as f:
+            f.seek(start)
+            while remaining > 0:
+                block = f.read(min(TAIL_BLOCK_BYTES, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                lines = (carry + block).split(b"\n")
+                # The last piece is an incomplete line; a partial one at EOF is re-read next time
+                carry = lines.pop()
+                for raw in lines:
+                    scanned += len(raw) + 1
+                    try:
+                        message = json.loads(raw)
+                    except ValueError:
+                        continue
+                    if not isinstance(message, dict):
+                        continue
+                    if message.get("type") in TURN_TYPES:
+                        entry["turns"] = entry.get("turns", 0) + 1
+                    if message.get("timestamp"):
+                        entry["last_timestamp"] = message["timestamp"]
+        entry["scanned"] = scanned
+
+    def refresh(self) -> None:
+        """Bring the catalog's file list, sizes and mtimes up to date (stat only)."""
+        with self._lock:
+            try:
+                dir_mtime = self.session_dir.stat().st_mtime_ns
+            except OSError:
+                self._entries, self._dir_mtime = {}, None
+                return
+
+            changed = False
+            if dir_mtime != self._dir_mtime:
+                # Files were added, removed or renamed: re-list (names only)
+                names = {entry.name for entry in os.scandir(self.session_dir)}
+                session_ids = {name[:-len(".jsonl")] for name in names if _is_main_session_file(name)}
+                for session_id in set(self._entries) - session_ids:
+                    del self._entries[session_id]
+                for session_id in session_ids - set(self._entries):
+                    self._entries[session_id] = {"size": -1, "mtime": 0.0, "turns": 0, "last_timestamp": None, "scanned": 0}
+                self._dir_mtime = dir_mtime
+                changed = True
+
+            for session_id, entry in list(self._entries.items()):
+                path = self.session_dir / f"{session_id}.jsonl"
+                try:
+                    stat = path.stat()
+                except OSError:
+                    del self._entries[session_id]  # Deleted since the directory was listed
+                    changed = True
+                    continue
+                if stat.st_size == entry["size"] and stat.st_mtime == entry["mtime"]:
+                    continue
+                entry["size"], entry["mtime"] = stat.st_size, stat.st_mtime
+                changed = True
+
+            if changed:
+                self._save_quietly()
+
+    def _save_quietly(self) -> None:
+        try:
+            self._save()
+        except OSError:
+            pass  # Catalog is an optimization; lookups still work in memory
+
+    def _update_turns(self, session_id: str, entry: Dict[str, Any]) -> bool:
+        """Count turns up to the entry's current size. Caller holds self._lock."""
+        if entry.get("scanned", 0) == entry["size"]:
+            return False
+        try:
+            self._count_turns(self.session_dir / f"{session_id}.jsonl", entry, entry["size"])
+        except OSError:
+            return False
+        return True
+
+    def count_turns(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Turn count and last message timestamp of one session.
+
+        Returns:
+            {"turns", "last_timestamp"}, or None if the session doesn't exist
+        """
+        self.refresh()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            if self._update_turns(session_id, entry):
+                self._save_quietly()
+            return {"turns": entry.get("turns", 0), "last_timestamp": entry.get("last_timestamp")}
+
+    def sessions(self, with_turns: bool = False) -> List[SessionInfo]:
+        """
+        Main sessions, newest first.
+
+        Args:
+            with_turns: Also fill in turns/last_timestamp (reads the bytes
+                appended to each transcript since its last count)
+        """
+        self.refresh()
+        with self._lock:
+            if with_turns and any([self._update_turns(sid, entry) for sid, entry in self._entries.items()]):
+                self._save_quietly()
+            sessions = [
+                SessionInfo(
+                    session_id=session_id,
+                    path=self.session_dir / f"{session_id}.jsonl",
+                    size=entry["size"],
+                    modified=entry["mtime"],
+                    turns=entry.get("turns", 0) if with_turns else None,
+                    last_timestamp=entry.get("last_timestamp") if with_turns else None
+                )
+                for session_id, entry in self._entries.items()
+            ]
+        sessions.sort(key=lambda s: s.modified, reverse=True)
+        return sessions
+
+
 def find_sessions_for_cwd(cwd: str) -> List[SessionInfo]:
     """Find all main sessions for a given working directory.
 
     Filters out subagent sessions (agent-* format) and invalid UUIDs.
     Returns list of SessionInfo sorted by modified time (newest first).
+    Served from the directory's SessionCatalog using stat data only
+    (turns are not counted; use SessionCatalog.sessions(with_turns=True)).
 
     Args:
         cwd: The working directory path
@@ -65,40 +285,60 @@ def find_sessions_for_cwd(cwd: str) -> List[SessionInfo]:
     Returns:
         List of SessionInfo objects, sorted newest first
     """
-    session_dir = get_session_directory(cwd)
-    if not session_dir.exists():
-        return []
+    return SessionCatalog.for_cwd(cwd).sessions()
 
-    sessions = []
-    for f in session_dir.glob("*.jsonl"):
-        # Skip subagent sessions (agent-xxxx format)
-        # These are created by Task tool subagents and shouldn't be resumed as main sessions
-        if f.name.startswith("agent-"):
-            continue
 
-        # Parse UUID from filename
-        session_id = f.stem  # filename without .jsonl
+def read_last_messages(
+    cwd: str,
+    session_id: str,
+    count: int = 10,
+    types: Optional[Iterable[str]] = TURN_TYPES
+) -> List[Dict[str, Any]]:
+    """Read the last messages of a session without loading the whole file.
 
-        # Validate UUID format - only accept properly formatted UUIDs
-        try:
-            uuid.UUID(session_id)
-        except ValueError:
-            continue  # Not a valid UUID, skip
+    Reads backwards from EOF in TAIL_BLOCK_BYTES steps until `count`
+    matching messages are found. A partially written last line is skipped.
 
-        try:
-            stat = f.stat()
-            sessions.append(SessionInfo(
-                session_id=session_id,
-                path=f,
-                size=stat.st_size,
-                modified=stat.st_mtime
-            ))
-        except OSError:
-            continue  # File may have been deleted, skip
+    Args:
+        cwd: Working directory path
+        session_id: The session UUID
+        count: Number of messages to return
+        types: Message types to include (default user/assistant); None for all
+
+    Returns:
+        Parsed messages, oldest first (empty if the session doesn't exist)
+    """
+    session_file = get_session_directory(cwd) / f"{session_id}.jsonl"
+    wanted = set(types) if types is not None else None
+    found: List[Dict[str, Any]] = []
+
+    try:
+        with open(session_file, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            carry = b""
+            while pos > 0 and len(found) < count:
+                step = min(TAIL_BLOCK_BYTES, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + carry).split(b"\n")
+                # The first piece may be the tail of a line that starts in an earlier block
+                carry = lines.pop(0) if pos > 0 else b""
+                for raw in reversed(lines):
+                    if not raw.strip():
+                        continue
+                    try:
+                        message = json.loads(raw)
+                    except ValueError:
+                        continue
+                    if isinstance(message, dict) and (wanted is None or message.get("type") in wanted):
+                        found.append(message)
+                        if len(found) == count:
+                            break
+    except OSError:
+        return []
 
-    # Sort by modified time (newest first)
-    sessions.sort(key=lambda s: s.modified, reverse=True)
-    return sessions
+    found.reverse()
+    return found
 
 
 def find_latest_meaningful_session(cwd: str, min_size_bytes: int = 5000) -> Optional[str]:
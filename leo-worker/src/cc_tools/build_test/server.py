@@ -16,6 +16,8 @@ from typing import Dict, Any, Optional, Tuple, List
 
 from fastmcp import FastMCP
 from ..common.logging_utils import setup_mcp_server_logging
+from ..common.npm import npm_env
+from ..common.node_modules_snapshot import restore_node_modules, save_node_modules
 
 # Setup logging early using shared utility
 server_logger = setup_mcp_server_logging("build_test")
@@ -97,6 +99,9 @@ class BuildTestHostMCPServer:
             raise
         
         self.name = "BuildTest"
+
+        # Detached node_modules snapshot saves (references keep them alive)
+        self._snapshot_tasks: set = set()
         
         # Register tools
         try:
@@ -108,6 +113,12 @@ class BuildTestHostMCPServer:
         
         self.logger.info("[SERVER_INIT] BuildTest MCP Server initialization complete")
     
+    def _seed_snapshot(self, work_dir: Path) -> None:
+        """Save work_dir's node_modules as a snapshot in a detached background task."""
+        task = asyncio.create_task(asyncio.to_thread(save_node_modules, work_dir, only_new_package=True))
+        self._snapshot_tasks.add(task)
+        task.add_done_callback(self._snapshot_tasks.discard)
+
     def register_tools(self):
         """Register all build and test tools."""
         self.logger.info("[TOOL_REGISTRATION] Starting tool registration")
@@ -259,13 +270,19 @@ class BuildTestHostMCPServer:
         suggestions = []
         has_errors = False
         all_structured_errors = []  # Collect all parsed errors
+        seed_snapshot = False
         
         # First check if dependencies are installed
         node_modules_path = Path(work_dir) / "node_modules"
         if not node_modules_path.exists():
             all_output.append("⚠️  No node_modules found - installing dependencies first...")
-            install_cmd = [package_manager, "install"]
-            success, stdout, stderr = await self.run_command(install_cmd, cwd=work_dir)
+            # Start from a pre-built node_modules snapshot so npm only installs the delta
+            restored = await asyncio.to_thread(restore_node_modules, Path(work_dir))
+            if restored:
+                match = "exact" if restored["exact"] else "nearest"
+                all_output.append(f"✓ node_modules restored from snapshot ({match} match, {restored['seconds']}s)")
+            install_cmd = [package_manager, "install", "--prefer-offline"]
+            success, stdout, stderr = await self.run_command(install_cmd, cwd=work_dir, env=npm_env())
             if not success:
                 return {
                     "success": False,
@@ -275,6 +292,8 @@ class BuildTestHostMCPServer:
                 }
             all_output.append("✓ Dependencies installed")
             all_output.append("")
+            # Seed a snapshot of this first install once the checks are done
+            seed_snapshot = True
         
         # Define the checks to run in order with fast-fail behavior
         # Critical checks: lint, type-check, build (stop on failure)
@@ -391,6 +410,12 @@ class BuildTestHostMCPServer:
                     all_output.append(f"   Fix this issue before proceeding with remaining checks")
                     break
         
+        # Seed a snapshot the first time this template is installed on this worker.
+        # Only after the checks (they write caches into node_modules) and in the
+        # background so the copy doesn't hold up the result.
+        if seed_snapshot:
+            self._seed_snapshot(Path(work_dir))
+        
         # Prepare final result
         result = {
             "success": not has_errors,
@@ -0,0 +1,3 @@
+"""Code Index - incremental structure index (symbols, imports, routes, API calls) for generated apps."""
+
+__version__ = "0.1.0"
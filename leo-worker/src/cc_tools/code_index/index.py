@@ -0,0 +1,532 @@
+"""
+Incremental code-structure index for generated apps.
+
+Dependency-light successor to the archived tree_sitter server: TS/JS files
+are scanned with regular expressions, Python files with the ast module. For
+every source file the index records
+
+- symbols: top-level functions, classes, components, hooks, types, consts
+- imports: module specifiers (resolved to project files at query time)
+- routes: Express routes and mounts, ts-rest contract endpoints, Python
+  route decorators, and client page routes (<Route path=...>)
+- api_calls: fetch/axios/apiRequest calls to /api/... and apiClient.x.y()
+
+Entries are keyed by (mtime_ns, size), so refresh() only re-parses files
+that changed. The index is persisted per project under LEO_CODE_INDEX_DIR
+and shared by the MCP server and the reprompter's context step.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, TypeVar
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = Path(os.getenv("LEO_CODE_INDEX_DIR", Path.home() / ".cache" / "leo" / "code-index"))
+
+# Bump when the entry format or extraction rules change
+INDEX_VERSION = 1
+
+JS_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+CODE_EXTENSIONS = frozenset(JS_EXTENSIONS + (".py",))
+
+IGNORE_DIRS = frozenset({
+    "node_modules", ".git", ".next", ".cache", "dist", "build", "coverage",
+    ".turbo", ".vercel", "out", "__pycache__", ".venv", "venv", ".pytest_cache",
+    "screenshots", "stock_photos"
+})
+
+# Larger files are bundles or generated code, not app structure
+MAX_FILE_BYTES = 512 * 1024
+
+# Page routes whose component reaches an API call within this many import hops
+API_PAGE_HOPS = 4
+
+# Used when tsconfig.json has no usable "paths"
+DEFAULT_ALIASES = {"@/": "client/src/", "@shared/": "shared/"}
+
+HTTP_METHODS = ("get", "post", "put", "patch", "delete", "all")
+
+_IMPORT_FROM = re.compile(r"""^\s*(?:import|export)\s+(?:type\s+)?(?:[\w*{}\s,$]+?\s+from\s+)?['"]([^'"\n]+)['"]""", re.M)
+_IMPORT_CALL = re.compile(r"""\b(?:require|import)\(\s*['"]([^'"\n]+)['"]\s*\)""")
+_JS_SYMBOL = re.compile(
+    r"^(export\s+)?(?:default\s+)?(?:declare\s+)?(?:async\s+)?"
+    r"(function\*?|class|interface|type|enum|const|let|var)\s+([A-Za-z_$][\w$]*)",
+    re.M
+)
+_EXPRESS_ROUTE = re.compile(r"""\b(\w+)\.(get|post|put|patch|delete|all|use)\(\s*['"`](/[^'"`]*)['"`]""")
+_CONTRACT_PATH = re.compile(r"""\bpath\s*:\s*['"`](/[^'"`]*)['"`]""")
+_CONTRACT_METHOD = re.compile(r"""\bmethod\s*:\s*['"](GET|POST|PUT|PATCH|DELETE)['"]""")
+_CONTRACT_ENTRY = re.compile(r"(\w+)\s*:\s*\{")
+_PAGE_ROUTE = re.compile(r"""<Route\s[^>]*?\bpath=\{?\s*['"]([^'"]+)['"]""")
+_PAGE_COMPONENT = re.compile(r"""component=\{(\w+)\}|element=\{\s*<(\w+)""")
+_FETCH_CALL = re.compile(
+    r"""\b(fetch|axios(?:\.(?:get|post|put|patch|delete))?|apiRequest)\(\s*"""
+    r"""(?:['"](GET|POST|PUT|PATCH|DELETE)['"]\s*,\s*)?['"`]([^'"`\n]*/api/[^'"`\n]*)['"`]"""
+)
+_TSREST_CALL = re.compile(r"\bapiClient\.(\w+)\.(\w+)\s*\(")
+
+
+def _line_at(content: str, pos: int) -> int:
+    return content.count("\n", 0, pos) + 1
+
+
+def _symbol_kind(keyword: str, name: str, tsx: bool) -> str:
+    if keyword in ("const", "let", "var"):
+        keyword = "const"
+    elif keyword.startswith("function"):
+        keyword = "function"
+    if keyword in ("function", "const"):
+        if re.match(r"use[A-Z]", name):
+            return "hook"
+        if tsx and name[:1].isupper():
+            return "component"
+    return keyword
+
+
+def _parse_js(content: str, tsx: bool) -> Dict[str, List]:
+    symbols = [
+        {"name": m.group(3), "kind": _symbol_kind(m.group(2), m.group(3), tsx),
+         "line": _line_at(content, m.start()), "exported": bool(m.group(1))}
+        for m in _JS_SYMBOL.finditer(content)
+    ]
+
+    imports = [[m.group(1), _line_at(content, m.start())] for m in _IMPORT_FROM.finditer(content)]
+    imports += [[m.group(1), _line_at(content, m.start())] for m in _IMPORT_CALL.finditer(content)]
+
+    routes = []
+    for m in _EXPRESS_ROUTE.finditer(content):
+        receiver, method, path = m.groups()
+        if receiver in ("app", "router", "server") or receiver.lower().endswith("router"):
+            kind = "mount" if method == "use" else "express"
+            routes.append({"kind": kind, "method": method.upper(), "path": path, "line": _line_at(content, m.start())})
+
+    if "method" in content and ("initContract" in content or ".router(" in content):
+        for m in _CONTRACT_PATH.finditer(content):
+            window_start = max(0, m.start() - 400)
+            window = content[window_start:m.end() + 400]
+            methods = list(_CONTRACT_METHOD.finditer(window))
+            if not methods:
+                continue
+            here = m.start() - window_start
+            method = min(methods, key=lambda mm: abs(mm.start() - here))
+            entry_end = window_start + min(method.start(), here)
+            entries = list(_CONTRACT_ENTRY.finditer(content, window_start, entry_end))
+            routes.append({
+                "kind": "ts-rest", "method": method.group(1), "path": m.group(1),
+                "name": entries[-1].group(1) if entries else None, "line": _line_at(content, m.start())
+            })
+
+    for m in _PAGE_ROUTE.finditer(content):
+        component = _PAGE_COMPONENT.search(content, m.start(), m.end() + 200)
+        routes.append({
+            "kind": "page", "path": m.group(1), "line": _line_at(content, m.start()),
+            "component": (component.group(1) or component.group(2)) if component else None
+        })
+
+    api_calls = []
+    for m in _FETCH_CALL.finditer(content):
+        client, method, url = m.groups()
+        if not method:
+            method = client.split(".")[1].upper() if "." in client else None
+        api_calls.append({"kind": "http", "method": method, "path": url, "line": _line_at(content, m.start())})
+    for m in _TSREST_CALL.finditer(content):
+        api_calls.append({"kind": "ts-rest", "endpoint": f"{m.group(1)}.{m.group(2)}", "line": _line_at(content, m.start())})
+
+    return {"symbols": symbols, "imports": imports, "routes": routes, "api_calls": api_calls}
+
+
+def _parse_python(content: str) -> Dict[str, List]:
+    tree = ast.parse(content)
+    symbols, imports, routes = [], [], []
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            kind = "class" if isinstance(node, ast.ClassDef) else "function"
+            symbols.append({"name": node.name, "kind": kind, "line": node.lineno, "exported": not node.name.startswith("_")})
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend([alias.name, node.lineno] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imports.append(["." * node.level + (node.module or ""), node.lineno])
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for decorator in node.decorator_list:
+                if not (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute)):
+                    continue
+                verb = decorator.func.attr.lower()
+                if verb not in HTTP_METHODS + ("route", "api_route", "websocket"):
+                    continue
+                if decorator.args and isinstance(decorator.args[0], ast.Constant) and isinstance(decorator.args[0].value, str):
+                    method = verb.upper() if verb in HTTP_METHODS else "ANY"
+                    routes.append({"kind": "python", "method": method, "path": decorator.args[0].value,
+                                   "handler": node.name, "line": node.lineno})
+
+    return {"symbols": symbols, "imports": imports, "routes": routes, "api_calls": []}
+
+
+def parse_file(path: Path) -> Dict[str, List]:
+    """Extract symbols, imports, routes and API calls from one source file."""
+    content = path.read_text(encoding="utf-8", errors="replace")
+    if path.suffix == ".py":
+        try:
+            return _parse_python(content)
+        except SyntaxError:
+            return {"symbols": [], "imports": [], "routes": [], "api_calls": []}
+    return _parse_js(content, path.suffix in (".tsx", ".jsx"))
+
+
+def _path_segments(path: str) -> List[str]:
+    """Normalized URL path segments; parameters (:id, ${id}, {id}, [id]) become '*'."""
+    path = re.sub(r"\$?\{[^}]*\}", "*", path.split("?")[0])
+    segments = []
+    for segment in path.strip("/").split("/"):
+        if segment.startswith(":") or (segment.startswith("[") and segment.endswith("]")) or "*" in segment:
+            segment = "*"
+        if segment:
+            segments.append(segment)
+    return segments
+
+
+def _segments_match(a: List[str], b: List[str]) -> bool:
+    return len(a) == len(b) and all(x == y or "*" in (x, y) for x, y in zip(a, b))
+
+
+def _path_matches(route_path: str, endpoint: str, suffix: bool = False) -> bool:
+    """Whether endpoint hits route_path; with suffix, route_path may sit under a mount prefix."""
+    route, target = _path_segments(route_path), _path_segments(endpoint)
+    # Suffix matching needs a literal segment, or "/:id" would match everything
+    if suffix and 0 < len(route) <= len(target) and any(segment != "*" for segment in route):
+        target = target[len(target) - len(route):]
+    return _segments_match(route, target)
+
+
+class CodeIndex:
+    """On-disk, mtime-refreshed structure index of one project directory."""
+
+    def __init__(self, root: Path, index_path: Optional[Path] = None):
+        self.root = Path(root).resolve()
+        project_id = hashlib.sha256(str(self.root).encode()).hexdigest()[:16]
+        self.index_path = index_path or INDEX_DIR / f"{project_id}.json"
+        self._lock = threading.Lock()
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._importers: Optional[Dict[str, Set[str]]] = None
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence and refresh
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION and data.get("root") == str(self.root):
+                self._files = data.get("files", {})
+        except (OSError, ValueError):
+            self._files = {}
+
+    def _save(self) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": INDEX_VERSION, "root": str(self.root), "files": self._files}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _walk(self) -> Dict[str, os.stat_result]:
+        found = {}
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORE_DIRS and not entry.name.startswith("."):
+                        stack.append(Path(entry.path))
+                elif os.path.splitext(entry.name)[1] in CODE_EXTENSIONS and not entry.name.endswith(".d.ts"):
+                    st = entry.stat()
+                    if st.st_size <= MAX_FILE_BYTES:
+                        found[Path(entry.path).relative_to(self.root).as_posix()] = st
+        return found
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Re-parse files whose mtime/size changed and drop deleted ones.
+
+        Returns:
+            {"files", "parsed", "removed"}
+        """
+        with self._lock:
+            current = self._walk()
+            removed = [rel for rel in self._files if rel not in current]
+            for rel in removed:
+                del self._files[rel]
+
+            parsed = 0
+            for rel, st in current.items():
+                entry = self._files.get(rel)
+                if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                    continue
+                try:
+                    info = parse_file(self.root / rel)
+                except OSError as e:
+                    logger.debug(f"[CODE_INDEX] Could not read {rel}: {e}")
+                    continue
+                self._files[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, **info}
+                parsed += 1
+
+            if parsed or removed:
+                self._importers = None
+                try:
+                    self._save()
+                except OSError as e:
+                    logger.warning(f"[CODE_INDEX] Could not save index: {e}")
+            return {"files": len(self._files), "parsed": parsed, "removed": len(removed)}
+
+    # ------------------------------------------------------------------
+    # Import resolution
+    # ------------------------------------------------------------------
+
+    def _aliases(self) -> Dict[str, str]:
+        """Path alias prefix -> project-relative directory, from tsconfig.json "paths"."""
+        try:
+            text = (self.root / "tsconfig.json").read_text()
+            text = re.sub(r"^\s*//.*$", "", text, flags=re.M)
+            text = re.sub(r",(\s*[}\]])", r"\1", text)
+            options = json.loads(text).get("compilerOptions", {})
+        except (OSError, ValueError):
+            return dict(DEFAULT_ALIASES)
+        base = options.get("baseUrl", ".")
+        aliases = {}
+        for pattern, targets in (options.get("paths") or {}).items():
+            if pattern.endswith("/*") and targets:
+                target = os.path.normpath(os.path.join(base, targets[0].rstrip("*")))
+                aliases[pattern[:-1]] = "" if target == "." else Path(target).as_posix() + "/"
+        return aliases or dict(DEFAULT_ALIASES)
+
+    def _resolve(self, spec: str, from_rel: str, aliases: Dict[str, str]) -> Optional[str]:
+        """Project file an import specifier points to, or None for packages."""
+        if from_rel.endswith(".py"):
+            if spec.startswith("."):
+                level = len(spec) - len(spec.lstrip("."))
+                base = Path(from_rel).parents[level - 1] if level <= len(Path(from_rel).parents) else Path()
+                stem = (base / spec.lstrip(".").replace(".", "/")).as_posix()
+            else:
+                stem = spec.replace(".", "/")
+            for candidate in (f"{stem}.py", f"{stem}/__init__.py"):
+                if candidate in self._files:
+                    return candidate
+            return None
+
+        if spec.startswith("."):
+            stem = os.path.normpath(os.path.join(os.path.dirname(from_rel), spec))
+        else:
+            prefix = next((p for p in sorted(aliases, key=len, reverse=True) if spec.startswith(p)), None)
+            if prefix is None:
+                return None
+            stem = os.path.normpath(aliases[prefix] + spec[len(prefix):])
+        stem = Path(stem).as_posix()
+
+        if stem in self._files:
+            return stem
+        # ESM-style "./foo.js" importing foo.ts
+        root_stem = os.path.splitext(stem)[0] if stem.endswith(JS_EXTENSIONS) else stem
+        for ext in JS_EXTENSIONS:
+            for candidate in (f"{root_stem}{ext}", f"{root_stem}/index{ext}"):
+                if candidate in self._files:
+                    return candidate
+        return None
+
+    def _importer_map(self) -> Dict[str, Set[str]]:
+        """Resolved file (or package name) -> files importing it."""
+        if self._importers is None:
+            aliases = self._aliases()
+            importers: Dict[str, Set[str]] = defaultdict(set)
+            for rel, entry in self._files.items():
+                for spec, _ in entry["imports"]:
+                    target = self._resolve(spec, rel, aliases)
+                    importers[target or spec].add(rel)
+            self._importers = importers
+        return self._importers
+
+    # ------------------------------------------------------------------
+    # Queries (call refresh() first)
+    # ------------------------------------------------------------------
+
+    def file_outline(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        """Symbols, imports, routes and API calls of one file."""
+        entry = self._files.get(Path(rel_path).as_posix())
+        if entry is None:
+            return None
+        return {key: value for key, value in entry.items() if key not in ("mtime_ns", "size")}
+
+    def find_symbol(self, name: str, exact: bool = True) -> List[Dict[str, Any]]:
+        needle = name if exact else name.lower()
+        matches = []
+        for rel, entry in sorted(self._files.items()):
+            for symbol in entry["symbols"]:
+                if (symbol["name"] == needle) if exact else (needle in symbol["name"].lower()):
+                    matches.append({"file": rel, **symbol})
+        return matches
+
+    def _resolve_target(self, target: str) -> Optional[str]:
+        """Project file for a path (absolute, relative, extensionless or "@/..." alias)."""
+        if Path(target).is_absolute():
+            try:
+                target = Path(target).resolve().relative_to(self.root).as_posix()
+            except ValueError:
+                return None
+        if target in self._files:
+            return target
+        if target.endswith(".py"):
+            return None
+        aliases = self._aliases()
+        if not any(target.startswith(prefix) for prefix in aliases):
+            target = "./" + target.lstrip("./")
+        return self._resolve(target, "", aliases)
+
+    def importers(self, target: str) -> Dict[str, Any]:
+        """
+        Files importing `target`: a project file (path with or without
+        extension) or a package name like "@tanstack/react-query".
+        """
+        importer_map = self._importer_map()
+        resolved = self._resolve_target(target)
+        if resolved:
+            return {"target": resolved, "resolved": True, "importers": sorted(importer_map.get(resolved, ()))}
+
+        # Package subpaths ("react-dom/client") count as the package
+        files: Set[str] = set()
+        for spec, spec_importers in importer_map.items():
+            if spec == target or spec.startswith(target + "/"):
+                files |= spec_importers
+        return {"target": target, "resolved": False, "importers": sorted(files)}
+
+    def routes(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        found = []
+        for rel, entry in sorted(self._files.items()):
+            for route in entry["routes"]:
+                if kind is None or route["kind"] == kind:
+                    found.append({"file": rel, **route})
+        return found
+
+    def _reachable_importers(self, files: Iterable[str], hops: int) -> Set[str]:
+        importer_map = self._importer_map()
+        seen = set(files)
+        frontier = set(files)
+        for _ in range(hops):
+            frontier = {imp for f in frontier for imp in importer_map.get(f, ())} - seen
+            if not frontier:
+                break
+            seen |= frontier
+        return seen
+
+    def api_usage(self, endpoint: str) -> Dict[str, Any]:
+        """
+        Everything touching an API endpoint like "/api/items/:id": server
+        handlers (Express/ts-rest/Python), client calls (fetch/axios and the
+        ts-rest apiClient methods bound to matching contract entries), and
+        the page routes whose component reaches one of those calls.
+        """
+        handlers = [
+            route for route in self.routes()
+            if route["kind"] in ("express", "ts-rest", "python")
+            and _path_matches(route["path"], endpoint, suffix=route["kind"] != "python")
+        ]
+        contract_names = {route["name"] for route in handlers if route["kind"] == "ts-rest" and route.get("name")}
+
+        calls = []
+        for rel, entry in sorted(self._files.items()):
+            for call in entry["api_calls"]:
+                if call["kind"] == "http" and _path_matches(call["path"], endpoint):
+                    calls.append({"file": rel, **call})
+                elif call["kind"] == "ts-rest" and call["endpoint"].split(".")[1] in contract_names:
+                    calls.append({"file": rel, **call})
+
+        call_files = {call["file"] for call in calls}
+        reaching = self._reachable_importers(call_files, API_PAGE_HOPS)
+        defined_in = defaultdict(set)
+        for rel, entry in self._files.items():
+            for symbol in entry["symbols"]:
+                defined_in[symbol["name"]].add(rel)
+        pages = []
+        for route in self.routes("page"):
+            # The router file reaches every page, so look at the component's own file
+            component_files = defined_in.get(route.get("component") or "", set()) - {route["file"]}
+            if component_files & reaching or (not component_files and route["file"] in call_files):
+                pages.append(route)
+
+        return {"endpoint": endpoint, "handlers": handlers, "calls": calls, "pages": pages}
+
+    def stats(self) -> Dict[str, Any]:
+        counts = defaultdict(int)
+        for entry in self._files.values():
+            counts["symbols"] += len(entry["symbols"])
+            counts["imports"] += len(entry["imports"])
+            counts["routes"] += len(entry["routes"])
+            counts["api_calls"] += len(entry["api_calls"])
+        return {"root": str(self.root), "files": len(self._files), **counts, "index_path": str(self.index_path)}
+
+    def summary(self, max_routes: int = 60) -> str:
+        """Compact text overview (routes and endpoints) for prompts."""
+        stats = self.stats()
+        lines = [
+            f"{stats['files']} source files, {stats.get('symbols', 0)} symbols, "
+            f"{stats.get('routes', 0)} routes, {stats.get('api_calls', 0)} API calls"
+        ]
+        sections = [
+            ("Page routes", self.routes("page"), lambda r: f"{r['path']} -> {r.get('component') or '?'} ({r['file']})"),
+            ("API endpoints", [r for r in self.routes() if r["kind"] in ("express", "ts-rest", "python")],
+             lambda r: f"{r['method']} {r['path']}{' [' + r['name'] + ']' if r.get('name') else ''} ({r['file']}:{r['line']})"),
+            ("Mounts", self.routes("mount"), lambda r: f"{r['path']} ({r['file']}:{r['line']})"),
+        ]
+        for title, routes, fmt in sections:
+            if not routes:
+                continue
+            lines.append(f"\n{title}:")
+            lines.extend(f"  {fmt(route)}" for route in routes[:max_routes])
+            if len(routes) > max_routes:
+                lines.append(f"  ... {len(routes) - max_routes} more")
+        return "\n".join(lines)
+
+
+_indexes: Dict[str, CodeIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(root: Path) -> CodeIndex:
+    """Shared, refreshed CodeIndex for a project directory."""
+    key = os.path.realpath(root)
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = CodeIndex(Path(key))
+        index = _indexes[key]
+    index.refresh()
+    return index
+
+
+T = TypeVar("T")
+
+
+def query_index(root: Path, query: Callable[[CodeIndex], T]) -> T:
+    """
+    Refresh the shared index for a project and run query(index) under its lock.
+
+    Queries iterate the index's file table, which a concurrent refresh()
+    (another tool call or thread) rewrites; holding the lock keeps them on a
+    consistent view.
+    """
+    index = get_index(root)
+    with index._lock:
+        return query(index)
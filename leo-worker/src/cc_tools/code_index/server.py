@@ -0,0 +1,193 @@
+"""
+Code Index MCP Server
+
+Answers structure questions about the generated app from an incremental
+on-disk index instead of repeated Grep/Read turns: where a symbol is
+defined, who imports a file or package, which routes exist, and which
+handlers, callers and pages touch an API endpoint.
+
+The index is refreshed by file mtime on every call, so results always
+reflect the current tree.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from fastmcp import FastMCP
+from ..common.logging_utils import setup_mcp_server_logging, log_server_startup, log_server_shutdown, setup_signal_handlers
+from .index import CodeIndex, query_index
+
+# Setup logging early using shared utility
+server_logger = setup_mcp_server_logging("code_index")
+server_logger.info("[SERVER_INIT] Code Index MCP server module loaded")
+
+# Create a FastMCP server instance
+mcp = FastMCP("Code Index")
+
+# Cap on list results returned to the agent
+MAX_RESULTS = 200
+
+
+async def _query(workspace: str, query: Callable[[CodeIndex], Any]) -> Any:
+    """Refresh the workspace's index and run query on it, both off the event loop."""
+    workspace_path = Path(workspace).resolve()
+    if not workspace_path.is_dir():
+        raise ValueError(f"Invalid workspace path: {workspace}")
+    return await asyncio.to_thread(query_index, workspace_path, query)
+
+
+def _error(tool: str, e: Exception) -> str:
+    server_logger.error(f"[{tool}] Error: {e}", exc_info=not isinstance(e, ValueError))
+    return json.dumps({"error": str(e)})
+
+
+@mcp.tool()
+async def index_status(workspace: str = ".") -> str:
+    """
+    Refresh the code index and report what it contains.
+
+    Args:
+        workspace: Project directory (default: current directory)
+
+    Returns:
+        JSON with file/symbol/route/API call counts and a routes overview
+    """
+    try:
+        status = await _query(workspace, lambda index: {**index.stats(), "overview": index.summary()})
+        return json.dumps(status, indent=2)
+    except Exception as e:
+        return _error("INDEX_STATUS", e)
+
+
+@mcp.tool()
+async def find_symbol(name: str, exact: bool = True, workspace: str = ".") -> str:
+    """
+    Find where functions, components, hooks, classes, types and consts are defined.
+
+    Args:
+        name: Symbol name (e.g. "ItemList", "useAuth")
+        exact: Exact match; False for case-insensitive substring search
+        workspace: Project directory (default: current directory)
+
+    Returns:
+        JSON list of {file, name, kind, line, exported}
+    """
+    try:
+        matches = await _query(workspace, lambda index: index.find_symbol(name, exact))
+        server_logger.info(f"[FIND_SYMBOL] {name}: {len(matches)} matches")
+        return json.dumps({"matches": matches[:MAX_RESULTS], "total": len(matches)}, indent=2)
+    except Exception as e:
+        return _error("FIND_SYMBOL", e)
+
+
+@mcp.tool()
+async def find_importers(target: str, workspace: str = ".") -> str:
+    """
+    Who imports X: files importing a project file or a package.
+
+    Args:
+        target: Project file ("client/src/lib/api-client.ts", "@/lib/api-client",
+                extension optional) or package name ("@tanstack/react-query")
+        workspace: Project directory (default: current directory)
+
+    Returns:
+        JSON with the resolved target and the importing files
+    """
+    try:
+        result = await _query(workspace, lambda index: index.importers(target))
+        server_logger.info(f"[FIND_IMPORTERS] {target}: {len(result['importers'])} importers")
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        return _error("FIND_IMPORTERS", e)
+
+
+@mcp.tool()
+async def list_routes(kind: Optional[str] = None, workspace: str = ".") -> str:
+    """
+    List routes found in the app.
+
+    Args:
+        kind: Filter - "page" (client <Route>), "express", "mount" (app.use),
+              "ts-rest" (contract entries) or "python"; all when omitted
+        workspace: Project directory (default: current directory)
+
+    Returns:
+        JSON list of routes with file and line
+    """
+    try:
+        routes = await _query(workspace, lambda index: index.routes(kind))
+        return json.dumps({"routes": routes[:MAX_RESULTS], "total": len(routes)}, indent=2)
+    except Exception as e:
+        return _error("LIST_ROUTES", e)
+
+
+@mcp.tool()
+async def find_api_usage(endpoint: str, workspace: str = ".") -> str:
+    """
+    Which handlers serve an API endpoint and which code and pages call it.
+
+    Path parameters match any value, so "/api/items/42" finds handlers for
+    "/items/:id" and calls to `/api/items/${id}`. ts-rest calls
+    (apiClient.items.getItem) are matched through their contract entry.
+
+    Args:
+        endpoint: API path, e.g. "/api/items" or "/api/items/42"
+        workspace: Project directory (default: current directory)
+
+    Returns:
+        JSON with handlers, calls and page routes reaching those calls
+    """
+    try:
+        result = await _query(workspace, lambda index: index.api_usage(endpoint))
+        server_logger.info(
+            f"[FIND_API_USAGE] {endpoint}: {len(result['handlers'])} handlers, "
+            f"{len(result['calls'])} calls, {len(result['pages'])} pages"
+        )
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        return _error("FIND_API_USAGE", e)
+
+
+@mcp.tool()
+async def file_outline(path: str, workspace: str = ".") -> str:
+    """
+    Symbols, imports, routes and API calls of one file, without reading it.
+
+    Args:
+        path: File path relative to the workspace
+        workspace: Project directory (default: current directory)
+
+    Returns:
+        JSON outline of the file
+    """
+    try:
+        outline = await _query(workspace, lambda index: index.file_outline(path))
+        if outline is None:
+            return json.dumps({"error": f"Not an indexed source file: {path}"})
+        return json.dumps({"file": path, **outline}, indent=2)
+    except Exception as e:
+        return _error("FILE_OUTLINE", e)
+
+
+def main() -> None:
+    """Main entry point for the server."""
+    try:
+        log_server_startup(server_logger, "code_index")
+        setup_signal_handlers(server_logger, "code_index")
+
+        server_logger.info(f"[MAIN] Initial working directory: {os.getcwd()}")
+
+        mcp.run(transport="stdio", show_banner=False)
+    except Exception as e:
+        server_logger.error(f"[MAIN] Server error: {e}", exc_info=True)
+        sys.exit(1)
+    finally:
+        log_server_shutdown(server_logger, "code_index")
+
+
+if __name__ == "__main__":
+    main()
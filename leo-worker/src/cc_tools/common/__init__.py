@@ -6,10 +6,30 @@ from .logging_utils import (
     log_server_shutdown,
     setup_signal_handlers
 )
+from .lint_cache import LintBatchError, LintService
+from .npm import (
+    NPM_CACHE_DIR,
+    npm_env,
+    project_lock,
+    split_package_spec,
+    is_exact_version,
+    installed_version
+)
+from .node_modules_snapshot import restore_node_modules, save_node_modules
 
 __all__ = [
     "setup_mcp_server_logging",
     "log_server_startup", 
     "log_server_shutdown",
-    "setup_signal_handlers"
+    "setup_signal_handlers",
+    "LintBatchError",
+    "LintService",
+    "NPM_CACHE_DIR",
+    "npm_env",
+    "project_lock",
+    "split_package_spec",
+    "is_exact_version",
+    "installed_version",
+    "restore_node_modules",
+    "save_node_modules"
 ]
\ No newline at end of file
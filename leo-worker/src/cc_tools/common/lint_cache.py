@@ -0,0 +1,358 @@
+"""
+Shared lint service for the linter MCP servers (oxc, ruff).
+
+Spawning oxlint/ruff once per file dominates the cost of these linters, and
+agents lint the same files over and over. LintService sits between the MCP
+tools and the linter binary:
+
+- Results are cached per file, keyed by content hash + linter arguments +
+  the workspace's lint config files, so an unchanged file is never re-linted.
+- Concurrent single-file requests arriving within a short window are
+  batched into one multi-file invocation.
+- lint_tree() walks a directory, re-lints only files whose content changed
+  since the last run and merges in cached results for the rest. Since the
+  linter is handed explicit file paths, the walk itself skips vendor
+  directories (node_modules, .git, virtualenvs) and .gitignore'd files.
+- The cache is persisted per workspace (MCP servers are respawned with each
+  agent session), bounded as an LRU.
+
+Hit/miss counters are exposed via stats() for the servers' cache-stats tool.
+"""
+
+import asyncio
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Linter runner: (files, extra args) -> {realpath: [diagnostics]}.
+# Files without diagnostics may be missing from the result.
+BatchRunner = Callable[[List[str], Tuple[str, ...]], Awaitable[Dict[str, List[dict]]]]
+
+# How long single-file requests wait for company before the linter runs
+DEFAULT_BATCH_WINDOW_SECONDS = 0.03
+
+# Files per linter invocation
+DEFAULT_MAX_BATCH_FILES = 100
+
+# Cached file results kept (LRU)
+DEFAULT_MAX_ENTRIES = 5000
+
+CACHE_DIR = Path(os.getenv("LEO_LINT_CACHE_DIR", Path.home() / ".cache" / "leo" / "lint"))
+
+# Directories lint_tree() never descends into, whatever the caller excludes
+VENDOR_DIRS = (".git", "node_modules", "site-packages", "__pycache__", ".venv", "venv", ".tox", ".mypy_cache", ".ruff_cache")
+
+
+class LintBatchError(Exception):
+    """The linter failed or its output couldn't be parsed."""
+
+    def __init__(self, message: str, stdout: str = "", stderr: str = ""):
+        super().__init__(message)
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+def _excluded(name: str, patterns: Iterable[str]) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+async def _git_ignored(directory: str, files: List[str]) -> set:
+    """Files excluded by .gitignore (none outside a git work tree or without git)."""
+    if not files:
+        return set()
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git", "check-ignore", "--stdin", "-z",
+            cwd=directory,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await proc.communicate("\0".join(files).encode())
+    except OSError:
+        return set()
+    # 0: some files ignored, 1: none, 128: not a git work tree
+    if proc.returncode != 0:
+        return set()
+    return {path for path in stdout.decode().split("\0") if path}
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class LintService:
+    """
+    Per-workspace cache and batcher in front of a linter binary.
+
+    Usage:
+        service = LintService("ruff", run_ruff_batch, config_files=["pyproject.toml", "ruff.toml"])
+        diagnostics, cached = await service.lint_file(path, ("--select=I",))
+        results, info = await service.lint_tree(directory, {".py"}, {"__pycache__"})
+    """
+
+    def __init__(
+        self,
+        tool: str,
+        run_batch: BatchRunner,
+        config_files: Sequence[str] = (),
+        workspace: Optional[str] = None,
+        batch_window: float = DEFAULT_BATCH_WINDOW_SECONDS,
+        max_batch_files: int = DEFAULT_MAX_BATCH_FILES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            tool: Linter name (cache file name, logging)
+            run_batch: Runs the linter on several files at once
+            config_files: Workspace lint config files; any change invalidates results
+            workspace: Workspace root (default: cwd)
+            batch_window: Seconds to collect concurrent requests into one run
+            max_batch_files: Upper bound on files per linter invocation
+            max_entries: Cached file results kept
+        """
+        self.tool = tool
+        self.run_batch = run_batch
+        self.config_files = list(config_files)
+        self.workspace = os.path.realpath(workspace or os.getcwd())
+        self.batch_window = batch_window
+        self.max_batch_files = max_batch_files
+        self.max_entries = max_entries
+
+        workspace_id = hashlib.sha256(self.workspace.encode()).hexdigest()[:16]
+        self.cache_file = CACHE_DIR / f"{tool}-{workspace_id}.json"
+
+        # "args|config|path|digest" -> diagnostics
+        self._results: "OrderedDict[str, List[dict]]" = OrderedDict()
+        self._loaded = False
+        # realpath -> ((mtime_ns, size), digest); avoids re-hashing unchanged files
+        self._digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+        # Pending single-file requests per argument set
+        self._pending: Dict[Tuple[str, ...], Dict[str, List[asyncio.Future]]] = {}
+        self._flushers: Dict[Tuple[str, ...], asyncio.Task] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.invocations = 0
+        self.files_linted = 0
+
+    # ------------------------------------------------------------------
+    # Cache keys and persistence
+    # ------------------------------------------------------------------
+
+    def _config_signature(self) -> str:
+        parts = []
+        for name in self.config_files:
+            try:
+                st = os.stat(os.path.join(self.workspace, name))
+                parts.append(f"{name}:{st.st_mtime_ns}:{st.st_size}")
+            except OSError:
+                continue
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+    def _digest(self, path: str) -> str:
+        st = os.stat(path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        known = self._digests.get(path)
+        if known and known[0] == stat_key:
+            return known[1]
+        digest = _file_digest(path)
+        self._digests[path] = (stat_key, digest)
+        return digest
+
+    @staticmethod
+    def _key(args: Tuple[str, ...], config: str, path: str, digest: str) -> str:
+        return f"{' '.join(args)}|{config}|{path}|{digest}"
+
+    def _lookup(self, key: str) -> Optional[List[dict]]:
+        self._ensure_loaded()
+        diagnostics = self._results.get(key)
+        if diagnostics is not None:
+            self._results.move_to_end(key)
+        return diagnostics
+
+    def _store(self, key: str, diagnostics: List[dict]) -> None:
+        self._results[key] = diagnostics
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.cache_file, "r") as f:
+                self._results = OrderedDict(json.load(f))
+            logger.info(f"[{self.tool.upper()}] Loaded {len(self._results)} cached lint results")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"[{self.tool.upper()}] Ignoring unreadable lint cache {self.cache_file}: {e}")
+
+    def _save(self) -> None:
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(list(self._results.items()), f)
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            logger.warning(f"[{self.tool.upper()}] Failed to persist lint cache: {e}")
+
+    # ------------------------------------------------------------------
+    # Linting
+    # ------------------------------------------------------------------
+
+    async def _run(self, paths: List[str], args: Tuple[str, ...]) -> Dict[str, List[dict]]:
+        """Lint paths in chunks; returns diagnostics for every path (empty when clean)."""
+        results: Dict[str, List[dict]] = {}
+        for i in range(0, len(paths), self.max_batch_files):
+            chunk = paths[i:i + self.max_batch_files]
+            start = time.monotonic()
+            output = await self.run_batch(chunk, args)
+            self.invocations += 1
+            self.files_linted += len(chunk)
+            logger.info(
+                f"[{self.tool.upper()}] Linted {len(chunk)} file(s) in one run "
+                f"({int((time.monotonic() - start) * 1000)}ms)"
+            )
+            for path in chunk:
+                results[path] = output.get(path, [])
+        return results
+
+    async def lint_file(self, file_path: str, args: Tuple[str, ...] = ()) -> Tuple[List[dict], bool]:
+        """
+        Lint one file, from cache if its content is unchanged.
+
+        Concurrent calls with the same args share one linter invocation.
+
+        Returns:
+            Tuple of (diagnostics, served_from_cache)
+        """
+        path = os.path.realpath(file_path)
+        key = self._key(args, self._config_signature(), path, self._digest(path))
+        cached = self._lookup(key)
+        if cached is not None:
+            self.hits += 1
+            return cached, True
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(args, {}).setdefault(path, []).append(future)
+        if args not in self._flushers:
+            self._flushers[args] = asyncio.create_task(self._flush_after_window(args))
+        return await future, False
+
+    async def _flush_after_window(self, args: Tuple[str, ...]) -> None:
+        await asyncio.sleep(self.batch_window)
+        waiting = self._pending.pop(args, {})
+        self._flushers.pop(args, None)
+        if not waiting:
+            return
+
+        paths = list(waiting)
+        try:
+            # Key on the content being linted now, not when the request came in
+            config = self._config_signature()
+            digests = {path: self._digest(path) for path in paths}
+            results = await self._run(paths, args)
+        except Exception as e:
+            for futures in waiting.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for path, diagnostics in results.items():
+            self._store(self._key(args, config, path, digests[path]), diagnostics)
+            for future in waiting[path]:
+                if not future.done():
+                    future.set_result(diagnostics)
+        await asyncio.to_thread(self._save)
+
+    async def lint_tree(
+        self,
+        directory: str,
+        extensions: Iterable[str],
+        exclude: Iterable[str],
+        args: Tuple[str, ...] = (),
+    ) -> Tuple[Dict[str, List[dict]], dict]:
+        """
+        Lint every matching file under a directory, re-linting only changed files.
+
+        Args:
+            directory: Root to walk
+            extensions: File suffixes to lint (e.g. {".py"})
+            exclude: Directory/file name patterns (fnmatch) to skip anywhere in the
+                tree, on top of VENDOR_DIRS and .gitignore
+
+        Returns:
+            Tuple of ({realpath: diagnostics} for every file, {"files_checked", "relinted", "cached"})
+        """
+        extensions = tuple(extensions)
+        exclude = list(exclude)
+        config = self._config_signature()
+
+        root_dir = os.path.realpath(directory)
+        files = []
+        for root, dirs, names in os.walk(root_dir):
+            dirs[:] = [d for d in dirs if d not in VENDOR_DIRS and not _excluded(d, exclude)]
+            files.extend(
+                os.path.join(root, name) for name in names
+                if name.endswith(extensions) and not _excluded(name, exclude)
+            )
+        ignored = await _git_ignored(root_dir, files)
+        if ignored:
+            files = [path for path in files if path not in ignored]
+
+        results: Dict[str, List[dict]] = {}
+        stale: Dict[str, str] = {}
+        for path in files:
+            try:
+                digest = self._digest(path)
+            except OSError:
+                continue
+            cached = self._lookup(self._key(args, config, path, digest))
+            if cached is None:
+                stale[path] = digest
+            else:
+                results[path] = cached
+        self.hits += len(results)
+        self.misses += len(stale)
+
+        if stale:
+            fresh = await self._run(list(stale), args)
+            for path, diagnostics in fresh.items():
+                self._store(self._key(args, config, path, stale[path]), diagnostics)
+                results[path] = diagnostics
+            await asyncio.to_thread(self._save)
+
+        logger.info(
+            f"[{self.tool.upper()}] {directory}: {len(results)} files, "
+            f"{len(stale)} re-linted, {len(results) - len(stale)} from cache"
+        )
+        return results, {"files_checked": len(results), "relinted": len(stale), "cached": len(results) - len(stale)}
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "linter_invocations": self.invocations,
+            "files_linted": self.files_linted,
+            "avg_files_per_invocation": round(self.files_linted / self.invocations, 2) if self.invocations else 0.0,
+            "cached_results": len(self._results),
+        }
@@ -0,0 +1,217 @@
+"""
+Pre-built node_modules snapshots for new apps.
+
+Every generated app starts from the same template, so its first `npm install`
+rebuilds the same node_modules. Snapshots of node_modules are kept under
+LEO_NODE_MODULES_SNAPSHOT_DIR (on the worker image or a shared volume),
+keyed by a hash of package-lock.json, and copied into apps that have no
+node_modules yet. The normal `npm install` that follows then only installs
+the delta against the snapshot.
+
+Copies use `cp --reflink=auto` (copy-on-write where the filesystem supports
+it, a plain copy otherwise). LEO_NODE_MODULES_SNAPSHOT_LINK=hardlink uses
+hardlinks instead, which is faster still but assumes nothing edits files
+inside node_modules in place.
+
+Layout:
+    <snapshot dir>/<lock key>/node_modules
+    <snapshot dir>/<lock key>/meta.json     {"key", "package", "created", "last_used"}
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path(os.getenv("LEO_NODE_MODULES_SNAPSHOT_DIR", Path.home() / ".cache" / "leo" / "node-modules"))
+
+# "reflink" (copy-on-write / copy) or "hardlink"
+SNAPSHOT_LINK_MODE = os.getenv("LEO_NODE_MODULES_SNAPSHOT_LINK", "reflink")
+
+# Build tool caches inside node_modules, left out of snapshots (app-specific
+# and possibly being written while the snapshot is taken)
+CACHE_DIRS = (".cache", ".vite", ".vite-temp")
+
+# Snapshots kept (least recently used are removed first)
+MAX_SNAPSHOTS = int(os.getenv("LEO_NODE_MODULES_MAX_SNAPSHOTS", "5"))
+
+
+def lockfile_key(project_dir: Path) -> Optional[str]:
+    """Snapshot key for a project: its package-lock.json plus the platform (native modules)."""
+    try:
+        lock_bytes = (project_dir / "package-lock.json").read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.sha256(lock_bytes)
+    digest.update(f"{sys.platform}-{platform.machine()}".encode())
+    return digest.hexdigest()[:32]
+
+
+def _package_name(project_dir: Path) -> Optional[str]:
+    try:
+        with open(project_dir / "package.json", "r") as f:
+            return json.load(f).get("name")
+    except (OSError, ValueError):
+        return None
+
+
+def _read_meta(snapshot: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(snapshot / "meta.json", "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(snapshot: Path, meta: Dict[str, Any]) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=snapshot, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, snapshot / "meta.json")
+
+
+def _snapshots() -> List[Tuple[Path, Dict[str, Any]]]:
+    """Complete snapshots, most recently used first."""
+    if not SNAPSHOT_DIR.is_dir():
+        return []
+    found = []
+    for entry in SNAPSHOT_DIR.iterdir():
+        meta = _read_meta(entry) if not entry.name.startswith(".") else None
+        if meta and (entry / "node_modules").is_dir():
+            found.append((entry, meta))
+    return sorted(found, key=lambda item: item[1].get("last_used", 0), reverse=True)
+
+
+def _copy_tree(src: Path, dest: Path) -> None:
+    """Copy src to dest (which must not exist) with reflinks or hardlinks."""
+    flag = "-al" if SNAPSHOT_LINK_MODE == "hardlink" else "-a"
+    cmd = ["cp", flag, str(src), str(dest)]
+    if SNAPSHOT_LINK_MODE != "hardlink":
+        cmd.insert(2, "--reflink=auto")
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode == 0:
+            return
+        logger.debug(f"[SNAPSHOT] cp failed ({result.stderr.strip()}), falling back to copytree")
+    except FileNotFoundError:
+        pass
+    shutil.rmtree(dest, ignore_errors=True)
+    shutil.copytree(src, dest, symlinks=True)
+
+
+def find_snapshot(project_dir: Path) -> Optional[Tuple[Path, bool]]:
+    """
+    Best snapshot for a project.
+
+    Returns:
+        (snapshot dir, exact) - exact if it was built from the same lockfile;
+        otherwise the most recently used snapshot of the same package (the
+        template). None if there is no snapshot of this package.
+    """
+    key = lockfile_key(project_dir)
+    if key:
+        exact = SNAPSHOT_DIR / key
+        if _read_meta(exact) and (exact / "node_modules").is_dir():
+            return exact, True
+
+    name = _package_name(project_dir)
+    if not name:
+        return None
+    same_package = [snapshot for snapshot, meta in _snapshots() if meta.get("package") == name]
+    return (same_package[0], False) if same_package else None
+
+
+def restore_node_modules(project_dir: Path) -> Optional[Dict[str, Any]]:
+    """
+    Copy the best matching snapshot into a project that has no node_modules.
+
+    Returns:
+        {"key", "exact", "seconds"} if a snapshot was restored, else None.
+        After a restore, run the usual `npm install` to apply the delta.
+    """
+    if (project_dir / "node_modules").exists():
+        return None
+    found = find_snapshot(project_dir)
+    if not found:
+        return None
+    snapshot, exact = found
+
+    start = time.monotonic()
+    staging = Path(tempfile.mkdtemp(dir=project_dir, prefix=".node_modules-"))
+    try:
+        _copy_tree(snapshot / "node_modules", staging / "node_modules")
+        os.rename(staging / "node_modules", project_dir / "node_modules")
+    except OSError as e:
+        # Snapshot removed mid-copy or node_modules appeared meanwhile
+        logger.warning(f"[SNAPSHOT] Could not restore {snapshot.name} into {project_dir}: {e}")
+        return None
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    meta = _read_meta(snapshot)
+    if meta:
+        meta["last_used"] = time.time()
+        try:
+            _write_meta(snapshot, meta)
+        except OSError:
+            pass  # Read-only snapshot dir (e.g. baked into the image)
+
+    seconds = round(time.monotonic() - start, 2)
+    logger.info(f"[SNAPSHOT] Restored node_modules from {snapshot.name} (exact={exact}) in {seconds}s")
+    return {"key": snapshot.name, "exact": exact, "seconds": seconds}
+
+
+def save_node_modules(project_dir: Path, only_new_package: bool = False) -> Optional[str]:
+    """
+    Snapshot a project's installed node_modules under its lockfile key.
+
+    Args:
+        project_dir: Project with package-lock.json and a complete node_modules
+        only_new_package: Skip if any snapshot of this package already exists,
+            so routine installs seed a snapshot per template rather than per app
+
+    Returns:
+        The snapshot key, or None if nothing was saved
+    """
+    key = lockfile_key(project_dir)
+    if not key or not (project_dir / "node_modules").is_dir():
+        return None
+    target = SNAPSHOT_DIR / key
+    if target.exists():
+        return None
+    name = _package_name(project_dir)
+    snapshots = _snapshots()
+    if only_new_package and any(meta.get("package") == name for _, meta in snapshots):
+        return None
+
+    start = time.monotonic()
+    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=SNAPSHOT_DIR, prefix=".tmp-"))
+    try:
+        _copy_tree(project_dir / "node_modules", staging / "node_modules")
+        for cache_dir in CACHE_DIRS:
+            shutil.rmtree(staging / "node_modules" / cache_dir, ignore_errors=True)
+        now = time.time()
+        _write_meta(staging, {"key": key, "package": name, "created": now, "last_used": now})
+        os.rename(staging, target)
+    except OSError as e:
+        # Another process saved the same key first, or the disk is full
+        logger.warning(f"[SNAPSHOT] Could not save node_modules snapshot {key}: {e}")
+        shutil.rmtree(staging, ignore_errors=True)
+        return None
+
+    for old, _ in snapshots[max(MAX_SNAPSHOTS - 1, 0):]:
+        shutil.rmtree(old, ignore_errors=True)
+
+    logger.info(f"[SNAPSHOT] Saved node_modules snapshot {key} ({name}) in {time.monotonic() - start:.2f}s")
+    return key
@@ -0,0 +1,78 @@
+"""
+Shared npm helpers for the MCP servers that install packages.
+
+Generated apps install largely the same packages, so every npm run uses one
+persistent cache directory shared by all apps on the host
+(LEO_NPM_CACHE_DIR). Installs can then go offline-first and only hit the
+registry for packages the cache hasn't seen yet.
+
+npm must never run twice at once in the same project (both rewrite
+package.json, the lockfile and node_modules), so installers take the
+project's lock from project_lock(). npm's cache itself is safe to share
+between concurrent processes.
+"""
+
+import asyncio
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+NPM_CACHE_DIR = Path(os.getenv("LEO_NPM_CACHE_DIR", Path.home() / ".cache" / "leo" / "npm"))
+
+# Exact versions like 18.2.0 or 5.0.0-beta.1 (not ranges or dist-tags)
+_EXACT_VERSION = re.compile(r"^\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.-]+)?$")
+
+_project_locks: Dict[str, asyncio.Lock] = {}
+
+
+def npm_env() -> Dict[str, str]:
+    """Environment for npm subprocesses: shared cache, no audit/fund/update checks."""
+    NPM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    env = os.environ.copy()
+    env.update({
+        "npm_config_cache": str(NPM_CACHE_DIR),
+        "npm_config_audit": "false",
+        "npm_config_fund": "false",
+        "npm_config_update_notifier": "false",
+    })
+    return env
+
+
+def project_lock(directory: Path) -> asyncio.Lock:
+    """Lock serializing npm runs in one project directory."""
+    key = os.path.realpath(directory)
+    if key not in _project_locks:
+        _project_locks[key] = asyncio.Lock()
+    return _project_locks[key]
+
+
+def split_package_spec(spec: str) -> Tuple[str, Optional[str]]:
+    """
+    Split an npm package spec into name and requested version.
+
+    "react" -> ("react", None), "react@18.2.0" -> ("react", "18.2.0"),
+    "@tanstack/react-query@^5" -> ("@tanstack/react-query", "^5")
+    """
+    at = spec.rfind("@")
+    if at > 0:
+        return spec[:at], spec[at + 1:] or None
+    return spec, None
+
+
+def is_exact_version(version: Optional[str]) -> bool:
+    return bool(version) and bool(_EXACT_VERSION.match(version))
+
+
+def installed_version(directory: Path, name: str) -> Optional[str]:
+    """Version of `name` installed in directory/node_modules, from its package.json."""
+    manifest = directory / "node_modules" / Path(*name.split("/")) / "package.json"
+    try:
+        with open(manifest, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("name") != name:
+        return None
+    return data.get("version")
@@ -4,6 +4,7 @@ Integration Analyzer MCP Server - Template Comparison
 Provides tools for comparing projects against their templates.
 """
 
+import asyncio
 import json
 import os
 import sys
@@ -55,8 +56,8 @@ async def compare_with_template(workspace: str = ".") -> str:
         comparator = TemplateComparator()
         server_logger.info("[COMPARE_TEMPLATE] Running template comparison...")
         
-        # Compare using the baseline manifest
-        result = comparator.compare_with_manifest(str(workspace_path))
+        # Compare using the baseline manifest (walk + hashing off the event loop)
+        result = await asyncio.to_thread(comparator.compare_with_manifest, str(workspace_path))
         
         # Log the full JSON response for debugging
         server_logger.info(f"[COMPARE_TEMPLATE] Full result JSON: {json.dumps(result)}")
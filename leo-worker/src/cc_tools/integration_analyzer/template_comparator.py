@@ -7,13 +7,75 @@ Requires projects to have a .baseline_manifest.json file.
 import hashlib
 import json
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 
 # Get logger from the server's logging configuration
 logger = logging.getLogger("integration_analyzer.template_comparator")
 
+# Same exclusion rules as manifest generator: directories (pruned during the
+# walk) and files with these names (e.g. .env) are skipped
+IGNORE_NAMES = frozenset({
+    'node_modules', '.next', '.git', '.cache', 'dist', 'build',
+    'coverage', '.turbo', '.vercel', 'out', '.nuxt', '.vuepress',
+    '.docusaurus', '__pycache__', '.pytest_cache', '.mypy_cache',
+    '.tox', 'venv', 'env', '.env', '.venv'
+})
+
+# hashlib releases the GIL on large buffers, so hashing scales across threads
+HASH_WORKERS = min(8, os.cpu_count() or 4)
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# (path, mtime, size) -> sha256 cache, one file per project
+HASH_CACHE_DIR = Path(os.getenv("LEO_TEMPLATE_HASH_CACHE_DIR", Path.home() / ".cache" / "leo" / "template-hashes"))
+
+
+class FileHashCache:
+    """Persistent relative path -> (mtime_ns, size, sha256) cache for one project."""
+
+    def __init__(self, project_path: Path):
+        project_id = hashlib.sha256(str(project_path).encode()).hexdigest()[:16]
+        self.cache_path = HASH_CACHE_DIR / f"{project_id}.json"
+        try:
+            with open(self.cache_path, 'r') as f:
+                self._entries: Dict[str, List[Any]] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._entries = {}
+        self._dirty = False
+
+    def get(self, rel_path: str, st: os.stat_result) -> Optional[str]:
+        entry = self._entries.get(rel_path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        return None
+
+    def put(self, rel_path: str, st: os.stat_result, file_hash: str) -> None:
+        self._entries[rel_path] = [st.st_mtime_ns, st.st_size, file_hash]
+        self._dirty = True
+
+    def retain(self, rel_paths) -> None:
+        """Drop entries for files that no longer exist."""
+        stale = self._entries.keys() - set(rel_paths)
+        for rel_path in stale:
+            del self._entries[rel_path]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"[COMPARE] Could not save hash cache: {e}")
+
 
 class TemplateComparator:
     """Compare a project against its baseline manifest to identify custom code."""
@@ -77,10 +139,38 @@ class TemplateComparator:
         """Calculate SHA256 hash of a file."""
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
+            for byte_block in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
                 sha256_hash.update(byte_block)
         return sha256_hash.hexdigest()
     
+    def _hash_files(
+        self,
+        project_path: Path,
+        files: Dict[str, Tuple[Path, os.stat_result]]
+    ) -> Dict[str, str]:
+        """Hash files, reusing cached hashes for unchanged (mtime, size) and threading the rest."""
+        cache = FileHashCache(project_path)
+        hashes: Dict[str, str] = {}
+        to_hash = []
+        for rel_path, (file_path, st) in files.items():
+            cached = cache.get(rel_path, st)
+            if cached:
+                hashes[rel_path] = cached
+            else:
+                to_hash.append(rel_path)
+        
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+                computed = pool.map(lambda rel: self._calculate_file_hash(files[rel][0]), to_hash)
+                for rel_path, file_hash in zip(to_hash, computed):
+                    hashes[rel_path] = file_hash
+                    cache.put(rel_path, files[rel_path][1], file_hash)
+        
+        logger.info(f"[COMPARE] Hashed {len(to_hash)} files, {len(hashes) - len(to_hash)} from cache")
+        cache.retain(files.keys())
+        cache.save()
+        return hashes
+    
     def _compare_with_manifest(
         self, 
         project_path: Path, 
@@ -103,22 +193,28 @@ class TemplateComparator:
         
         # Get files from manifest
         manifest_files = manifest.get("files", {})
-        template_paths = set(manifest_files.keys())
         
         # Get project files
         project_files = self._get_project_files(project_path)
+        project_files.pop(".baseline_manifest.json", None)  # Skip comparing the manifest itself
         
-        # Compare each project file
-        for rel_path, file_path in project_files.items():
-            # Skip comparing the manifest itself
-            if rel_path == ".baseline_manifest.json":
+        # A size mismatch already proves a template file was modified; only hash the rest
+        to_hash = {}
+        for rel_path, (file_path, st) in project_files.items():
+            template_entry = manifest_files.get(rel_path)
+            if template_entry is None:
                 continue
-                
+            template_size = template_entry.get("size")
+            if template_size is None or template_size == st.st_size:
+                to_hash[rel_path] = (file_path, st)
+        hashes = self._hash_files(project_path, to_hash)
+        
+        # Compare each project file
+        for rel_path in sorted(project_files):
+            file_path, st = project_files[rel_path]
             result["summary"]["total_files"] += 1
             
-            if rel_path in template_paths:
-                # File exists in template, check if modified
-                file_hash = self._calculate_file_hash(file_path)
+            if rel_path in manifest_files:
                 # Support both 'sha256' and 'hash' field names for compatibility
                 template_entry = manifest_files[rel_path]
                 template_hash = template_entry.get("sha256") or template_entry.get("hash")
@@ -127,11 +223,12 @@ class TemplateComparator:
                 if template_hash == "template":
                     raise ValueError(f"Invalid manifest: placeholder hash found for {rel_path}. Please regenerate manifest with actual SHA256 hashes.")
                 
-                if file_hash != template_hash:
+                # Not hashed means the size already differed
+                if hashes.get(rel_path) != template_hash:
                     result["files"]["modified"].append({
                         "path": rel_path,
-                        "size": file_path.stat().st_size,
-                        "template_size": manifest_files[rel_path].get("size", 0)
+                        "size": st.st_size,
+                        "template_size": template_entry.get("size", 0)
                     })
                     result["summary"]["modified_files"] += 1
                 else:
@@ -140,33 +237,42 @@ class TemplateComparator:
                 # New file not in template
                 result["files"]["added"].append({
                     "path": rel_path,
-                    "size": file_path.stat().st_size
+                    "size": st.st_size
                 })
                 result["summary"]["added_files"] += 1
         
         return result
     
     
-    def _get_project_files(self, project_path: Path) -> Dict[str, Path]:
-        """Get all project files with relative paths."""
-        files = {}
+    def _get_project_files(self, project_path: Path) -> Dict[str, Tuple[Path, os.stat_result]]:
+        """
+        Get all project files with relative paths and their stat.
         
-        # Use same exclusion rules as manifest generator
-        ignore_patterns = {
-            'node_modules', '.next', '.git', '.cache', 'dist', 'build',
-            'coverage', '.turbo', '.vercel', 'out', '.nuxt', '.vuepress',
-            '.docusaurus', '__pycache__', '.pytest_cache', '.mypy_cache',
-            '.tox', 'venv', 'env', '.env', '.venv'
-        }
+        Ignored directories are pruned during the walk, so node_modules
+        and friends are never entered.
+        """
+        files = {}
+        stack = [(project_path, "")]
         
-        for file_path in project_path.rglob('*'):
-            if file_path.is_file():
-                # Check if any parent directory should be ignored
-                if any(part in ignore_patterns for part in file_path.parts):
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                entries = list(os.scandir(dir_path))
+            except OSError as e:
+                logger.warning(f"[COMPARE] Cannot read directory {dir_path}: {e}")
+                continue
+            
+            for entry in entries:
+                if entry.name in IGNORE_NAMES:
                     continue
-                
-                rel_path = str(file_path.relative_to(project_path))
-                files[rel_path] = file_path
+                rel_path = f"{rel_dir}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((Path(entry.path), rel_path + os.sep))
+                    elif entry.is_file():
+                        files[rel_path] = (Path(entry.path), entry.stat())
+                except OSError:
+                    continue  # Vanished or unreadable mid-walk
         
         return files
     
@@ -73,6 +73,16 @@ MCP_REGISTRY = {
         "description": "Code integration analysis and template comparison",
         "tags": ["analysis", "integration", "templates", "comparison"]
     },
+
+    "code_index": {
+        "type": "stdio",
+        "command": "uv",
+        "args": ["run", "python", "-m", "cc_tools.code_index.server"],
+        "env_vars": ["LEO_CODE_INDEX_DIR"],
+        "env_defaults": {},
+        "description": "Incremental code-structure index: symbols, importers, routes and API endpoint usage",
+        "tags": ["analysis", "code-understanding", "routes", "imports"]
+    },
     
     # ARCHIVED: graphiti moved to archive/cc_tools/graphiti/
     # "graphiti": {
@@ -16,6 +16,8 @@ from typing import Dict, List, Optional, Any
 import anyio
 from fastmcp import FastMCP
 
+from ..common.lint_cache import CACHE_DIR, LintBatchError, LintService
+
 # Set up logging
 logging.basicConfig(
     level=os.getenv('MCP_LOG_LEVEL', 'INFO'),
@@ -59,6 +61,32 @@ def install_oxc():
         raise
 
 
+async def _run_oxlint_batch(files: List[str], extra_args: tuple) -> Dict[str, List[dict]]:
+    """Run oxlint once over several files; diagnostics grouped by realpath."""
+    cmd = ["oxlint", *files, "--format=json", *extra_args]
+    logger.debug(f"[OXC] Running command: {' '.join(cmd)}")
+    result = await anyio.run_process(cmd, check=False)
+    try:
+        output = json.loads(result.stdout.decode())
+    except json.JSONDecodeError:
+        raise LintBatchError("oxlint output is not JSON", result.stdout.decode(), result.stderr.decode())
+
+    # OXC returns diagnostics in a nested structure
+    issues = output.get("diagnostics", []) if isinstance(output, dict) else output
+    by_file: Dict[str, List[dict]] = {}
+    for diagnostic in issues if isinstance(issues, list) else []:
+        if isinstance(diagnostic, dict):
+            by_file.setdefault(os.path.realpath(diagnostic.get("filename", "")), []).append(diagnostic)
+    return by_file
+
+
+# Cached, batched oxlint runs for lint_file, check_react_rules and lint_directory
+lint_service = LintService("oxc", _run_oxlint_batch, config_files=["oxlintrc.json", ".oxlintrc.json", ".oxlintrc"])
+
+JS_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs", ".mts", ".cts")
+
+
+
 @mcp.tool()
 async def lint_file(file_path: str, fix: bool = False, format: str = "json") -> str:
     """Lint a JavaScript/TypeScript file with OXC for ultra-fast feedback.
@@ -121,6 +149,16 @@ async def validate_config(directory: str, create_default: bool = False) -> str:
     """
     result = await _validate_config({"directory": directory, "create_default": create_default})
     return json.dumps(result, indent=2)
+
+
+@mcp.tool()
+async def lint_cache_stats() -> str:
+    """Show lint result cache and batching statistics.
+
+    Returns:
+        JSON string with cache hits, misses, hit rate and linter invocations
+    """
+    return json.dumps(lint_service.stats(), indent=2)
 # Keep the internal implementation functions below
 
 
@@ -155,6 +193,9 @@ async def _lint_file(args: dict) -> dict:
             "file": str(file_path)
         }
     
+    if output_format == "json" and not fix:
+        return await _lint_file_cached(file_path)
+    
     # Build oxlint command
     cmd = ["oxlint", str(file_path), f"--format={output_format}"]
     if fix:
@@ -217,8 +258,47 @@ async def _lint_file(args: dict) -> dict:
         }
 
 
+async def _lint_file_cached(file_path: Path) -> dict:
+    """JSON lint without --fix: served from the lint cache, batched with concurrent requests."""
+    start_time = anyio.current_time()
+    try:
+        issues, cached = await lint_service.lint_file(str(file_path))
+    except LintBatchError as e:
+        # Fallback for non-JSON output
+        return {
+            "file": str(file_path),
+            "elapsed_ms": int((anyio.current_time() - start_time) * 1000),
+            "output": e.stdout,
+            "errors": e.stderr
+        }
+    elapsed_ms = int((anyio.current_time() - start_time) * 1000)
+    
+    total_issues = len(issues)
+    errors = sum(1 for d in issues if d.get("severity") == "error")
+    warnings = sum(1 for d in issues if d.get("severity") == "warning")
+    
+    logger.info(f"[OXC] Found {total_issues} issues ({errors} errors, {warnings} warnings) in {file_path} ({elapsed_ms}ms, cached={cached})")
+    
+    return {
+        "file": str(file_path),
+        "elapsed_ms": elapsed_ms,
+        "fixed": False,
+        "cached": cached,
+        "diagnostics": {"diagnostics": issues, "number_of_files": 1},
+        "summary": {
+            "total_issues": total_issues,
+            "errors": errors,
+            "warnings": warnings
+        }
+    }
+
+
 async def _lint_directory(args: dict) -> dict:
-    """Lint all JavaScript/TypeScript files in a directory."""
+    """Lint all JavaScript/TypeScript files in a directory.
+
+    Without fix, only files whose content changed since the last run are
+    re-linted; cached results are merged in for the rest.
+    """
     directory = Path(args["directory"])
     fix = args.get("fix", False)
     ignore_patterns = args.get("ignore_patterns", ["node_modules", "dist", ".next", "build"])
@@ -232,15 +312,63 @@ async def _lint_directory(args: dict) -> dict:
             "directory": str(directory)
         }
     
+    if fix:
+        return await _fix_directory(directory, ignore_patterns)
+    
+    start_time = anyio.current_time()
+    try:
+        results, counts = await lint_service.lint_tree(str(directory), JS_EXTENSIONS, ignore_patterns)
+    except LintBatchError as e:
+        return {
+            "directory": str(directory),
+            "elapsed_ms": int((anyio.current_time() - start_time) * 1000),
+            "output": e.stdout,
+            "errors": e.stderr
+        }
+    elapsed_ms = int((anyio.current_time() - start_time) * 1000)
+    
+    # Group issues by file
+    issues_by_file = {
+        issues[0].get("filename", file_path): issues
+        for file_path, issues in results.items() if issues
+    }
+    issues = [d for file_issues in issues_by_file.values() for d in file_issues]
+    
+    total_issues = len(issues)
+    errors = sum(1 for d in issues if d.get("severity") == "error")
+    warnings = sum(1 for d in issues if d.get("severity") == "warning")
+    
+    logger.info(
+        f"[OXC] Directory {directory}: {len(issues_by_file)} files with issues, {total_issues} total issues "
+        f"({errors} errors, {warnings} warnings) in {elapsed_ms}ms, "
+        f"{counts['relinted']} re-linted, {counts['cached']} cached"
+    )
+    
+    return {
+        "directory": str(directory),
+        "elapsed_ms": elapsed_ms,
+        "fixed": False,
+        "files_checked": counts["files_checked"],
+        "files_relinted": counts["relinted"],
+        "files_cached": counts["cached"],
+        "total_issues": total_issues,
+        "issues_by_file": issues_by_file,
+        "summary": {
+            "errors": errors,
+            "warnings": warnings
+        }
+    }
+
+
+async def _fix_directory(directory: Path, ignore_patterns: List[str]) -> dict:
+    """Run `oxlint --fix` over a whole directory (rewrites files, never cached)."""
     # Build ignore arguments
     ignore_args = []
     for pattern in ignore_patterns:
         ignore_args.extend(["--ignore-pattern", pattern])
     
     # Build oxlint command
-    cmd = ["oxlint", str(directory), "--format=json"] + ignore_args
-    if fix:
-        cmd.append("--fix")
+    cmd = ["oxlint", str(directory), "--format=json"] + ignore_args + ["--fix"]
     
     # Run oxlint
     logger.debug(f"[OXC] Running command: {' '.join(cmd)}")
@@ -278,7 +406,7 @@ async def _lint_directory(args: dict) -> dict:
         return {
             "directory": str(directory),
             "elapsed_ms": elapsed_ms,
-            "fixed": fix,
+            "fixed": True,
             "files_checked": len(issues_by_file),
             "total_issues": total_issues,
             "issues_by_file": issues_by_file,
@@ -296,6 +424,33 @@ async def _lint_directory(args: dict) -> dict:
         }
 
 
+def _react_config_path(strict: bool) -> str:
+    """Path to the React rules config for this strictness, written once and reused.
+
+    A stable path keeps the oxlint arguments (and so the lint cache key) the
+    same across calls.
+    """
+    react_config = {
+        "rules": {
+            "react/jsx-uses-react": "error",
+            "react/jsx-uses-vars": "error",
+            "react-hooks/rules-of-hooks": "error",
+            "react-hooks/exhaustive-deps": "warn" if not strict else "error",
+            "react/jsx-key": "error",
+            "react/no-array-index-key": "warn" if not strict else "error",
+            "react/no-unstable-nested-components": "error"
+        }
+    }
+    content = json.dumps(react_config, sort_keys=True)
+    config_path = CACHE_DIR / f"oxc-react-{'strict' if strict else 'relaxed'}.json"
+    if not config_path.exists() or config_path.read_text() != content:
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', dir=config_path.parent, delete=False) as f:
+            f.write(content)
+        os.replace(f.name, config_path)
+    return str(config_path)
+
+
 async def _check_react_rules(args: dict) -> dict:
     """Check React-specific linting rules."""
     file_path = Path(args["file_path"])
@@ -310,79 +465,44 @@ async def _check_react_rules(args: dict) -> dict:
             "file": str(file_path)
         }
     
-    # Create temporary config for React rules
-    react_config = {
-        "rules": {
-            "react/jsx-uses-react": "error",
-            "react/jsx-uses-vars": "error",
-            "react-hooks/rules-of-hooks": "error",
-            "react-hooks/exhaustive-deps": "warn" if not strict else "error",
-            "react/jsx-key": "error",
-            "react/no-array-index-key": "warn" if not strict else "error",
-            "react/no-unstable-nested-components": "error"
+    # Run oxlint with React config
+    start_time = anyio.current_time()
+    try:
+        issues, cached = await lint_service.lint_file(str(file_path), ("--config", _react_config_path(strict)))
+    except LintBatchError as e:
+        return {
+            "file": str(file_path),
+            "elapsed_ms": int((anyio.current_time() - start_time) * 1000),
+            "output": e.stdout,
+            "errors": e.stderr
         }
-    }
+    elapsed_ms = int((anyio.current_time() - start_time) * 1000)
+    logger.info(f"[OXC] React check completed in {elapsed_ms}ms (cached={cached})")
     
-    # Write temporary config
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(react_config, f)
-        config_path = f.name
+    # Filter for React-specific issues
+    react_issues = [
+        d for d in issues
+        if any(rule in d.get("code", "") for rule in ["react", "jsx", "hooks"])
+    ]
     
-    try:
-        # Run oxlint with React config
-        cmd = ["oxlint", str(file_path), "--config", config_path, "--format=json"]
-        
-        logger.debug(f"[OXC] Running React check: {' '.join(cmd)}")
-        start_time = anyio.current_time()
-        result = await anyio.run_process(cmd, check=False)
-        elapsed_ms = int((anyio.current_time() - start_time) * 1000)
-        logger.info(f"[OXC] React check completed in {elapsed_ms}ms")
-        
-        # Parse results
-        try:
-            output = json.loads(result.stdout.decode()) if result.stdout else {}
-            
-            # OXC returns diagnostics in a nested structure
-            diagnostics = output.get("diagnostics", []) if isinstance(output, dict) else output
-            if isinstance(output, dict) and isinstance(diagnostics, list):
-                issues = diagnostics
-            else:
-                issues = output if isinstance(output, list) else []
-            
-            # Filter for React-specific issues
-            react_issues = [
-                d for d in issues 
-                if isinstance(d, dict) and 
-                any(rule in d.get("code", "") for rule in ["react", "jsx", "hooks"])
-            ]
-            
-            total_react_issues = len(react_issues)
-            hooks_violations = sum(1 for d in react_issues if "hooks" in d.get("ruleId", ""))
-            jsx_issues = sum(1 for d in react_issues if "jsx" in d.get("ruleId", ""))
-            
-            logger.info(f"[OXC] Found {total_react_issues} React issues ({hooks_violations} hooks, {jsx_issues} JSX) in {file_path}")
-            
-            return {
-                "file": str(file_path),
-                "elapsed_ms": elapsed_ms,
-                "strict_mode": strict,
-                "react_issues": react_issues,
-                "summary": {
-                    "total_react_issues": total_react_issues,
-                    "hooks_violations": hooks_violations,
-                    "jsx_issues": jsx_issues
-                }
-            }
-        except json.JSONDecodeError:
-            return {
-                "file": str(file_path),
-                "elapsed_ms": elapsed_ms,
-                "output": result.stdout.decode(),
-                "errors": result.stderr.decode()
-            }
-    finally:
-        # Clean up temp config
-        Path(config_path).unlink(missing_ok=True)
+    total_react_issues = len(react_issues)
+    hooks_violations = sum(1 for d in react_issues if "hooks" in d.get("ruleId", ""))
+    jsx_issues = sum(1 for d in react_issues if "jsx" in d.get("ruleId", ""))
+    
+    logger.info(f"[OXC] Found {total_react_issues} React issues ({hooks_violations} hooks, {jsx_issues} JSX) in {file_path}")
+    
+    return {
+        "file": str(file_path),
+        "elapsed_ms": elapsed_ms,
+        "strict_mode": strict,
+        "cached": cached,
+        "react_issues": react_issues,
+        "summary": {
+            "total_react_issues": total_react_issues,
+            "hooks_violations": hooks_violations,
+            "jsx_issues": jsx_issues
+        }
+    }
 
 
 async def _validate_config(args: dict) -> dict:
@@ -5,17 +5,28 @@ Provides secure, opinionated package management for frontend projects.
 - npm-only for consistency
 - Package validation against approved list
 - Non-Docker native implementation
+- Offline-first installs from a npm cache shared by all apps
 """
 
 import json
+import os
 import subprocess
 import asyncio
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 from fastmcp import FastMCP
 from ..common.logging_utils import setup_mcp_server_logging
+from ..common.npm import (
+    NPM_CACHE_DIR,
+    npm_env,
+    project_lock,
+    split_package_spec,
+    is_exact_version,
+    installed_version
+)
+from ..common.node_modules_snapshot import restore_node_modules
 
 # Set up logging
 server_logger = setup_mcp_server_logging("package_manager")
@@ -23,6 +34,12 @@ server_logger = setup_mcp_server_logging("package_manager")
 # Initialize the MCP server
 mcp = FastMCP("SecurePackageManager")
 
+# Concurrent registry fetches when falling back to per-package installs
+FETCH_CONCURRENCY = int(os.getenv("LEO_NPM_FETCH_CONCURRENCY", "4"))
+
+# npm errors meaning the cached registry metadata is stale (worth an online retry)
+STALE_METADATA_ERRORS = ("ETARGET", "notarget", "No matching version")
+
 class SecurePackageManager:
     def __init__(self):
         self.approved_packages = self._load_approved_packages()
@@ -210,6 +227,36 @@ async def _list_packages(work_dir: Path) -> Dict[str, Any]:
             "error": str(e)
         }
 
+async def _run_npm(args: List[str], work_dir: Path) -> Tuple[int, str, str]:
+    """Run npm with the shared cache. Returns (returncode, stdout, stderr)."""
+    process = await asyncio.create_subprocess_exec(
+        "npm", *args,
+        cwd=work_dir,
+        env=npm_env(),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    return process.returncode, stdout.decode(), stderr.decode()
+
+async def _npm_install(package_list: List[str], work_dir: Path, dev: bool) -> Tuple[int, str, str]:
+    """
+    npm install, offline-first: resolve from the shared cache and only go to
+    the registry for what's missing. Retries fully online only if the
+    cached metadata is stale (it doesn't know a newly published version);
+    other failures are returned as-is.
+    """
+    args = ["install"]
+    if dev:
+        args.append("--save-dev")
+    args.extend(package_list)
+
+    returncode, stdout, stderr = await _run_npm(args + ["--prefer-offline"], work_dir)
+    if returncode != 0 and any(marker in stderr for marker in STALE_METADATA_ERRORS):
+        server_logger.warning(f"[PACKAGE_MANAGEMENT] Cached npm metadata is stale, retrying online: {package_list}")
+        returncode, stdout, stderr = await _run_npm(args, work_dir)
+    return returncode, stdout, stderr
+
 async def _add_packages(package_list: List[str], work_dir: Path, dev: bool) -> Dict[str, Any]:
     """Add packages to the project."""
 
@@ -219,68 +266,61 @@ async def _add_packages(package_list: List[str], work_dir: Path, dev: bool) -> D
             "message": "No packages to install"
         }
 
-    # Build npm command - install whatever the agent requests
-    cmd = ["npm", "install"]
-    if dev:
-        cmd.append("--save-dev")
-    cmd.extend(package_list)
-    
-    server_logger.info(f"[PACKAGE_MANAGEMENT] Installing packages: {package_list}")
+    server_logger.info(f"[PACKAGE_MANAGEMENT] Installing packages: {package_list} (npm cache: {NPM_CACHE_DIR})")
 
     try:
-        # Run npm install
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=work_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+        async with project_lock(work_dir):
+            # Fresh app without node_modules: start from a snapshot instead of a full install
+            restored = await asyncio.to_thread(restore_node_modules, work_dir)
+            if restored:
+                server_logger.info(f"[PACKAGE_MANAGEMENT] Restored node_modules snapshot {restored['key']} (exact={restored['exact']})")
+            returncode, stdout, error_msg = await _npm_install(package_list, work_dir, dev)
 
-        stdout, stderr = await process.communicate()
+            if returncode == 0:
+                # Verify installation
+                verified, installed, missing = _verify_package_installation(package_list, work_dir)
+
+                if verified:
+                    message = f"✅ Successfully added packages: {', '.join(package_list)}"
+                    server_logger.info(f"[PACKAGE_MANAGEMENT] Successfully installed: {package_list}")
+                    return {
+                        "success": True,
+                        "message": message,
+                        "installed": package_list,
+                        "versions": _installed_versions(package_list, work_dir),
+                        "output": stdout
+                    }
+                else:
+                    # Some packages didn't get installed properly
+                    message = f"⚠️ Partial installation. Missing: {', '.join(missing)}"
+                    return {
+                        "success": False,
+                        "message": message,
+                        "installed": installed,
+                        "missing": missing,
+                        "output": stdout
+                    }
 
-        if process.returncode == 0:
-            # Verify installation
-            verified, installed, missing = _verify_package_installation(package_list, work_dir)
-
-            if verified:
-                message = f"✅ Successfully added packages: {', '.join(package_list)}"
-                server_logger.info(f"[PACKAGE_MANAGEMENT] Successfully installed: {package_list}")
-                return {
-                    "success": True,
-                    "message": message,
-                    "installed": package_list,
-                    "output": stdout.decode()
-                }
-            else:
-                # Some packages didn't get installed properly
-                message = f"⚠️ Partial installation. Missing: {', '.join(missing)}"
-                return {
-                    "success": False,
-                    "message": message,
-                    "installed": installed,
-                    "missing": missing,
-                    "output": stdout.decode()
-                }
-        else:
-            error_msg = stderr.decode()
             server_logger.error(f"[PACKAGE_MANAGEMENT] Installation failed: {error_msg}")
 
             # Try individual installation as fallback
             remaining_missing = await _install_packages_individually(package_list, work_dir, dev)
 
-            if not remaining_missing:
-                return {
-                    "success": True,
-                    "message": f"✅ Successfully added all packages after individual installation",
-                    "installed": package_list,
-                    "original_error": error_msg
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": f"❌ Failed to add packages: {error_msg}",
-                    "error": error_msg
-                }
+        if not remaining_missing:
+            return {
+                "success": True,
+                "message": f"✅ Successfully added all packages after individual installation",
+                "installed": package_list,
+                "versions": _installed_versions(package_list, work_dir),
+                "original_error": error_msg
+            }
+        else:
+            return {
+                "success": False,
+                "message": f"❌ Failed to add packages: {error_msg}",
+                "missing": remaining_missing,
+                "error": error_msg
+            }
                 
     except Exception as e:
         server_logger.error(f"[PACKAGE_MANAGEMENT] Exception during installation: {e}")
@@ -293,30 +333,22 @@ async def _add_packages(package_list: List[str], work_dir: Path, dev: bool) -> D
 async def _remove_packages(package_list: List[str], work_dir: Path) -> Dict[str, Any]:
     """Remove packages from the project."""
     
-    cmd = ["npm", "uninstall"] + package_list
     server_logger.info(f"[PACKAGE_MANAGEMENT] Removing packages: {package_list}")
     
     try:
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=work_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        
-        stdout, stderr = await process.communicate()
+        async with project_lock(work_dir):
+            returncode, stdout, error_msg = await _run_npm(["uninstall"] + package_list, work_dir)
         
-        if process.returncode == 0:
+        if returncode == 0:
             message = f"✅ Successfully removed packages: {', '.join(package_list)}"
             server_logger.info(f"[PACKAGE_MANAGEMENT] Successfully removed: {package_list}")
             return {
                 "success": True,
                 "message": message,
                 "removed": package_list,
-                "output": stdout.decode()
+                "output": stdout
             }
         else:
-            error_msg = stderr.decode()
             server_logger.error(f"[PACKAGE_MANAGEMENT] Removal failed: {error_msg}")
             return {
                 "success": False,
@@ -333,53 +365,68 @@ async def _remove_packages(package_list: List[str], work_dir: Path) -> Dict[str,
         }
 
 def _verify_package_installation(packages: List[str], directory: Path) -> tuple[bool, List[str], List[str]]:
-    """Verify that packages are actually installed by checking node_modules."""
+    """
+    Verify that packages are actually installed by reading
+    node_modules/<pkg>/package.json. Exact version requests (react@18.2.0)
+    must match the installed version.
+    """
     installed = []
     missing = []
     
     for package in packages:
-        # Extract package name without version
-        base_name = package.split('@')[0] if '@' in package[1:] else package
+        name, requested = split_package_spec(package)
+        version = installed_version(directory, name)
         
-        # Handle scoped packages like @tanstack/react-query
-        if base_name.startswith('@'):
-            parts = base_name.split('/')
-            if len(parts) > 1:
-                scope, pkg_name = parts
-                path_to_check = directory / 'node_modules' / scope / pkg_name
-            else:
-                path_to_check = directory / 'node_modules' / base_name
+        if version is None:
+            missing.append(package)
+        elif is_exact_version(requested) and version != requested:
+            server_logger.warning(f"[PACKAGE_MANAGEMENT] {name}: requested {requested}, installed {version}")
+            missing.append(package)
         else:
-            path_to_check = directory / 'node_modules' / base_name
-        
-        if path_to_check.exists():
             installed.append(package)
-        else:
-            missing.append(package)
     
     return len(missing) == 0, installed, missing
 
+def _installed_versions(packages: List[str], directory: Path) -> Dict[str, Optional[str]]:
+    """Installed version of each package, by package name."""
+    names = [split_package_spec(package)[0] for package in packages]
+    return {name: installed_version(directory, name) for name in names}
+
 async def _install_packages_individually(packages: List[str], work_dir: Path, dev: bool) -> List[str]:
-    """Try to install packages one by one as a fallback."""
-    still_missing = []
+    """
+    Try to install packages one by one as a fallback.
     
-    for package in packages:
-        cmd = ["npm", "install"]
+    Each package is first fetched into the shared npm cache, concurrently
+    (bounded by FETCH_CONCURRENCY); packages the registry can't resolve fail
+    there without touching the project. The resolvable ones are then
+    installed one at a time from the warm cache. The caller holds the
+    project lock.
+    """
+    fetch_slots = asyncio.Semaphore(FETCH_CONCURRENCY)
+    
+    async def fetch(package: str) -> bool:
+        async with fetch_slots:
+            try:
+                returncode, _, stderr = await _run_npm(["cache", "add", package], work_dir)
+            except Exception as e:
+                stderr, returncode = str(e), 1
+            if returncode != 0:
+                server_logger.warning(f"[PACKAGE_MANAGEMENT] Could not fetch {package}: {stderr.strip()}")
+            return returncode == 0
+    
+    fetched = await asyncio.gather(*(fetch(package) for package in packages))
+    still_missing = [package for package, ok in zip(packages, fetched) if not ok]
+    
+    for package in [package for package, ok in zip(packages, fetched) if ok]:
+        args = ["install"]
         if dev:
-            cmd.append("--save-dev")
-        cmd.append(package)
+            args.append("--save-dev")
+        args.extend([package, "--prefer-offline"])
         
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=work_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await process.communicate()
+            returncode, _, _ = await _run_npm(args, work_dir)
             
-            if process.returncode != 0:
+            if returncode != 0:
                 still_missing.append(package)
                 continue
             
@@ -16,6 +16,8 @@ from typing import Dict, List, Optional, Any
 import anyio
 from fastmcp import FastMCP
 
+from ..common.lint_cache import LintBatchError, LintService
+
 # Set up logging
 logging.basicConfig(
     level=os.getenv('MCP_LOG_LEVEL', 'INFO'),
@@ -30,6 +32,29 @@ mcp = FastMCP("Ruff Ultra-Fast Python Linter")
 # No need for runtime installation checks
 
 
+async def _run_ruff_batch(files: List[str], extra_args: tuple) -> Dict[str, List[dict]]:
+    """Run `ruff check` once over several files; raw diagnostics grouped by realpath."""
+    cmd = ["ruff", "check", *files, "--output-format=json", *extra_args]
+    logger.debug(f"[RUFF] Running command: {' '.join(cmd)}")
+    result = await anyio.run_process(cmd, check=False)
+    # Exit code 1 just means issues were found
+    if result.returncode not in (0, 1):
+        raise LintBatchError(f"ruff exited with {result.returncode}", result.stdout.decode(), result.stderr.decode())
+    try:
+        output = json.loads(result.stdout.decode()) if result.stdout else []
+    except json.JSONDecodeError:
+        raise LintBatchError("ruff output is not JSON", result.stdout.decode(), result.stderr.decode())
+
+    by_file: Dict[str, List[dict]] = {}
+    for diagnostic in output:
+        by_file.setdefault(os.path.realpath(diagnostic.get("filename", "")), []).append(diagnostic)
+    return by_file
+
+
+# Cached, batched `ruff check` for lint_file, check_imports, check_typing and lint_directory
+lint_service = LintService("ruff", _run_ruff_batch, config_files=["pyproject.toml", "ruff.toml", ".ruff.toml"])
+
+
 @mcp.tool()
 async def lint_file(file_path: str, fix: bool = False, format: str = "json", select: List[str] = None) -> str:
     """Lint a Python file with Ruff for ultra-fast feedback.
@@ -110,12 +135,44 @@ async def check_typing(file_path: str, target_version: str = "py312") -> str:
     """
     result = await _check_typing({"file_path": file_path, "target_version": target_version})
     return json.dumps(result, indent=2)
+
+
+@mcp.tool()
+async def lint_cache_stats() -> str:
+    """Show lint result cache and batching statistics.
+
+    Returns:
+        JSON string with cache hits, misses, hit rate and linter invocations
+    """
+    return json.dumps(lint_service.stats(), indent=2)
 # Keep the internal implementation functions below
 
 
 # Internal implementation functions
 
 
+async def _run_check(file_path: Path, extra_args: tuple, fix: bool = False) -> tuple:
+    """Run `ruff check` on one file and return (diagnostics, served_from_cache).
+
+    Plain checks go through the shared lint cache, so concurrent requests are
+    batched and unchanged files are never re-linted. --fix rewrites the file
+    and always runs directly.
+
+    Raises:
+        LintBatchError: ruff failed or produced non-JSON output
+    """
+    if not fix:
+        return await lint_service.lint_file(str(file_path), extra_args)
+
+    cmd = ["ruff", "check", str(file_path), "--output-format=json", *extra_args, "--fix"]
+    logger.debug(f"[RUFF] Running command: {' '.join(cmd)}")
+    result = await anyio.run_process(cmd, check=False)
+    try:
+        return (json.loads(result.stdout.decode()) if result.stdout else []), False
+    except json.JSONDecodeError:
+        raise LintBatchError("ruff output is not JSON", result.stdout.decode(), result.stderr.decode())
+
+
 async def _lint_file(args: dict) -> dict:
     """Lint a single Python file."""
     file_path = Path(args["file_path"])
@@ -144,64 +201,19 @@ async def _lint_file(args: dict) -> dict:
             "file": str(file_path)
         }
     
-    # Build ruff command
-    cmd = ["ruff", "check", str(file_path), f"--output-format={output_format}"]
-    if fix:
-        cmd.append("--fix")
-    if select_rules:
-        cmd.extend(["--select", ",".join(select_rules)])
-    
-    # Run ruff
-    logger.debug(f"[RUFF] Running command: {' '.join(cmd)}")
-    start_time = anyio.current_time()
-    result = await anyio.run_process(cmd, check=False)
-    elapsed_ms = int((anyio.current_time() - start_time) * 1000)
-    logger.info(f"[RUFF] Lint completed in {elapsed_ms}ms for {file_path}")
-    
-    if output_format == "json":
-        try:
-            # Parse JSON output
-            output = json.loads(result.stdout.decode()) if result.stdout else []
-            
-            # Process diagnostics
-            issues = []
-            for diagnostic in output:
-                issues.append({
-                    "code": diagnostic.get("code"),
-                    "message": diagnostic.get("message"),
-                    "location": {
-                        "file": diagnostic.get("filename"),
-                        "line": diagnostic.get("location", {}).get("row"),
-                        "column": diagnostic.get("location", {}).get("column")
-                    },
-                    "end_location": {
-                        "line": diagnostic.get("end_location", {}).get("row"),
-                        "column": diagnostic.get("end_location", {}).get("column")
-                    },
-                    "fix": diagnostic.get("fix"),
-                    "url": diagnostic.get("url")
-                })
-            
-            return {
-                "file": str(file_path),
-                "elapsed_ms": elapsed_ms,
-                "fixed": fix,
-                "issues": issues,
-                "summary": {
-                    "total_issues": len(issues),
-                    "fixable": sum(1 for i in issues if i.get("fix") is not None)
-                }
-            }
-        except json.JSONDecodeError:
-            # Fallback for non-JSON output
-            return {
-                "file": str(file_path),
-                "elapsed_ms": elapsed_ms,
-                "output": result.stdout.decode(),
-                "errors": result.stderr.decode()
-            }
-    else:
-        # Return raw output for other formats
+    if output_format != "json":
+        # Raw output for other formats
+        cmd = ["ruff", "check", str(file_path), f"--output-format={output_format}"]
+        if fix:
+            cmd.append("--fix")
+        if select_rules:
+            cmd.extend(["--select", ",".join(select_rules)])
+        
+        logger.debug(f"[RUFF] Running command: {' '.join(cmd)}")
+        start_time = anyio.current_time()
+        result = await anyio.run_process(cmd, check=False)
+        elapsed_ms = int((anyio.current_time() - start_time) * 1000)
+        logger.info(f"[RUFF] Lint completed in {elapsed_ms}ms for {file_path}")
         return {
             "file": str(file_path),
             "elapsed_ms": elapsed_ms,
@@ -209,6 +221,52 @@ async def _lint_file(args: dict) -> dict:
             "errors": result.stderr.decode(),
             "exit_code": result.returncode
         }
+    
+    extra_args = ("--select", ",".join(select_rules)) if select_rules else ()
+    start_time = anyio.current_time()
+    try:
+        output, cached = await _run_check(file_path, extra_args, fix)
+    except LintBatchError as e:
+        # Fallback for non-JSON output
+        return {
+            "file": str(file_path),
+            "elapsed_ms": int((anyio.current_time() - start_time) * 1000),
+            "output": e.stdout,
+            "errors": e.stderr
+        }
+    elapsed_ms = int((anyio.current_time() - start_time) * 1000)
+    logger.info(f"[RUFF] Lint completed in {elapsed_ms}ms for {file_path} (cached={cached})")
+    
+    # Process diagnostics
+    issues = []
+    for diagnostic in output:
+        issues.append({
+            "code": diagnostic.get("code"),
+            "message": diagnostic.get("message"),
+            "location": {
+                "file": diagnostic.get("filename"),
+                "line": diagnostic.get("location", {}).get("row"),
+                "column": diagnostic.get("location", {}).get("column")
+            },
+            "end_location": {
+                "line": diagnostic.get("end_location", {}).get("row"),
+                "column": diagnostic.get("end_location", {}).get("column")
+            },
+            "fix": diagnostic.get("fix"),
+            "url": diagnostic.get("url")
+        })
+    
+    return {
+        "file": str(file_path),
+        "elapsed_ms": elapsed_ms,
+        "fixed": fix,
+        "cached": cached,
+        "issues": issues,
+        "summary": {
+            "total_issues": len(issues),
+            "fixable": sum(1 for i in issues if i.get("fix") is not None)
+        }
+    }
 
 
 async def _format_file(args: dict) -> dict:
@@ -243,7 +301,11 @@ async def _format_file(args: dict) -> dict:
 
 
 async def _lint_directory(args: dict) -> dict:
-    """Lint all Python files in a directory."""
+    """Lint all Python files in a directory.
+
+    Without fix, only files whose content changed since the last run are
+    re-linted; cached results are merged in for the rest.
+    """
     directory = Path(args["directory"])
     fix = args.get("fix", False)
     exclude_patterns = args.get("exclude", ["__pycache__", ".venv", "venv", "build", "dist"])
@@ -254,10 +316,62 @@ async def _lint_directory(args: dict) -> dict:
             "directory": str(directory)
         }
     
-    # Build ruff command
-    cmd = ["ruff", "check", str(directory), "--output-format=json"]
     if fix:
-        cmd.append("--fix")
+        return await _fix_directory(directory, exclude_patterns)
+    
+    start_time = anyio.current_time()
+    try:
+        # --force-exclude: ruff's own and pyproject excludes also apply to the explicit paths
+        results, counts = await lint_service.lint_tree(
+            str(directory), (".py", ".pyi"), exclude_patterns, args=("--force-exclude",)
+        )
+    except LintBatchError as e:
+        return {
+            "directory": str(directory),
+            "elapsed_ms": int((anyio.current_time() - start_time) * 1000),
+            "output": e.stdout,
+            "errors": e.stderr
+        }
+    elapsed_ms = int((anyio.current_time() - start_time) * 1000)
+    logger.info(f"[RUFF] Directory lint completed in {elapsed_ms}ms ({counts['relinted']} re-linted, {counts['cached']} cached)")
+    
+    # Group issues by file
+    issues_by_file = {}
+    fixable_issues = 0
+    for file_path, diagnostics in results.items():
+        if not diagnostics:
+            continue
+        issues_by_file[diagnostics[0].get("filename", file_path)] = [
+            {
+                "code": diagnostic.get("code"),
+                "message": diagnostic.get("message"),
+                "line": diagnostic.get("location", {}).get("row"),
+                "column": diagnostic.get("location", {}).get("column")
+            }
+            for diagnostic in diagnostics
+        ]
+        fixable_issues += sum(1 for d in diagnostics if d.get("fix") is not None)
+    
+    return {
+        "directory": str(directory),
+        "elapsed_ms": elapsed_ms,
+        "fixed": False,
+        "files_checked": counts["files_checked"],
+        "files_relinted": counts["relinted"],
+        "files_cached": counts["cached"],
+        "total_issues": sum(len(issues) for issues in issues_by_file.values()),
+        "issues_by_file": issues_by_file,
+        "summary": {
+            "files_with_issues": len(issues_by_file),
+            "clean_files": counts["files_checked"] - len(issues_by_file),
+            "fixable_issues": fixable_issues
+        }
+    }
+
+
+async def _fix_directory(directory: Path, exclude_patterns: List[str]) -> dict:
+    """Run `ruff check --fix` over a whole directory (rewrites files, never cached)."""
+    cmd = ["ruff", "check", str(directory), "--output-format=json", "--fix"]
     
     # Add exclude patterns
     for pattern in exclude_patterns:
@@ -290,7 +404,7 @@ async def _lint_directory(args: dict) -> dict:
         return {
             "directory": str(directory),
             "elapsed_ms": elapsed_ms,
-            "fixed": fix,
+            "fixed": True,
             "files_checked": len(issues_by_file),
             "total_issues": len(output),
             "issues_by_file": issues_by_file,
@@ -321,16 +435,10 @@ async def _check_imports(args: dict) -> dict:
         }
     
     # Run ruff with import sorting rules
-    cmd = ["ruff", "check", str(file_path), "--select=I", "--output-format=json"]
-    if fix:
-        cmd.append("--fix")
-    
     start_time = anyio.current_time()
-    result = await anyio.run_process(cmd, check=False)
-    elapsed_ms = int((anyio.current_time() - start_time) * 1000)
-    
     try:
-        output = json.loads(result.stdout.decode()) if result.stdout else []
+        output, cached = await _run_check(file_path, ("--select=I",), fix)
+        elapsed_ms = int((anyio.current_time() - start_time) * 1000)
         
         import_issues = []
         for diagnostic in output:
@@ -345,18 +453,19 @@ async def _check_imports(args: dict) -> dict:
             "file": str(file_path),
             "elapsed_ms": elapsed_ms,
             "fixed": fix,
+            "cached": cached,
             "import_issues": import_issues,
             "summary": {
                 "total_import_issues": len(import_issues),
                 "needs_sorting": len(import_issues) > 0
             }
         }
-    except json.JSONDecodeError:
+    except LintBatchError as e:
         return {
             "file": str(file_path),
-            "elapsed_ms": elapsed_ms,
-            "output": result.stdout.decode(),
-            "errors": result.stderr.decode()
+            "elapsed_ms": int((anyio.current_time() - start_time) * 1000),
+            "output": e.stdout,
+            "errors": e.stderr
         }
 
 
@@ -372,19 +481,15 @@ async def _check_typing(args: dict) -> dict:
         }
     
     # Run ruff with typing and upgrade rules
-    cmd = [
-        "ruff", "check", str(file_path),
+    extra_args = (
         "--select=UP,TCH,ANN",  # pyupgrade, type-checking, annotations
         f"--target-version={target_version}",
-        "--output-format=json"
-    ]
+    )
     
     start_time = anyio.current_time()
-    result = await anyio.run_process(cmd, check=False)
-    elapsed_ms = int((anyio.current_time() - start_time) * 1000)
-    
     try:
-        output = json.loads(result.stdout.decode()) if result.stdout else []
+        output, cached = await _run_check(file_path, extra_args)
+        elapsed_ms = int((anyio.current_time() - start_time) * 1000)
         
         typing_issues = {
             "upgrade_suggestions": [],
@@ -411,6 +516,7 @@ async def _check_typing(args: dict) -> dict:
             "file": str(file_path),
             "elapsed_ms": elapsed_ms,
             "target_version": target_version,
+            "cached": cached,
             "typing_issues": typing_issues,
             "summary": {
                 "total_issues": len(output),
@@ -419,12 +525,12 @@ async def _check_typing(args: dict) -> dict:
                 "missing_annotations": len(typing_issues["missing_annotations"])
             }
         }
-    except json.JSONDecodeError:
+    except LintBatchError as e:
         return {
             "file": str(file_path),
-            "elapsed_ms": elapsed_ms,
-            "output": result.stdout.decode(),
-            "errors": result.stderr.decode()
+            "elapsed_ms": int((anyio.current_time() - start_time) * 1000),
+            "output": e.stdout,
+            "errors": e.stderr
         }
 
 
@@ -82,6 +82,9 @@ class ShadcnMCPServer:
             "loading-spinner"
         }
         
+        # Parsed package.json / components.json, keyed by path: (mtime_ns, size, data)
+        self._json_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+        
         self.logger.info(f"[SERVER_INIT] Pre-installed components: {len(self.PRE_INSTALLED_COMPONENTS)}")
         self.logger.debug(f"[SERVER_INIT] Components: {sorted(self.PRE_INSTALLED_COMPONENTS)}")
         
@@ -198,45 +201,29 @@ Core dependencies like class-variance-authority will be automatically installed
             self.logger.warning(f"[VALIDATION] Skipping invalid components: {invalid_components}")
             self.logger.debug(f"[VALIDATION] Suggestions: {suggestions}")
         
-        # Install core dependencies if needed
-        self.logger.info(f"[DEPENDENCIES] Checking core dependencies: {self.CORE_DEPENDENCIES}")
-        installed_deps = []
-        for dep in self.CORE_DEPENDENCIES:
-            if not self._is_dependency_installed(dep):
-                self.logger.info(f"[DEPENDENCIES] Installing core dependency: {dep}")
-                # Use npm (standard Node.js package manager)
-                cmd = ["npm", "install", dep, "--no-audit", "--no-fund"]
-                self.logger.debug(f"[DEPENDENCIES] Running command: {' '.join(cmd)}")
-                success, stdout, stderr = await self._run_native_command_with_timeout(
-                    cmd,
-                    cwd=os.getcwd(),
-                    timeout=90  # 90 second timeout for dependency installation
-                )
-                if success:
-                    installed_deps.append(dep)
-                    self.logger.info(f"[DEPENDENCIES] Successfully installed: {dep}")
-                else:
-                    self.logger.warning(f"[DEPENDENCIES] Failed to install {dep}: {stderr}")
-            else:
-                self.logger.debug(f"[DEPENDENCIES] Already installed: {dep}")
-        
-        # Check if any components need lucide-react
+        # Install all missing dependencies (core + lucide-react for icon components) in one npm run
         needs_icons = any(c in self.COMPONENTS_REQUIRING_ICONS for c in valid_components)
-        if needs_icons and not self._is_dependency_installed("lucide-react"):
-            self.logger.info(f"[DEPENDENCIES] Installing lucide-react for icon components (needs_icons={needs_icons})")
+        required_deps = self.CORE_DEPENDENCIES + (["lucide-react"] if needs_icons else [])
+        self.logger.info(f"[DEPENDENCIES] Checking dependencies: {required_deps} (needs_icons={needs_icons})")
+        missing_deps = [dep for dep in required_deps if not self._is_dependency_installed(dep)]
+        installed_deps = []
+        if missing_deps:
+            self.logger.info(f"[DEPENDENCIES] Installing missing dependencies: {', '.join(missing_deps)}")
             # Use npm (standard Node.js package manager)
-            cmd = ["npm", "install", "lucide-react", "--no-audit", "--no-fund"]
+            cmd = ["npm", "install"] + missing_deps + ["--no-audit", "--no-fund"]
             self.logger.debug(f"[DEPENDENCIES] Running command: {' '.join(cmd)}")
             success, stdout, stderr = await self._run_native_command_with_timeout(
                 cmd,
                 cwd=os.getcwd(),
-                timeout=90  # 90 second timeout for dependency installation
+                timeout=90 + 30 * (len(missing_deps) - 1)  # One npm startup, a little extra per package
             )
             if success:
-                installed_deps.append("lucide-react")
-                self.logger.info(f"[DEPENDENCIES] Successfully installed lucide-react")
+                installed_deps.extend(missing_deps)
+                self.logger.info(f"[DEPENDENCIES] Successfully installed: {', '.join(missing_deps)}")
             else:
-                self.logger.warning(f"[DEPENDENCIES] Failed to install lucide-react: {stderr}")
+                self.logger.warning(f"[DEPENDENCIES] Failed to install {', '.join(missing_deps)}: {stderr}")
+        else:
+            self.logger.debug(f"[DEPENDENCIES] All dependencies already installed")
         
         # Filter out pre-installed and already installed components
         new_components = []
@@ -345,32 +332,58 @@ Core dependencies like class-variance-authority will be automatically installed
                 "results": results
             }
     
-    def _is_dependency_installed(self, dependency: str) -> bool:
-        """Check if a dependency is installed in the project."""
-        package_json_path = Path(os.getcwd()) / "package.json"
-        if not package_json_path.exists():
-            return False
-            
+    def _read_project_json(self, filename: str) -> Optional[Dict[str, Any]]:
+        """Parsed JSON file from the project root, re-read only when its mtime/size changes."""
+        path = Path(os.getcwd()) / filename
         try:
-            with open(package_json_path, 'r') as f:
-                package_data = json.load(f)
-                
-            deps = package_data.get("dependencies", {})
-            dev_deps = package_data.get("devDependencies", {})
-            
-            return dependency in deps or dependency in dev_deps
-                
+            st = path.stat()
+        except OSError:
+            self._json_cache.pop(path, None)
+            return None
+        
+        cached = self._json_cache.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
         except Exception as e:
-            self.logger.error(f"Error checking dependency {dependency}: {str(e)}")
+            self.logger.error(f"Error reading {filename}: {str(e)}")
+            self._json_cache.pop(path, None)
+            return None
+        
+        self._json_cache[path] = (st.st_mtime_ns, st.st_size, data)
+        self.logger.debug(f"[CACHE] Loaded {filename}")
+        return data
+    
+    def _is_dependency_installed(self, dependency: str) -> bool:
+        """Check if a dependency is installed in the project."""
+        package_data = self._read_project_json("package.json")
+        if not package_data:
             return False
+        
+        deps = package_data.get("dependencies", {})
+        dev_deps = package_data.get("devDependencies", {})
+        
+        return dependency in deps or dependency in dev_deps
     
     
+    def _ui_component_dirs(self) -> List[Path]:
+        """Directories where ShadCN UI components may live, from components.json's ui alias."""
+        cwd = Path(os.getcwd())
+        dirs = [cwd / "components" / "ui"]  # Standard ShadCN component location
+        
+        ui_alias = ((self._read_project_json("components.json") or {}).get("aliases") or {}).get("ui")
+        if isinstance(ui_alias, str) and ui_alias.startswith("@/"):
+            # "@/" usually maps to the project root or its src/ directory
+            relative = ui_alias[2:]
+            dirs = [cwd / relative, cwd / "src" / relative, cwd / "client" / "src" / relative] + dirs
+        return dirs
+    
     def _is_component_installed(self, component: str) -> bool:
         """Check if a ShadCN component is already installed."""
-        # Standard ShadCN component location
-        component_path = Path(os.getcwd()) / "components" / "ui" / f"{component}.tsx"
-        
-        return component_path.exists()
+        return any((ui_dir / f"{component}.tsx").exists() for ui_dir in self._ui_component_dirs())
     
     
     def _project_exists(self, project_file: str = "package.json") -> bool:
@@ -7,10 +7,11 @@ Uses ONLY the Supabase Management API (no CLI for critical operations).
 Flow:
 1. Get organization (API)
 2. Create project (API)
-3. Poll for ACTIVE_HEALTHY status (API)
+3. Poll for ACTIVE_HEALTHY status (API, adaptive backoff)
 4. Get pooler URL (API)
 5. Get API keys (API)
 6. Disable email confirmations (API)
+   (4-6 run concurrently)
 7. Generate .env file
 8. Optional: init local supabase/ directory
 """
@@ -25,7 +26,7 @@ import string
 import time
 import aiohttp
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from fastmcp import FastMCP
 from ..common.logging_utils import setup_mcp_server_logging
@@ -34,15 +35,33 @@ from ..common.logging_utils import setup_mcp_server_logging
 server_logger = setup_mcp_server_logging("supabase_setup")
 server_logger.info("[SERVER_INIT] Supabase Setup MCP server module loaded")
 
-# Supabase Management API base URL
-SUPABASE_API_URL = "https://api.supabase.com/v1"
+# Supabase Management API base URL (overridable to point at a local stub)
+SUPABASE_API_URL = os.environ.get("SUPABASE_API_URL", "https://api.supabase.com/v1")
+
+# Status polling: start fast, back off while the project is still coming up
+POLL_INITIAL_INTERVAL = 2.0
+POLL_MAX_INTERVAL = 15.0
+POLL_BACKOFF = 1.5
+MAX_WAIT_SECONDS = 300
 
 
 class SupabaseSetupMCPServer:
     """MCP Server for autonomous Supabase project setup using Management API."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        api_url: str = SUPABASE_API_URL,
+        poll_initial_interval: float = POLL_INITIAL_INTERVAL,
+        poll_max_interval: float = POLL_MAX_INTERVAL,
+        poll_backoff: float = POLL_BACKOFF,
+        max_wait: float = MAX_WAIT_SECONDS
+    ):
         self.logger = server_logger
+        self.api_url = api_url
+        self.poll_initial_interval = poll_initial_interval
+        self.poll_max_interval = poll_max_interval
+        self.poll_backoff = poll_backoff
+        self.max_wait = max_wait
         self.logger.info("[SERVER_INIT] Starting Supabase Setup MCP Server initialization")
 
         try:
@@ -89,6 +108,8 @@ class SupabaseSetupMCPServer:
             7. Creates .env file with all credentials
             8. Optionally initializes local supabase/ directory
 
+            Steps 4-6 run concurrently once the project is ready.
+
             Prerequisites:
             - SUPABASE_ACCESS_TOKEN environment variable must be set
 
@@ -108,182 +129,167 @@ class SupabaseSetupMCPServer:
                 - database_url: Database connection string (pooler)
                 - pooler_host: The pooler host (e.g., aws-1-us-east-1.pooler.supabase.com)
                 - storage_mode: Storage mode ("database")
+                - timings: Seconds spent in each provisioning phase
                 - output: Detailed execution log
             """
             self.logger.info(f"[TOOL_CALL] create_supabase_project invoked: app_name={app_name}, directory={app_directory}")
+            return await self.provision_project(app_name, app_directory, schema_sql, region)
+
+    async def provision_project(
+        self,
+        app_name: str,
+        app_directory: str,
+        schema_sql: Optional[str] = None,
+        region: str = "us-east-1"
+    ) -> Dict[str, Any]:
+        """Provisioning pipeline behind create_supabase_project (see its docstring)."""
+        output_log = []
+        timings: Dict[str, float] = {}
+        started = time.monotonic()
+
+        def fail(error: str) -> Dict[str, Any]:
+            timings["total"] = round(time.monotonic() - started, 2)
+            return {
+                "success": False,
+                "error": error,
+                "timings": timings,
+                "output": "\n".join(output_log)
+            }
+
+        # Check for SUPABASE_ACCESS_TOKEN
+        access_token = os.environ.get('SUPABASE_ACCESS_TOKEN')
+        if not access_token:
+            return {
+                "success": False,
+                "error": "SUPABASE_ACCESS_TOKEN environment variable not set. This is required for API calls.",
+                "output": ""
+            }
 
-            output_log = []
-
-            # Check for SUPABASE_ACCESS_TOKEN
-            access_token = os.environ.get('SUPABASE_ACCESS_TOKEN')
-            if not access_token:
-                return {
-                    "success": False,
-                    "error": "SUPABASE_ACCESS_TOKEN environment variable not set. This is required for API calls.",
-                    "output": ""
-                }
-
-            try:
-                async with aiohttp.ClientSession() as session:
-                    # Step 0: Get organization via API
-                    self.logger.info("[STEP_0] Getting Supabase organization via API")
-                    output_log.append("=== Step 0: Getting Organization (API) ===")
-
-                    orgs = await self._get_organizations(session, access_token)
-
-                    if not orgs:
-                        return {
-                            "success": False,
-                            "error": "Failed to get organizations from API. Check SUPABASE_ACCESS_TOKEN.",
-                            "output": "\n".join(output_log)
-                        }
-
-                    if len(orgs) == 0:
-                        return {
-                            "success": False,
-                            "error": "No Supabase organizations found in your account",
-                            "output": "\n".join(output_log)
-                        }
-
-                    org_id = orgs[0]["id"]
-                    output_log.append(f"✅ Using organization: {org_id}")
-                    self.logger.info(f"[STEP_0] Organization: {org_id}")
-
-                    # Step 1: Generate secure password and create project via API
-                    self.logger.info("[STEP_1] Creating Supabase project via API")
-                    output_log.append("\n=== Step 1: Creating Project (API) ===")
-
-                    db_password = self._generate_secure_password(24)
-
-                    project_data = await self._create_project(
-                        session, access_token, org_id, app_name, region, db_password
-                    )
-
-                    if not project_data:
-                        return {
-                            "success": False,
-                            "error": "Failed to create project via API. Check logs for details.",
-                            "output": "\n".join(output_log)
-                        }
-
-                    project_ref = project_data.get("id")
-                    if not project_ref:
-                        return {
-                            "success": False,
-                            "error": f"Project created but no ID returned: {project_data}",
-                            "output": "\n".join(output_log)
-                        }
-
-                    output_log.append(f"✅ Project created: {project_ref}")
-                    self.logger.info(f"[STEP_1] Project created: {project_ref}")
-
-                    # Step 2: Poll for ACTIVE_HEALTHY status
-                    self.logger.info("[STEP_2] Polling for project to be ACTIVE_HEALTHY")
-                    output_log.append("\n=== Step 2: Waiting for Project to be Ready ===")
-
-                    max_wait = 300  # 5 minutes
-                    poll_interval = 10
-                    waited = 0
-                    status = None
-
-                    while waited < max_wait:
-                        status = await self._get_project_status(session, project_ref, access_token)
-                        output_log.append(f"  Status: {status} (waited {waited}s)")
-                        self.logger.info(f"[STEP_2] Status: {status} (waited {waited}s)")
-
-                        if status == "ACTIVE_HEALTHY":
-                            break
-
-                        await asyncio.sleep(poll_interval)
-                        waited += poll_interval
-
-                    if status != "ACTIVE_HEALTHY":
-                        return {
-                            "success": False,
-                            "error": f"Project did not become ACTIVE_HEALTHY within {max_wait}s. Final status: {status}",
-                            "output": "\n".join(output_log)
-                        }
-
-                    output_log.append("✅ Project is ACTIVE_HEALTHY!")
-                    self.logger.info("[STEP_2] Project is ACTIVE_HEALTHY")
-
-                    # Step 3: Get pooler URL from API
-                    self.logger.info("[STEP_3] Getting pooler URL from API")
-                    output_log.append("\n=== Step 3: Getting Pooler URL (API) ===")
-
-                    pooler_info = await self._get_pooler_info(session, project_ref, access_token)
-
-                    if not pooler_info:
-                        return {
-                            "success": False,
-                            "error": "Failed to get pooler configuration from API",
-                            "output": "\n".join(output_log)
-                        }
-
-                    pooler_host = pooler_info["db_host"]
-                    pooler_port = pooler_info["db_port"]
-                    db_user = pooler_info["db_user"]
-                    db_name = pooler_info["db_name"]
-
-                    output_log.append(f"✅ Pooler host: {pooler_host}")
-                    output_log.append(f"✅ Pooler port: {pooler_port}")
-                    self.logger.info(f"[STEP_3] Pooler: {pooler_host}:{pooler_port}")
-
-                    # Build DATABASE_URL
-                    encoded_password = urllib.parse.quote(db_password, safe='')
-                    database_url = f"postgresql://{db_user}:{encoded_password}@{pooler_host}:{pooler_port}/{db_name}"
-
-                    # Step 4: Get API keys via API
-                    self.logger.info("[STEP_4] Getting API keys via API")
-                    output_log.append("\n=== Step 4: Getting API Keys (API) ===")
-
-                    api_keys = await self._get_api_keys(session, project_ref, access_token)
-
-                    if not api_keys:
-                        return {
-                            "success": False,
-                            "error": "Failed to get API keys from API",
-                            "output": "\n".join(output_log)
-                        }
-
-                    anon_key = next((k["api_key"] for k in api_keys if k["name"] == "anon"), None)
-                    service_key = next((k["api_key"] for k in api_keys if k["name"] == "service_role"), None)
-
-                    if not anon_key or not service_key:
-                        return {
-                            "success": False,
-                            "error": f"API keys missing. Got: {[k['name'] for k in api_keys]}",
-                            "output": "\n".join(output_log)
-                        }
-
-                    output_log.append(f"✅ Anon key: {anon_key[:20]}...")
-                    output_log.append(f"✅ Service role key: {service_key[:20]}...")
-
-                    # Step 4b: Disable email confirmations via API
-                    self.logger.info("[STEP_4b] Disabling email confirmations via API")
-                    output_log.append("\n=== Step 4b: Configuring Auth (API) ===")
-
-                    auth_config_success = await self._update_auth_config(
+        try:
+            async with aiohttp.ClientSession() as session:
+                # Step 0: Get organization via API
+                self.logger.info("[STEP_0] Getting Supabase organization via API")
+                output_log.append("=== Step 0: Getting Organization (API) ===")
+
+                orgs, timings["organization"] = await self._timed(
+                    self._get_organizations(session, access_token)
+                )
+
+                if not orgs:
+                    return fail("Failed to get organizations from API. Check SUPABASE_ACCESS_TOKEN.")
+
+                if len(orgs) == 0:
+                    return fail("No Supabase organizations found in your account")
+
+                org_id = orgs[0]["id"]
+                output_log.append(f"✅ Using organization: {org_id}")
+                self.logger.info(f"[STEP_0] Organization: {org_id}")
+
+                # Step 1: Generate secure password and create project via API
+                self.logger.info("[STEP_1] Creating Supabase project via API")
+                output_log.append("\n=== Step 1: Creating Project (API) ===")
+
+                db_password = self._generate_secure_password(24)
+
+                project_data, timings["create_project"] = await self._timed(
+                    self._create_project(session, access_token, org_id, app_name, region, db_password)
+                )
+
+                if not project_data:
+                    return fail("Failed to create project via API. Check logs for details.")
+
+                project_ref = project_data.get("id")
+                if not project_ref:
+                    return fail(f"Project created but no ID returned: {project_data}")
+
+                output_log.append(f"✅ Project created: {project_ref}")
+                self.logger.info(f"[STEP_1] Project created: {project_ref}")
+
+                # Step 2: Poll for ACTIVE_HEALTHY status
+                self.logger.info("[STEP_2] Polling for project to be ACTIVE_HEALTHY")
+                output_log.append("\n=== Step 2: Waiting for Project to be Ready ===")
+
+                status, timings["wait_ready"] = await self._timed(
+                    self._wait_until_healthy(session, project_ref, access_token, output_log)
+                )
+
+                if status != "ACTIVE_HEALTHY":
+                    return fail(f"Project did not become ACTIVE_HEALTHY within {self.max_wait}s. Final status: {status}")
+
+                output_log.append("✅ Project is ACTIVE_HEALTHY!")
+                self.logger.info(f"[STEP_2] Project is ACTIVE_HEALTHY after {timings['wait_ready']}s")
+
+                # Steps 3-4b are independent: pooler URL, API keys and auth config in parallel
+                self.logger.info("[STEP_3] Getting pooler URL, API keys and configuring auth via API")
+                post_ready_started = time.monotonic()
+                (
+                    (pooler_info, timings["pooler_info"]),
+                    (api_keys, timings["api_keys"]),
+                    (auth_config_success, timings["auth_config"]),
+                ) = await asyncio.gather(
+                    self._timed(self._get_pooler_info(session, project_ref, access_token)),
+                    self._timed(self._get_api_keys(session, project_ref, access_token)),
+                    self._timed(self._update_auth_config(
                         session, project_ref, access_token,
                         {"mailer_autoconfirm": True}  # Auto-confirm = no email verification required
-                    )
+                    )),
+                )
+                timings["post_ready"] = round(time.monotonic() - post_ready_started, 2)
+
+                # Step 3: Pooler URL
+                output_log.append("\n=== Step 3: Getting Pooler URL (API) ===")
+
+                if not pooler_info:
+                    return fail("Failed to get pooler configuration from API")
+
+                pooler_host = pooler_info["db_host"]
+                pooler_port = pooler_info["db_port"]
+                db_user = pooler_info["db_user"]
+                db_name = pooler_info["db_name"]
+
+                output_log.append(f"✅ Pooler host: {pooler_host}")
+                output_log.append(f"✅ Pooler port: {pooler_port}")
+                self.logger.info(f"[STEP_3] Pooler: {pooler_host}:{pooler_port}")
+
+                # Build DATABASE_URL
+                encoded_password = urllib.parse.quote(db_password, safe='')
+                database_url = f"postgresql://{db_user}:{encoded_password}@{pooler_host}:{pooler_port}/{db_name}"
+
+                # Step 4: API keys
+                output_log.append("\n=== Step 4: Getting API Keys (API) ===")
 
-                    if auth_config_success:
-                        output_log.append("✅ Email confirmations disabled")
-                        self.logger.info("[STEP_4b] Email confirmations disabled successfully")
-                    else:
-                        output_log.append("⚠️ Could not disable email confirmations via API (non-fatal)")
-                        self.logger.warning("[STEP_4b] Failed to disable email confirmations - users may need to confirm email")
+                if not api_keys:
+                    return fail("Failed to get API keys from API")
 
-                # End of aiohttp session - rest uses filesystem only
+                anon_key = next((k["api_key"] for k in api_keys if k["name"] == "anon"), None)
+                service_key = next((k["api_key"] for k in api_keys if k["name"] == "service_role"), None)
 
-                # Step 5: Generate .env file
-                self.logger.info("[STEP_5] Generating .env file")
-                output_log.append("\n=== Step 5: Generating .env File ===")
+                if not anon_key or not service_key:
+                    return fail(f"API keys missing. Got: {[k['name'] for k in api_keys]}")
 
-                supabase_url = f"https://{project_ref}.supabase.co"
+                output_log.append(f"✅ Anon key: {anon_key[:20]}...")
+                output_log.append(f"✅ Service role key: {service_key[:20]}...")
 
-                env_content = f"""# Supabase Configuration (Generated by Supabase Setup MCP Server)
+                # Step 4b: Email confirmations
+                output_log.append("\n=== Step 4b: Configuring Auth (API) ===")
+
+                if auth_config_success:
+                    output_log.append("✅ Email confirmations disabled")
+                    self.logger.info("[STEP_4b] Email confirmations disabled successfully")
+                else:
+                    output_log.append("⚠️ Could not disable email confirmations via API (non-fatal)")
+                    self.logger.warning("[STEP_4b] Failed to disable email confirmations - users may need to confirm email")
+
+            # End of aiohttp session - rest uses filesystem only
+            local_started = time.monotonic()
+
+            # Step 5: Generate .env file
+            self.logger.info("[STEP_5] Generating .env file")
+            output_log.append("\n=== Step 5: Generating .env File ===")
+
+            supabase_url = f"https://{project_ref}.supabase.co"
+
+            env_content = f"""# Supabase Configuration (Generated by Supabase Setup MCP Server)
 # Project: {app_name}
 # Region: {region}
 # Created: {time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
@@ -300,23 +306,23 @@ AUTH_MODE=supabase
 STORAGE_MODE=database
 """
 
-                env_path = Path(app_directory) / ".env"
-                env_path.write_text(env_content)
-                output_log.append(f"✅ .env file created: {env_path}")
+            env_path = Path(app_directory) / ".env"
+            env_path.write_text(env_content)
+            output_log.append(f"✅ .env file created: {env_path}")
 
-                # Step 6: Initialize local Supabase directory (optional, uses CLI)
-                self.logger.info("[STEP_6] Initializing local Supabase directory")
-                output_log.append("\n=== Step 6: Local Setup (CLI - Optional) ===")
+            # Step 6: Initialize local Supabase directory (optional, uses CLI)
+            self.logger.info("[STEP_6] Initializing local Supabase directory")
+            output_log.append("\n=== Step 6: Local Setup (CLI - Optional) ===")
 
-                # Create supabase directory structure
-                supabase_dir = Path(app_directory) / "supabase"
-                migrations_dir = supabase_dir / "migrations"
-                migrations_dir.mkdir(parents=True, exist_ok=True)
-                output_log.append("✅ Created supabase/migrations directory")
+            # Create supabase directory structure
+            supabase_dir = Path(app_directory) / "supabase"
+            migrations_dir = supabase_dir / "migrations"
+            migrations_dir.mkdir(parents=True, exist_ok=True)
+            output_log.append("✅ Created supabase/migrations directory")
 
-                # Create basic config.toml
-                config_toml = supabase_dir / "config.toml"
-                config_content = f"""# Supabase Configuration
+            # Create basic config.toml
+            config_toml = supabase_dir / "config.toml"
+            config_content = f"""# Supabase Configuration
 # Generated by Supabase Setup MCP Server
 
 [project]
@@ -333,53 +339,97 @@ major_version = 15
 enable_confirmations = false
 max_frequency = "1s"
 """
-                config_toml.write_text(config_content)
-                output_log.append("✅ Created supabase/config.toml")
-
-                # Apply migrations if provided
-                if schema_sql:
-                    self.logger.info("[STEP_7] Creating migration file")
-                    output_log.append("\n=== Step 7: Schema Migration ===")
-
-                    timestamp = time.strftime("%Y%m%d%H%M%S")
-                    migration_file = migrations_dir / f"{timestamp}_initial_schema.sql"
-                    migration_file.write_text(schema_sql)
-                    output_log.append(f"✅ Migration file created: {migration_file.name}")
-                    output_log.append("ℹ️  Run 'supabase db push' to apply migration")
-
-                # Success!
-                self.logger.info("[COMPLETE] Supabase project setup complete")
-                output_log.append("\n=== ✅ Setup Complete ===")
-                output_log.append(f"Project URL: {supabase_url}")
-                output_log.append(f"Pooler Host: {pooler_host}")
-                output_log.append(f"Project Ref: {project_ref}")
-
-                return {
-                    "success": True,
-                    "project_ref": project_ref,
-                    "supabase_url": supabase_url,
-                    "anon_key": anon_key,
-                    "service_role_key": service_key,
-                    "database_url": database_url,
-                    "pooler_host": pooler_host,
-                    "storage_mode": "database",
-                    "output": "\n".join(output_log)
-                }
-
-            except Exception as e:
-                self.logger.error(f"[ERROR] Setup failed: {e}", exc_info=True)
-                output_log.append(f"\n❌ Error: {str(e)}")
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "output": "\n".join(output_log)
-                }
+            config_toml.write_text(config_content)
+            output_log.append("✅ Created supabase/config.toml")
+
+            # Apply migrations if provided
+            if schema_sql:
+                self.logger.info("[STEP_7] Creating migration file")
+                output_log.append("\n=== Step 7: Schema Migration ===")
+
+                timestamp = time.strftime("%Y%m%d%H%M%S")
+                migration_file = migrations_dir / f"{timestamp}_initial_schema.sql"
+                migration_file.write_text(schema_sql)
+                output_log.append(f"✅ Migration file created: {migration_file.name}")
+                output_log.append("ℹ️  Run 'supabase db push' to apply migration")
+
+            timings["local_files"] = round(time.monotonic() - local_started, 2)
+            timings["total"] = round(time.monotonic() - started, 2)
+
+            # Success!
+            self.logger.info(f"[COMPLETE] Supabase project setup complete: {timings}")
+            output_log.append("\n=== ✅ Setup Complete ===")
+            output_log.append(f"Project URL: {supabase_url}")
+            output_log.append(f"Pooler Host: {pooler_host}")
+            output_log.append(f"Project Ref: {project_ref}")
+            output_log.append(
+                f"Timings: ready after {timings['wait_ready']}s, "
+                f"post-ready steps {timings['post_ready']}s, total {timings['total']}s"
+            )
+
+            return {
+                "success": True,
+                "project_ref": project_ref,
+                "supabase_url": supabase_url,
+                "anon_key": anon_key,
+                "service_role_key": service_key,
+                "database_url": database_url,
+                "pooler_host": pooler_host,
+                "storage_mode": "database",
+                "timings": timings,
+                "output": "\n".join(output_log)
+            }
+
+        except Exception as e:
+            self.logger.error(f"[ERROR] Setup failed: {e}", exc_info=True)
+            output_log.append(f"\n❌ Error: {str(e)}")
+            return fail(str(e))
+
+    async def _timed(self, coro) -> Tuple[Any, float]:
+        """Await coro; returns (result, seconds taken)."""
+        start = time.monotonic()
+        result = await coro
+        return result, round(time.monotonic() - start, 2)
+
+    async def _wait_until_healthy(
+        self,
+        session: aiohttp.ClientSession,
+        project_ref: str,
+        access_token: str,
+        output_log: List[str]
+    ) -> Optional[str]:
+        """
+        Poll project status until ACTIVE_HEALTHY or max_wait elapses.
+
+        Polls fast at first (projects are often ready within a minute) and
+        backs off towards poll_max_interval while the project keeps coming up.
+
+        Returns:
+            Last status seen
+        """
+        started = time.monotonic()
+        interval = self.poll_initial_interval
+        status = None
+
+        while True:
+            status = await self._get_project_status(session, project_ref, access_token)
+            waited = time.monotonic() - started
+            output_log.append(f"  Status: {status} (waited {waited:.0f}s)")
+            self.logger.info(f"[STEP_2] Status: {status} (waited {waited:.1f}s, next poll in {interval:.1f}s)")
+
+            if status == "ACTIVE_HEALTHY":
+                return status
+            if waited + interval > self.max_wait:
+                return status
+
+            await asyncio.sleep(interval)
+            interval = min(interval * self.poll_backoff, self.poll_max_interval)
 
     async def _get_organizations(self, session: aiohttp.ClientSession, access_token: str) -> Optional[List[Dict[str, Any]]]:
         """Get organizations from Supabase API."""
         try:
             async with session.get(
-                f"{SUPABASE_API_URL}/organizations",
+                f"{self.api_url}/organizations",
                 headers={"Authorization": f"Bearer {access_token}"}
             ) as response:
                 if response.status == 200:
@@ -413,7 +463,7 @@ max_frequency = "1s"
             self.logger.info(f"[API] Creating project: name={name}, org={org_id}, region={region}")
 
             async with session.post(
-                f"{SUPABASE_API_URL}/projects",
+                f"{self.api_url}/projects",
                 headers={
                     "Authorization": f"Bearer {access_token}",
                     "Content-Type": "application/json"
@@ -435,7 +485,7 @@ max_frequency = "1s"
         """Get project status from Supabase API."""
         try:
             async with session.get(
-                f"{SUPABASE_API_URL}/projects/{project_ref}",
+                f"{self.api_url}/projects/{project_ref}",
                 headers={"Authorization": f"Bearer {access_token}"}
             ) as response:
                 if response.status == 200:
@@ -452,7 +502,7 @@ max_frequency = "1s"
         """Get pooler configuration from Supabase API."""
         try:
             async with session.get(
-                f"{SUPABASE_API_URL}/projects/{project_ref}/config/database/pooler",
+                f"{self.api_url}/projects/{project_ref}/config/database/pooler",
                 headers={"Authorization": f"Bearer {access_token}"}
             ) as response:
                 if response.status == 200:
@@ -471,7 +521,7 @@ max_frequency = "1s"
         """Get API keys from Supabase API."""
         try:
             async with session.get(
-                f"{SUPABASE_API_URL}/projects/{project_ref}/api-keys",
+                f"{self.api_url}/projects/{project_ref}/api-keys",
                 headers={"Authorization": f"Bearer {access_token}"}
             ) as response:
                 if response.status == 200:
@@ -494,7 +544,7 @@ max_frequency = "1s"
         """Update auth configuration via Management API."""
         try:
             async with session.patch(
-                f"{SUPABASE_API_URL}/projects/{project_ref}/config/auth",
+                f"{self.api_url}/projects/{project_ref}/config/auth",
                 headers={
                     "Authorization": f"Bearer {access_token}",
                     "Content-Type": "application/json"
@@ -0,0 +1,154 @@
+"""
+Persistent caches for the Unsplash MCP server.
+
+- ImageIndex: metadata (attribution, URLs, query) for downloaded images,
+  keyed by filename, bounded as an LRU and persisted next to the images so
+  it survives server restarts. Also answers "do we already have photo X on
+  disk?".
+- QueryCache: search API responses with a TTL, keyed by query + filters,
+  so repeated searches across apps skip the API round trip.
+
+Both are small JSON files written atomically on change. The server writes
+the image index with persist(), off the event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+class ImageIndex:
+    """
+    Disk-backed metadata index for downloaded images, capped at
+    `max_entries` (least recently updated dropped first).
+
+    Entries whose image file no longer exists are dropped on load and on
+    every update, so the index stays in step with the save directory.
+    """
+
+    def __init__(self, index_path: Path, image_dir: Path, max_entries: int = 500):
+        self.index_path = index_path
+        self.image_dir = image_dir
+        self.max_entries = max_entries
+        # Saved oldest first, so file order is LRU order
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict(
+            (filename, metadata)
+            for filename, metadata in _load_json(index_path).items()
+            if (image_dir / filename).exists()
+        )
+        # photo id -> filename
+        self._by_photo_id = {m.get("id"): f for f, m in self._entries.items() if m.get("id")}
+        self._trim()
+        self._save_lock: Optional[asyncio.Lock] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, filename: str) -> bool:
+        return filename in self._entries
+
+    def __getitem__(self, filename: str) -> Dict[str, Any]:
+        return self._entries[filename]
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        return iter(list(self._entries.items()))
+
+    def get(self, filename: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(filename)
+
+    def find_photo(self, photo_id: str) -> Optional[str]:
+        """Filename of an already downloaded copy of this photo, if still on disk."""
+        filename = self._by_photo_id.get(photo_id)
+        if filename and (self.image_dir / filename).exists():
+            return filename
+        return None
+
+    def update(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Add or replace several entries in memory (see persist())."""
+        if not entries:
+            return
+        for filename, metadata in entries.items():
+            self._entries[filename] = metadata
+            self._entries.move_to_end(filename)
+            if metadata.get("id"):
+                self._by_photo_id[metadata["id"]] = filename
+        for filename in [f for f in self._entries if not (self.image_dir / f).exists()]:
+            self.remove(filename)
+        self._trim()
+
+    def _trim(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self.remove(next(iter(self._entries)))
+
+    def remove(self, filename: str) -> None:
+        metadata = self._entries.pop(filename, None)
+        if metadata and self._by_photo_id.get(metadata.get("id")) == filename:
+            del self._by_photo_id[metadata["id"]]
+
+    def save(self) -> None:
+        _write_json(self.index_path, self._entries)
+
+    async def persist(self) -> None:
+        """Write the index from a worker thread; concurrent calls are serialized."""
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+        async with self._save_lock:
+            # Snapshot on the loop: the dict keeps changing while the thread writes
+            await asyncio.to_thread(_write_json, self.index_path, dict(self._entries))
+
+
+class QueryCache:
+    """Search responses cached on disk for `ttl_seconds`, bounded to `max_entries`."""
+
+    def __init__(self, cache_path: Path, ttl_seconds: float, max_entries: int = 200):
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[str, Any]] = _load_json(cache_path)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(endpoint: str, params: Dict[str, Any]) -> str:
+        raw = endpoint + "?" + json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry and time.time() - entry["fetched_at"] < self.ttl_seconds:
+            self.hits += 1
+            return entry["data"]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        now = time.time()
+        self._entries[key] = {"fetched_at": now, "data": data}
+        # Drop expired entries, then the oldest beyond the cap
+        fresh = {k: v for k, v in self._entries.items() if now - v["fetched_at"] < self.ttl_seconds}
+        newest = sorted(fresh.items(), key=lambda kv: kv[1]["fetched_at"])[-self.max_entries:]
+        self._entries = dict(newest)
+        _write_json(self.cache_path, self._entries)
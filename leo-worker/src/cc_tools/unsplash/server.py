@@ -9,6 +9,8 @@ Uses Unsplash API to search, filter, and properly attribute professional stock p
 import os
 import json
 import asyncio
+import importlib.util
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Literal
@@ -20,6 +22,9 @@ from fastmcp import FastMCP
 from PIL import Image
 import io
 
+from .cache import ImageIndex, QueryCache
+from .store import PhotoStore
+
 # Initialize FastMCP server
 mcp = FastMCP("Unsplash Stock Photo Server", version="1.0.0")
 
@@ -27,6 +32,16 @@ mcp = FastMCP("Unsplash Stock Photo Server", version="1.0.0")
 UNSPLASH_ACCESS_KEY = os.getenv("UNSPLASH_ACCESS_KEY")
 SAVE_DIR = os.getenv("UNSPLASH_SAVE_DIR", "./stock_photos")
 CACHE_DURATION_DAYS = int(os.getenv("UNSPLASH_CACHE_DAYS", "30"))
+# Photo store shared by every app on the host; per-app SAVE_DIR files are hardlinks into it
+STORE_DIR = os.getenv("UNSPLASH_STORE_DIR", str(Path.home() / ".cache" / "leo" / "unsplash"))
+STORE_MAX_MB = int(os.getenv("UNSPLASH_STORE_MAX_MB", "2048"))
+QUERY_CACHE_TTL_HOURS = float(os.getenv("UNSPLASH_QUERY_CACHE_HOURS", "24"))
+# Image metadata entries kept (LRU): the server lives as long as the agent session
+IMAGE_METADATA_MAX_ENTRIES = int(os.getenv("UNSPLASH_METADATA_MAX_ENTRIES", "500"))
+
+# Concurrent image downloads per server
+DOWNLOAD_CONCURRENCY = int(os.getenv("UNSPLASH_DOWNLOAD_CONCURRENCY", "6"))
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
 
 # Ensure save directory exists
 Path(SAVE_DIR).mkdir(parents=True, exist_ok=True)
@@ -35,8 +50,38 @@ Path(SAVE_DIR).mkdir(parents=True, exist_ok=True)
 BASE_URL = "https://api.unsplash.com"
 DOWNLOAD_ENDPOINT = "https://api.unsplash.com/photos/{id}/download"
 
-# Image metadata storage (in production, use a proper database)
-IMAGE_METADATA: Dict[str, Dict[str, Any]] = {}
+PHOTO_STORE = PhotoStore(Path(STORE_DIR), max_bytes=STORE_MAX_MB * 1024 * 1024)
+
+# Image metadata, persisted next to the images (survives restarts)
+IMAGE_METADATA = ImageIndex(
+    Path(SAVE_DIR) / ".unsplash_index.json", Path(SAVE_DIR), max_entries=IMAGE_METADATA_MAX_ENTRIES
+)
+
+# Search responses keyed by query + filters
+QUERY_CACHE = QueryCache(Path(SAVE_DIR) / ".unsplash_queries.json", ttl_seconds=QUERY_CACHE_TTL_HOURS * 3600)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 pooling
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_http_client: Optional[httpx.AsyncClient] = None
+_download_slots = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared pooled client for API calls and downloads (created on first use)."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _http_client
+
+
+def remember_image(filename: str, metadata: Dict[str, Any]) -> None:
+    """Store metadata for a downloaded image, evicting the least recently used (persist separately)."""
+    IMAGE_METADATA.update({filename: metadata})
 
 # Common UI element to image suggestions mapping
 UI_SUGGESTIONS = {
@@ -80,24 +125,101 @@ def generate_filename(query: str, photo_id: str, timestamp: str) -> str:
 
 
 async def download_image(url: str, save_path: Path, access_key: str) -> bool:
-    """Download image from Unsplash URL and save to disk."""
+    """Download image from Unsplash URL, streaming it to disk."""
+    # Unique per download: other servers may be fetching the same photo into the shared store
+    part_path = save_path.with_name(f"{save_path.name}.{uuid.uuid4().hex}.part")
     try:
         headers = {
             "Authorization": f"Client-ID {access_key}"
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
-            response.raise_for_status()
-            
-            # Save image
-            save_path.write_bytes(response.content)
+        async with _download_slots:
+            async with get_http_client().stream("GET", url, headers=headers, follow_redirects=True) as response:
+                response.raise_for_status()
+                
+                # Save image; file writes stay off the event loop
+                with open(part_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_BYTES):
+                        await asyncio.to_thread(f.write, chunk)
+            os.replace(part_path, save_path)
             return True
     except Exception as e:
         print(f"Error downloading image: {e}")
+        part_path.unlink(missing_ok=True)
         return False
 
 
+def build_photo_info(photo: Dict[str, Any]) -> Dict[str, Any]:
+    """Photo fields returned to the agent."""
+    return {
+        "id": photo.get("id"),
+        "description": photo.get("description") or photo.get("alt_description", ""),
+        "width": photo.get("width"),
+        "height": photo.get("height"),
+        "color": photo.get("color"),
+        "blur_hash": photo.get("blur_hash"),
+        "urls": get_image_urls(photo),
+        "attribution": build_attribution(photo),
+        "likes": photo.get("likes", 0),
+        "tags": [tag.get("title") for tag in photo.get("tags", [])][:5]
+    }
+
+
+async def save_photo(
+    photo: Dict[str, Any],
+    photo_info: Dict[str, Any],
+    query: str,
+    timestamp: str,
+    headers: Dict[str, str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Make a photo available in SAVE_DIR.
+    
+    Reuses this app's copy if it has one, else links it from the shared
+    store, downloading into the store only if no app has fetched it yet.
+    
+    Sets local_path/filename on photo_info and returns the metadata entry to
+    index, or None if the download failed.
+    """
+    client = get_http_client()
+    
+    # Trigger download tracking (required by Unsplash API terms)
+    if photo.get("links", {}).get("download_location"):
+        try:
+            await client.get(
+                photo["links"]["download_location"],
+                headers=headers
+            )
+        except Exception:
+            pass  # Continue even if tracking fails
+    
+    photo_id = photo["id"]
+    filename = IMAGE_METADATA.find_photo(photo_id)
+    if filename is None:
+        filename = generate_filename(query, photo_id, timestamp)
+        dest = Path(SAVE_DIR) / filename
+        linked = PHOTO_STORE.has(photo_id) and await asyncio.to_thread(PHOTO_STORE.link_into, photo_id, dest)
+        if not linked:
+            success = await download_image(
+                photo_info["urls"]["regular"],
+                PHOTO_STORE.path_for(photo_id),
+                UNSPLASH_ACCESS_KEY
+            )
+            if not success:
+                return None
+            await asyncio.to_thread(PHOTO_STORE.add, photo_id, photo_info)
+            if not await asyncio.to_thread(PHOTO_STORE.link_into, photo_id, dest):
+                return None
+    
+    photo_info["local_path"] = str(Path(SAVE_DIR) / filename)
+    photo_info["filename"] = filename
+    return {
+        **photo_info,
+        "query": query,
+        "downloaded_at": datetime.now().isoformat()
+    }
+
+
 def build_attribution(photo_data: Dict[str, Any]) -> Dict[str, str]:
     """Build proper attribution for an Unsplash photo."""
     photographer_name = photo_data.get("user", {}).get("name", "Unknown")
@@ -186,8 +308,10 @@ async def search_photos(
             "Accept-Version": "v1"
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
+        cache_key = QUERY_CACHE.key("/search/photos", params)
+        data = QUERY_CACHE.get(cache_key)
+        if data is None:
+            response = await get_http_client().get(
                 f"{BASE_URL}/search/photos",
                 params=params,
                 headers=headers
@@ -195,66 +319,35 @@ async def search_photos(
             response.raise_for_status()
             
             data = response.json()
+            QUERY_CACHE.put(cache_key, data)
+        
+        results = [build_photo_info(photo) for photo in data.get("results", [])]
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # Download and save locally if requested (concurrently, bounded by DOWNLOAD_CONCURRENCY)
+        if save_locally:
+            to_save = [
+                (photo, photo_info)
+                for photo, photo_info in zip(data.get("results", []), results)
+                if photo_info["urls"].get("regular")
+            ]
+            saved = await asyncio.gather(*(
+                save_photo(photo, photo_info, query, timestamp, headers)
+                for photo, photo_info in to_save
+            ))
             
-            results = []
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            for photo in data.get("results", []):
-                photo_info = {
-                    "id": photo.get("id"),
-                    "description": photo.get("description") or photo.get("alt_description", ""),
-                    "width": photo.get("width"),
-                    "height": photo.get("height"),
-                    "color": photo.get("color"),
-                    "blur_hash": photo.get("blur_hash"),
-                    "urls": get_image_urls(photo),
-                    "attribution": build_attribution(photo),
-                    "likes": photo.get("likes", 0),
-                    "tags": [tag.get("title") for tag in photo.get("tags", [])][:5]
-                }
-                
-                # Download and save locally if requested
-                if save_locally and photo_info["urls"].get("regular"):
-                    filename = generate_filename(query, photo["id"], timestamp)
-                    save_path = Path(SAVE_DIR) / filename
-                    
-                    # Trigger download tracking (required by Unsplash API terms)
-                    if photo.get("links", {}).get("download_location"):
-                        try:
-                            await client.get(
-                                photo["links"]["download_location"],
-                                headers=headers
-                            )
-                        except:
-                            pass  # Continue even if tracking fails
-                    
-                    success = await download_image(
-                        photo_info["urls"]["regular"],
-                        save_path,
-                        UNSPLASH_ACCESS_KEY
-                    )
-                    
-                    if success:
-                        photo_info["local_path"] = str(save_path)
-                        photo_info["filename"] = filename
-                        
-                        # Store metadata
-                        IMAGE_METADATA[filename] = {
-                            **photo_info,
-                            "query": query,
-                            "downloaded_at": datetime.now().isoformat()
-                        }
-                
-                results.append(photo_info)
-            
-            return json.dumps({
-                "query": query,
-                "total": data.get("total", 0),
-                "total_pages": data.get("total_pages", 0),
-                "page": page,
-                "per_page": per_page,
-                "results": results
-            }, indent=2)
+            # Store metadata
+            IMAGE_METADATA.update({entry["filename"]: entry for entry in saved if entry})
+            await IMAGE_METADATA.persist()
+        
+        return json.dumps({
+            "query": query,
+            "total": data.get("total", 0),
+            "total_pages": data.get("total_pages", 0),
+            "page": page,
+            "per_page": per_page,
+            "results": results
+        }, indent=2)
             
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 401:
@@ -321,63 +414,27 @@ async def get_random_photo(
             "Accept-Version": "v1"
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{BASE_URL}/photos/random",
-                params=params,
-                headers=headers
-            )
-            response.raise_for_status()
-            
-            photo = response.json()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            photo_info = {
-                "id": photo.get("id"),
-                "description": photo.get("description") or photo.get("alt_description", ""),
-                "width": photo.get("width"),
-                "height": photo.get("height"),
-                "color": photo.get("color"),
-                "blur_hash": photo.get("blur_hash"),
-                "urls": get_image_urls(photo),
-                "attribution": build_attribution(photo),
-                "likes": photo.get("likes", 0),
-                "tags": [tag.get("title") for tag in photo.get("tags", [])][:5]
-            }
-            
-            # Download and save locally if requested
-            if save_locally and photo_info["urls"].get("regular"):
-                filename = generate_filename(query or "random", photo["id"], timestamp)
-                save_path = Path(SAVE_DIR) / filename
-                
-                # Trigger download tracking
-                if photo.get("links", {}).get("download_location"):
-                    try:
-                        await client.get(
-                            photo["links"]["download_location"],
-                            headers=headers
-                        )
-                    except:
-                        pass
-                
-                success = await download_image(
-                    photo_info["urls"]["regular"],
-                    save_path,
-                    UNSPLASH_ACCESS_KEY
-                )
-                
-                if success:
-                    photo_info["local_path"] = str(save_path)
-                    photo_info["filename"] = filename
-                    
-                    # Store metadata
-                    IMAGE_METADATA[filename] = {
-                        **photo_info,
-                        "query": query or "random",
-                        "downloaded_at": datetime.now().isoformat()
-                    }
-            
-            return json.dumps(photo_info, indent=2)
+        response = await get_http_client().get(
+            f"{BASE_URL}/photos/random",
+            params=params,
+            headers=headers
+        )
+        response.raise_for_status()
+        
+        photo = response.json()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        photo_info = build_photo_info(photo)
+        
+        # Download and save locally if requested
+        if save_locally and photo_info["urls"].get("regular"):
+            entry = await save_photo(photo, photo_info, query or "random", timestamp, headers)
+            if entry:
+                # Store metadata
+                remember_image(entry["filename"], entry)
+                await IMAGE_METADATA.persist()
+        
+        return json.dumps(photo_info, indent=2)
             
     except Exception as e:
         return json.dumps({
@@ -501,6 +558,8 @@ async def generate_attribution(
     photo_data = None
     if filename and filename in IMAGE_METADATA:
         photo_data = IMAGE_METADATA[filename]
+    elif photo_id and PHOTO_STORE.metadata(photo_id):
+        photo_data = PHOTO_STORE.metadata(photo_id)
     elif photo_id:
         # Would need to fetch from API if not in cache
         # For now, return a template
@@ -554,34 +613,21 @@ async def list_cached_images(
         JSON string with cached images and metadata
     """
     try:
-        save_path = Path(SAVE_DIR)
-        if not save_path.exists():
-            return json.dumps({
-                "count": 0,
-                "images": [],
-                "message": "No cached images found"
-            }, indent=2)
-        
-        # Get all image files
-        image_files = list(save_path.glob("unsplash_*.jpg"))
-        
-        # Build results with metadata
+        # Served from the metadata index (no directory scan)
         images = []
-        for img_path in image_files:
-            if img_path.name in IMAGE_METADATA:
-                metadata = IMAGE_METADATA[img_path.name]
-                images.append({
-                    "filename": img_path.name,
-                    "path": str(img_path),
-                    "query": metadata.get("query", ""),
-                    "description": metadata.get("description", ""),
-                    "id": metadata.get("id", ""),
-                    "likes": metadata.get("likes", 0),
-                    "downloaded_at": metadata.get("downloaded_at", ""),
-                    "attribution": metadata.get("attribution", {}),
-                    "urls": metadata.get("urls", {}),
-                    "tags": metadata.get("tags", [])
-                })
+        for filename, metadata in IMAGE_METADATA.items():
+            images.append({
+                "filename": filename,
+                "path": str(Path(SAVE_DIR) / filename),
+                "query": metadata.get("query", ""),
+                "description": metadata.get("description", ""),
+                "id": metadata.get("id", ""),
+                "likes": metadata.get("likes", 0),
+                "downloaded_at": metadata.get("downloaded_at", ""),
+                "attribution": metadata.get("attribution", {}),
+                "urls": metadata.get("urls", {}),
+                "tags": metadata.get("tags", [])
+            })
         
         # Sort results
         if sort_by == "newest":
@@ -596,8 +642,9 @@ async def list_cached_images(
         
         return json.dumps({
             "count": len(images),
-            "total_cached": len(image_files),
-            "images": images
+            "total_cached": len(IMAGE_METADATA),
+            "images": images,
+            "shared_store": PHOTO_STORE.stats()
         }, indent=2)
         
     except Exception as e:
@@ -607,50 +654,31 @@ async def list_cached_images(
 
 
 @mcp.tool()
-async def clear_old_cache(days_old: int = 30) -> str:
+async def clear_old_cache(days_old: int = 30, max_size_mb: Optional[int] = None) -> str:
     """
-    Clear cached images older than specified days.
+    Evict photos from the shared photo store, least recently used first.
+    
+    Photos unused for days_old days are removed, then more are evicted until
+    the store fits max_size_mb. Images already linked into an app stay intact.
     
     Args:
-        days_old: Delete images older than this many days
+        days_old: Evict photos no app has used for this many days
+        max_size_mb: Store size cap (default: UNSPLASH_STORE_MAX_MB)
     
     Returns:
-        JSON string with deletion results
+        JSON string with eviction results
     """
     try:
-        save_path = Path(SAVE_DIR)
-        if not save_path.exists():
-            return json.dumps({
-                "message": "No cache directory found",
-                "deleted_count": 0
-            }, indent=2)
-        
         cutoff_time = datetime.now().timestamp() - (days_old * 24 * 60 * 60)
+        max_bytes = max_size_mb * 1024 * 1024 if max_size_mb is not None else None
         
-        deleted_files = []
-        errors = []
-        
-        for img_path in save_path.glob("unsplash_*.jpg"):
-            try:
-                if img_path.stat().st_mtime < cutoff_time:
-                    # Remove from metadata
-                    if img_path.name in IMAGE_METADATA:
-                        del IMAGE_METADATA[img_path.name]
-                    
-                    # Delete file
-                    img_path.unlink()
-                    deleted_files.append(img_path.name)
-            except Exception as e:
-                errors.append({
-                    "file": img_path.name,
-                    "error": str(e)
-                })
+        evicted = await asyncio.to_thread(PHOTO_STORE.evict, max_bytes, cutoff_time)
         
         return json.dumps({
-            "deleted_count": len(deleted_files),
-            "deleted_files": deleted_files,
-            "errors": errors if errors else None,
-            "message": f"Deleted {len(deleted_files)} cached images older than {days_old} days"
+            "deleted_count": len(evicted),
+            "deleted_photo_ids": evicted,
+            "store": PHOTO_STORE.stats(),
+            "message": f"Evicted {len(evicted)} photos from the shared store"
         }, indent=2)
         
     except Exception as e:
@@ -0,0 +1,185 @@
+"""
+Shared, content-addressed stock photo store.
+
+Every Unsplash photo is downloaded once into a store shared by all apps on
+the host (UNSPLASH_STORE_DIR), named by its photo id. Apps get a hardlink
+(or a copy across filesystems) in their own save directory, so the same
+photo costs one download and one copy on disk no matter how many apps or
+queries use it.
+
+Layout:
+    <store>/photos/<photo_id>.jpg    image
+    <store>/photos/<photo_id>.json   metadata (attribution, URLs)
+    <store>/index.json               {photo_id: {"size", "last_used"}}
+
+Stored photos are read-only (0444), and so are the hardlinks apps get, since
+a link shares the store's inode. Rewriting an app image in place (resize,
+recompress, `open(path, "wb")`) fails with a permission error instead of
+silently changing the photo for every app linked to it. To edit one, write
+a new file and rename it over the link.
+
+The store is kept under a size cap by evicting least recently used photos.
+Evicting never breaks an app: its hardlink keeps the data alive.
+Several MCP server processes share the store, so index updates are
+serialized with a file lock.
+"""
+
+import fcntl
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Stored photos (and the apps' hardlinks to them) can't be rewritten in place
+READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+class PhotoStore:
+    """Photo-id addressed image store with LRU eviction under a byte cap."""
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.photos_dir = root / "photos"
+        self.index_path = root / "index.json"
+        self.lock_path = root / "index.lock"
+        self.max_bytes = max_bytes
+        self.photos_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, photo_id: str) -> Path:
+        return self.photos_dir / f"{photo_id}.jpg"
+
+    def has(self, photo_id: str) -> bool:
+        return self.path_for(photo_id).exists()
+
+    def metadata(self, photo_id: str) -> Optional[Dict[str, Any]]:
+        """Metadata saved with a stored photo, if any."""
+        try:
+            with open(self.photos_dir / f"{photo_id}.json", "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    # ------------------------------------------------------------------
+    # Index (shared between processes)
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _locked_index(self, write: bool = True) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """Load the index under an exclusive lock; changes are written back on exit."""
+        with open(self.lock_path, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                with open(self.index_path, "r") as f:
+                    index = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                index = {}
+            yield index
+            if not write:
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, self.index_path)
+
+    def add(self, photo_id: str, metadata: Dict[str, Any]) -> List[str]:
+        """
+        Register a photo just downloaded to path_for(photo_id).
+
+        Returns:
+            Photo ids evicted to stay under the size cap
+        """
+        meta_path = self.photos_dir / f"{photo_id}.json"
+        with open(meta_path, "w") as f:
+            json.dump(metadata, f)
+        os.chmod(self.path_for(photo_id), READ_ONLY)
+        with self._locked_index() as index:
+            index[photo_id] = {"size": self.path_for(photo_id).stat().st_size, "last_used": time.time()}
+            return self._evict(index, self.max_bytes, keep=photo_id)
+
+    def touch(self, photo_id: str) -> None:
+        """Mark a photo as recently used."""
+        with self._locked_index() as index:
+            if photo_id in index:
+                index[photo_id]["last_used"] = time.time()
+
+    def link_into(self, photo_id: str, dest: Path) -> bool:
+        """
+        Hardlink a stored photo to dest (copy if linking isn't possible).
+
+        The hardlink is read-only like the stored photo; a fallback copy is
+        the app's own file and stays writable.
+
+        Returns:
+            False if the photo isn't in the store (e.g. just evicted by another app)
+        """
+        src = self.path_for(photo_id)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if dest.exists():
+                dest.unlink()
+            # Photos stored before they were made read-only
+            if src.stat().st_mode & 0o777 != READ_ONLY:
+                os.chmod(src, READ_ONLY)
+            os.link(src, dest)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            # Different filesystem or no hardlink support
+            try:
+                shutil.copyfile(src, dest)
+            except FileNotFoundError:
+                return False
+        self.touch(photo_id)
+        return True
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def _evict(
+        self,
+        index: Dict[str, Dict[str, Any]],
+        max_bytes: int,
+        older_than: Optional[float] = None,
+        keep: Optional[str] = None
+    ) -> List[str]:
+        evicted = []
+        total = sum(entry["size"] for entry in index.values())
+        for photo_id, entry in sorted(index.items(), key=lambda kv: kv[1]["last_used"]):
+            too_big = total > max_bytes
+            too_old = older_than is not None and entry["last_used"] < older_than
+            if photo_id == keep or not (too_big or too_old):
+                continue
+            self.path_for(photo_id).unlink(missing_ok=True)
+            (self.photos_dir / f"{photo_id}.json").unlink(missing_ok=True)
+            del index[photo_id]
+            total -= entry["size"]
+            evicted.append(photo_id)
+        return evicted
+
+    def evict(self, max_bytes: Optional[int] = None, older_than: Optional[float] = None) -> List[str]:
+        """
+        Evict least recently used photos until the store fits max_bytes
+        (default: the configured cap), plus any unused since older_than.
+
+        Returns:
+            Evicted photo ids
+        """
+        with self._locked_index() as index:
+            return self._evict(index, self.max_bytes if max_bytes is None else max_bytes, older_than)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._locked_index(write=False) as index:
+            total = sum(entry["size"] for entry in index.values())
+            return {
+                "store_dir": str(self.root),
+                "photos": len(index),
+                "size_mb": round(total / (1024 * 1024), 1),
+                "max_size_mb": round(self.max_bytes / (1024 * 1024), 1)
+            }
@@ -5,15 +5,20 @@ Generates complete full-stack applications from natural language prompts
 using the pipeline-prompt.md system prompt.
 """
 
+import asyncio
 import logging
 import os
 import json
+import subprocess
+import tempfile
+import time
 import uuid
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
-from cc_agent import Agent, find_latest_meaningful_session, find_sessions_for_cwd
+from cc_agent import Agent, PromptLayout, find_latest_meaningful_session, find_sessions_for_cwd
+from leo.changelog import ChangelogIndex
 from .config import AGENT_CONFIG, PIPELINE_PROMPT_PATH, PIPELINE_PROMPT_LITE_PATH, APPS_OUTPUT_DIR, PROMPTING_GUIDE_PATH, EXPANSION_CONFIG, AGENT_MODE
 from .prompt_expander import PromptExpander
 from .git_helper import GitHelper
@@ -29,6 +34,63 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _atomic_write_text(path: Path, content: str) -> None:
+    """
+    Write a text file atomically (temp file in the same directory + rename).
+
+    Readers (git add in the checkpoint, the reprompter's context gatherer)
+    never see a half-written README or CLAUDE.md.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _append_entry(path: Path, header: str, entry: str) -> int:
+    """
+    Append a changelog entry, writing the file header first if the file is new or empty.
+
+    Only the new bytes are written, so the cost doesn't grow with the file.
+
+    Returns:
+        Byte offset of the entry in the file
+    """
+    with open(path, "ab") as f:
+        offset = os.fstat(f.fileno()).st_size
+        if offset == 0:
+            header_bytes = header.encode("utf-8")
+            f.write(header_bytes)
+            offset = len(header_bytes)
+        f.write(entry.encode("utf-8"))
+    return offset
+
+
+def _count_files_changed(app_path: str, commit_hash: Optional[str]) -> int:
+    """Number of files touched by a commit (0 if git info is unavailable)."""
+    try:
+        if commit_hash and (Path(app_path) / ".git").exists():
+            result = subprocess.run(
+                ["git", "diff-tree", "--no-commit-id", "--name-only", "-r", commit_hash],
+                cwd=app_path,
+                capture_output=True,
+                text=True,
+                check=False
+            )
+            if result.returncode == 0 and result.stdout:
+                return len([f for f in result.stdout.strip().split('\n') if f])
+    except Exception:
+        pass  # Silently fail if git info unavailable
+    return 0
+
+
 class AppGeneratorAgent:
     """
     Agent that generates complete full-stack applications from prompts.
@@ -57,6 +119,7 @@ class AppGeneratorAgent:
 
         self.output_dir = output_dir or APPS_OUTPUT_DIR
         self.pipeline_prompt = self._load_pipeline_prompt()
+        self.system_prompt_layout = self._build_system_prompt_layout()
         self.enable_expansion = enable_expansion and EXPANSION_CONFIG["enabled"]
         self.enable_subagents = enable_subagents and SUBAGENTS_AVAILABLE
 
@@ -82,7 +145,7 @@ class AppGeneratorAgent:
         # Initialize the agent with pipeline prompt as system prompt
         # Use MCP tools instead of listing individual tool names
         self.agent = Agent(
-            system_prompt=self.pipeline_prompt,
+            system_prompt=self.system_prompt_layout.render(),
             allowed_tools=AGENT_CONFIG["allowed_tools"],  # Include all allowed tools (Task, etc.)
             mcp_tools=[
                 "chrome_devtools",  # Replaces "browser" - advanced DevTools capabilities
@@ -92,6 +155,7 @@ class AppGeneratorAgent:
                 # "shadcn",  # REMOVED: Not needed
                 "cwd_reporter",
                 "integration_analyzer",
+                "code_index",  # Symbol/import/route lookups instead of repeated Grep/Read
                 "supabase_setup",  # Autonomous Supabase project creation (uses Supabase CLI + API)
             ],
             cwd=self.output_dir,
@@ -109,6 +173,7 @@ class AppGeneratorAgent:
         logger.info(f"🛠️  Tools: {len(AGENT_CONFIG['allowed_tools'])} tools available")
         logger.info(f"📝 Prompt expansion: {'enabled' if self.enable_expansion else 'disabled'}")
         logger.info(f"🤖 Subagents: {'enabled' if self.enable_subagents else 'disabled'}")
+        logger.info(f"🔑 System prompt prefix hash: {self.system_prompt_layout.prefix_hash}")
 
         # Lightweight summarization agent (no tools, haiku model for cost efficiency)
         # Uses the global conversation callback so summaries go through WSI
@@ -119,13 +184,106 @@ class AppGeneratorAgent:
             model="claude-haiku-4-5",  # Fast and cheap
             max_turns=10,  # Allow multiple turns for complex summaries
             cwd=self.output_dir,
+            use_client_pool=True,  # Reuse a warm CLI process across iterations
         )
+        self._summary_prewarm_task: Optional[asyncio.Task] = None
+
+        # Background changelog/summary/CLAUDE.md writes for the last iteration
+        self._finalization_task: Optional[asyncio.Task] = None
 
         # Session management
         self.current_session_id: Optional[str] = None
         self.current_app_path: Optional[str] = None
         self.generation_context: Dict[str, Any] = {}
 
+    def _prewarm_summary_agent(self) -> None:
+        """Spawn the summarizer's pooled client while the main agent works."""
+        if self._summary_prewarm_task is None or self._summary_prewarm_task.done():
+            self._summary_prewarm_task = asyncio.create_task(self._summary_agent.prewarm_client())
+
+    def _schedule_finalization(
+        self,
+        app_path: str,
+        operation_type: str,
+        user_request: str,
+        agent_summary: Optional[str],
+        commit_hash: Optional[str] = None,
+        include_claude_md: bool = False,
+    ) -> None:
+        """
+        Write iteration docs in the background so the caller can report completion.
+
+        The changelog, summary changelog (LLM call) and CLAUDE.md run
+        concurrently. Callers must await wait_for_finalization() before
+        committing/pushing, and the next resume awaits it before starting.
+        """
+        self._finalization_task = asyncio.create_task(self._finalize_iteration(
+            app_path, operation_type, user_request, agent_summary, commit_hash, include_claude_md
+        ))
+
+    async def _finalize_iteration(
+        self,
+        app_path: str,
+        operation_type: str,
+        user_request: str,
+        agent_summary: Optional[str],
+        commit_hash: Optional[str],
+        include_claude_md: bool,
+    ) -> None:
+        """Run the post-iteration documentation steps concurrently."""
+        started = time.monotonic()
+        steps = {
+            "changelog": self.append_to_changelog(
+                app_path=app_path,
+                operation_type=operation_type,
+                user_request=user_request,
+                agent_summary=agent_summary,
+                commit_hash=commit_hash
+            ),
+            "summary changelog": self.append_to_summary_changelog(
+                app_path=app_path,
+                operation_type=operation_type,
+                user_request=user_request,
+                agent_summary=agent_summary,
+                commit_hash=commit_hash
+            ),
+        }
+        if include_claude_md:
+            steps["CLAUDE.md"] = self.generate_claude_md(app_path)
+
+        results = await asyncio.gather(*steps.values(), return_exceptions=True)
+        for name, result in zip(steps, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to finalize {name}: {result}")
+
+        logger.info(f"📝 Iteration docs finalized in {time.monotonic() - started:.1f}s ({', '.join(steps)})")
+
+    async def wait_for_finalization(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the background documentation writes of the last iteration.
+
+        Args:
+            timeout: Seconds to wait (None = no limit). On timeout the writes
+                     keep running in the background.
+
+        Returns:
+            True if nothing is pending anymore, False on timeout
+        """
+        task = self._finalization_task
+        if task is None:
+            return True
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ Iteration docs still being written after {timeout}s")
+            return False
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise  # We were cancelled, not the finalization task
+        if self._finalization_task is task:
+            self._finalization_task = None
+        return True
+
     def _initialize_subagents(self):
         """
         Initialize all available subagents and convert to SDK format.
@@ -238,6 +396,16 @@ class AppGeneratorAgent:
 
         return None
 
+    def _build_system_prompt_layout(self) -> PromptLayout:
+        """
+        Build the main agent's system prompt from cache-stable segments.
+
+        The system prompt must stay byte-identical across iterations for
+        prompt caching to hit, so nothing per-run (timestamps, app paths,
+        session IDs) goes here - that belongs in the user prompt.
+        """
+        return PromptLayout().add_stable("pipeline_prompt", self.pipeline_prompt)
+
     def _load_pipeline_prompt(self) -> str:
         """
         Load the pipeline prompt based on AGENT_MODE.
@@ -351,10 +519,12 @@ class AppGeneratorAgent:
         generation_prompt = self._build_generation_prompt(prompt_to_use, app_name)
 
         logger.info("\n🤖 Calling agent with full context...")
-        logger.info(f"📊 System Prompt: {len(self.pipeline_prompt):,} chars")
+        logger.info(f"📊 System Prompt: {len(self.system_prompt_layout):,} chars (prefix {self.system_prompt_layout.prefix_hash})")
         logger.info(f"📊 User Prompt: {len(generation_prompt):,} chars")
         logger.info("-" * 80)
 
+        self._prewarm_summary_agent()
+
         # Run the agent with session support (async) with fallback to non-session mode
         result = None
         try:
@@ -423,27 +593,17 @@ class AppGeneratorAgent:
         # Save session to app directory
         self.save_session(app_path)
 
-        # Append to changelog with full agent summary
-        await self.append_to_changelog(
-            app_path=app_path,
-            operation_type="Initial Generation",
-            user_request=user_prompt,
-            agent_summary=agent_summary,
-            commit_hash=commit_hash
-        )
-
-        # Append to summary changelog with concise summary
-        await self.append_to_summary_changelog(
+        # Changelog, summary changelog and CLAUDE.md are written in the background
+        # (see wait_for_finalization) so iteration-complete isn't held up by the summary LLM call
+        self._schedule_finalization(
             app_path=app_path,
             operation_type="Initial Generation",
             user_request=user_prompt,
             agent_summary=agent_summary,
-            commit_hash=commit_hash
+            commit_hash=commit_hash,
+            include_claude_md=True,
         )
 
-        # Generate CLAUDE.md for context persistence
-        await self.generate_claude_md(app_path)
-
         return app_path, expansion_result
 
     def _extract_features(self, content: str) -> list:
@@ -674,6 +834,9 @@ class AppGeneratorAgent:
         logger.info("=" * 80)
         logger.info(f"\n📁 App Path: {app_path}")
 
+        # Previous iteration's docs must land before this one touches the same files
+        await self.wait_for_finalization()
+
         # Load app-specific session if no session_id provided
         if not session_id:
             session_data = self.load_session(app_path)
@@ -777,6 +940,8 @@ Use TodoWrite to track your modifications.
             else:
                 logger.info("📝 No existing sessions found, will create new session...")
 
+        self._prewarm_summary_agent()
+
         # Try to use session-aware run with smart fallback cascade
         result = None
         tried_sessions = set()
@@ -868,8 +1033,8 @@ Use TodoWrite to track your modifications.
         # Save session to app directory
         self.save_session(app_path)
 
-        # Append to changelog with full agent summary
-        await self.append_to_changelog(
+        # Changelog and summary changelog are written in the background (see wait_for_finalization)
+        self._schedule_finalization(
             app_path=app_path,
             operation_type="Modification",
             user_request=additional_instructions,
@@ -877,15 +1042,6 @@ Use TodoWrite to track your modifications.
             commit_hash=None  # No commit for modifications (could add if needed)
         )
 
-        # Append to summary changelog with concise summary
-        await self.append_to_summary_changelog(
-            app_path=app_path,
-            operation_type="Modification",
-            user_request=additional_instructions,
-            agent_summary=agent_summary,
-            commit_hash=None
-        )
-
         # Restore original working directory
         self.agent.cwd = original_cwd
 
@@ -965,39 +1121,25 @@ Use TodoWrite to track your modifications.
 
         return latest_file, file_number
 
-    def _update_changelog_readme(self, app_path: str, app_name: str) -> None:
+    def _update_changelog_readme(self, app_path: str, app_name: str, index: Optional[ChangelogIndex] = None) -> None:
         """
         Update the changelog README.md with file index and navigation.
 
         Args:
             app_path: Path to the app directory
             app_name: Name of the app
+            index: Already-loaded changelog index (optional)
         """
         app_root = Path(app_path).parent
         changelog_dir = app_root / "changelog"
         readme_file = changelog_dir / "README.md"
 
-        # Get all changelog files with their metadata
-        changelog_files = sorted(changelog_dir.glob("changelog-*.md"))
-
-        # Count total entries across all files
-        total_entries = 0
-        file_info = []
-
-        for file in changelog_files:
-            try:
-                content = file.read_text(encoding="utf-8")
-                entry_count = content.count("## 📅")
-                total_entries += entry_count
-
-                file_info.append({
-                    "name": file.name,
-                    "entries": entry_count,
-                    "size_mb": file.stat().st_size / (1024 * 1024)
-                })
-            except Exception:
-                # If we can't read a file, just skip it
-                continue
+        # Entry counts come from the index (no re-reading of changelog files)
+        file_info = [
+            {"name": f.name, "entries": f.entries, "size_mb": f.size_bytes / (1024 * 1024)}
+            for f in (index or ChangelogIndex(changelog_dir, "changelog")).files()
+        ]
+        total_entries = sum(info["entries"] for info in file_info)
 
         # Build README content
         readme_parts = [
@@ -1032,7 +1174,7 @@ Use TodoWrite to track your modifications.
         ])
 
         try:
-            readme_file.write_text("\n".join(readme_parts), encoding="utf-8")
+            _atomic_write_text(readme_file, "\n".join(readme_parts))
         except Exception as e:
             logger.error(f"Failed to update changelog README: {e}")
 
@@ -1124,22 +1266,7 @@ Focus on WHAT was done, WHAT changed, and the RESULT. Skip process details like
         timestamp = datetime.now().strftime("%b %d, %Y %I:%M %p")
 
         # Get files changed count from git if available
-        files_changed_count = 0
-        try:
-            if commit_hash and (Path(app_path) / ".git").exists():
-                # Get files from last commit
-                import subprocess
-                result = subprocess.run(
-                    ["git", "diff-tree", "--no-commit-id", "--name-only", "-r", commit_hash],
-                    cwd=app_path,
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-                if result.returncode == 0 and result.stdout:
-                    files_changed_count = len([f for f in result.stdout.strip().split('\n') if f])
-        except Exception:
-            pass  # Silently fail if git info unavailable
+        files_changed_count = await asyncio.to_thread(_count_files_changed, app_path, commit_hash)
 
         # Build the changelog entry with new format
         entry_parts = [
@@ -1169,33 +1296,34 @@ Focus on WHAT was done, WHAT changed, and the RESULT. Skip process details like
         entry = "\n".join(entry_parts)
 
         try:
-            # Read existing content if file exists
-            existing_content = ""
-            if changelog_file.exists():
-                existing_content = changelog_file.read_text(encoding="utf-8")
-
-            # Check if this is a new file (doesn't exist or empty)
-            if not existing_content.strip():
-                # Add header for new changelog file
-                header = f"# {app_name} - Changelog Part {file_number}\n\n"
-                header += f"This file is part of a multi-file changelog. See [README.md](./README.md) for all files.\n\n"
-                header += "---\n\n"
-                new_content = header + entry
-            else:
-                # APPEND mode: Add new entry at END (newest at bottom)
-                new_content = existing_content + entry
-
-            # Write the updated changelog
-            changelog_file.write_text(new_content, encoding="utf-8")
-
-            # Update the README index
-            self._update_changelog_readme(app_path, app_name)
-
+            # File I/O off the event loop so it overlaps with the summary LLM call
+            await asyncio.to_thread(
+                self._write_changelog_entry, changelog_file, file_number, app_path, app_name, entry
+            )
             logger.info(f"📝 Updated changelog: {changelog_file}")
 
         except Exception as e:
             logger.error(f"Failed to update changelog: {e}")
 
+    def _write_changelog_entry(
+        self, changelog_file: Path, file_number: int, app_path: str, app_name: str, entry: str
+    ) -> None:
+        """Append an entry to a changelog file and refresh the README."""
+        # Reconcile the index with disk before the file grows
+        index = ChangelogIndex(changelog_file.parent, "changelog").refresh()
+
+        # Header for a new changelog file (only written if the file is new or empty)
+        header = f"# {app_name} - Changelog Part {file_number}\n\n"
+        header += f"This file is part of a multi-file changelog. See [README.md](./README.md) for all files.\n\n"
+        header += "---\n\n"
+
+        # APPEND mode: Add new entry at END (newest at bottom)
+        offset = _append_entry(changelog_file, header, entry)
+        index.record_append(changelog_file.name, offset, entry)
+
+        # Update the README index
+        self._update_changelog_readme(app_path, app_name, index)
+
     async def append_to_summary_changelog(
         self,
         app_path: str,
@@ -1233,21 +1361,7 @@ Focus on WHAT was done, WHAT changed, and the RESULT. Skip process details like
         timestamp = datetime.now().strftime("%b %d, %Y %I:%M %p")
 
         # Get files changed count
-        files_changed_count = 0
-        try:
-            if commit_hash and (Path(app_path) / ".git").exists():
-                import subprocess
-                result = subprocess.run(
-                    ["git", "diff-tree", "--no-commit-id", "--name-only", "-r", commit_hash],
-                    cwd=app_path,
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-                if result.returncode == 0 and result.stdout:
-                    files_changed_count = len([f for f in result.stdout.strip().split('\n') if f])
-        except Exception:
-            pass
+        files_changed_count = await asyncio.to_thread(_count_files_changed, app_path, commit_hash)
 
         # Generate concise summary using LLM
         concise_summary = "No summary available."
@@ -1282,34 +1396,30 @@ Focus on WHAT was done, WHAT changed, and the RESULT. Skip process details like
         entry = "\n".join(entry_parts)
 
         try:
-            # Read existing content if file exists
-            existing_content = ""
-            if summary_file.exists():
-                existing_content = summary_file.read_text(encoding="utf-8")
-
-            # Check if this is a new file
-            if not existing_content.strip():
-                # Add header for new summary file
-                file_number = self._get_summary_file_number(summary_file)
-                header = f"# {app_name} - Summary Changes Part {file_number}\n\n"
-                header += f"Concise summaries of development sessions. See `changelog/` for full details.\n\n"
-                header += "---\n\n"
-                new_content = header + entry
-            else:
-                # APPEND mode: Add new entry at END
-                new_content = existing_content + entry
-
-            # Write the updated summary
-            summary_file.write_text(new_content, encoding="utf-8")
-
-            # Update README
-            self._update_summary_readme(app_path, app_name)
-
+            await asyncio.to_thread(self._write_summary_entry, summary_file, app_path, app_name, entry)
             logger.info(f"📝 Updated summary changelog: {summary_file}")
 
         except Exception as e:
             logger.error(f"Failed to update summary changelog: {e}")
 
+    def _write_summary_entry(self, summary_file: Path, app_path: str, app_name: str, entry: str) -> None:
+        """Append an entry to a summary file and refresh the README."""
+        # Reconcile the index with disk before the file grows
+        index = ChangelogIndex(summary_file.parent, "summary").refresh()
+
+        # Header for a new summary file (only written if the file is new or empty)
+        file_number = self._get_summary_file_number(summary_file)
+        header = f"# {app_name} - Summary Changes Part {file_number}\n\n"
+        header += f"Concise summaries of development sessions. See `changelog/` for full details.\n\n"
+        header += "---\n\n"
+
+        # APPEND mode: Add new entry at END
+        offset = _append_entry(summary_file, header, entry)
+        index.record_append(summary_file.name, offset, entry)
+
+        # Update README
+        self._update_summary_readme(app_path, app_name, index)
+
     def _get_current_summary_file(self, app_path: str, app_name: str) -> Path:
         """Get current summary file with 1MB rotation."""
         app_root = Path(app_path).parent
@@ -1338,31 +1448,18 @@ Focus on WHAT was done, WHAT changed, and the RESULT. Skip process details like
         """Extract file number from summary filename."""
         return int(summary_file.stem.split("-")[1])
 
-    def _update_summary_readme(self, app_path: str, app_name: str) -> None:
+    def _update_summary_readme(self, app_path: str, app_name: str, index: Optional[ChangelogIndex] = None) -> None:
         """Update the summary changelog README with file index."""
         app_root = Path(app_path).parent
         summary_dir = app_root / "summary_changes"
         readme_file = summary_dir / "README.md"
 
-        # Get all summary files
-        summary_files = sorted(summary_dir.glob("summary-*.md"))
-
-        total_entries = 0
-        file_info = []
-
-        for file in summary_files:
-            try:
-                content = file.read_text(encoding="utf-8")
-                entry_count = content.count("## 📅")
-                total_entries += entry_count
-
-                file_info.append({
-                    "name": file.name,
-                    "entries": entry_count,
-                    "size_kb": file.stat().st_size / 1024
-                })
-            except Exception:
-                continue
+        # Entry counts come from the index (no re-reading of summary files)
+        file_info = [
+            {"name": f.name, "entries": f.entries, "size_kb": f.size_bytes / 1024}
+            for f in (index or ChangelogIndex(summary_dir, "summary")).files()
+        ]
+        total_entries = sum(info["entries"] for info in file_info)
 
         # Build README content
         readme_parts = [
@@ -1397,18 +1494,22 @@ Focus on WHAT was done, WHAT changed, and the RESULT. Skip process details like
         ])
 
         try:
-            readme_file.write_text("\n".join(readme_parts), encoding="utf-8")
+            _atomic_write_text(readme_file, "\n".join(readme_parts))
         except Exception as e:
             logger.error(f"Failed to update summary README: {e}")
 
     async def generate_claude_md(self, app_path: str) -> None:
-        """Generate CLAUDE.md file with app context for persistence."""
+        """
+        Generate CLAUDE.md file with app context for persistence.
+
+        CLAUDE.md is loaded into the agent's context (setting_sources=project),
+        so stable architecture notes come first and per-run details
+        (timestamp, session, recent changes) are kept at the end.
+        """
         claude_md = Path(app_path) / "CLAUDE.md"
 
-        content = f"""# {self.generation_context.get('app_name', 'App')} - Context
-
-Generated: {datetime.now().isoformat()}
-Session: {self.current_session_id or 'No active session'}
+        layout = PromptLayout()
+        layout.add_stable("architecture", f"""# {self.generation_context.get('app_name', 'App')} - Context
 
 ## Architecture Overview
 
@@ -1436,14 +1537,16 @@ Session: {self.current_session_id or 'No active session'}
 - `client/src/pages/` - React page components
 - `client/src/components/` - Reusable UI components
 - `client/src/contexts/` - React contexts (Auth, etc.)
-- `client/src/lib/` - Client utilities (api-client, auth-helpers)
-
-## Recent Changes
+- `client/src/lib/` - Client utilities (api-client, auth-helpers)""")
+        layout.add_volatile("recent_changes", f"""## Recent Changes
 
 {self.generation_context.get('last_action', 'No recent changes recorded')}
 Last modified: {self.generation_context.get('last_modified', 'Unknown')}
 
-## Development Commands
+Generated: {datetime.now().isoformat()}
+Session: {self.current_session_id or 'No active session'}
+""")
+        layout.add_stable("development", """## Development Commands
 
 ```bash
 # Install dependencies
@@ -1470,12 +1573,11 @@ See `.env` file for configuration. Key variables:
 ## Notes for Future Development
 
 This file helps Claude Code maintain context across sessions. When resuming work,
-Claude will read this file to understand the app's architecture and recent changes.
-"""
+Claude will read this file to understand the app's architecture and recent changes.""")
 
         try:
-            claude_md.write_text(content)
-            logger.info(f"📝 Generated CLAUDE.md at {claude_md}")
+            await asyncio.to_thread(_atomic_write_text, claude_md, layout.render() + "\n")
+            logger.info(f"📝 Generated CLAUDE.md at {claude_md} (prefix {layout.prefix_hash})")
         except Exception as e:
             logger.error(f"Failed to generate CLAUDE.md: {e}")
 
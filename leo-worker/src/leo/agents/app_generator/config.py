@@ -85,6 +85,14 @@ AGENT_CONFIG = {
 
         # MCP Tools - Integration analysis
         "mcp__integration_analyzer__compare_with_template",
+
+        # MCP Tools - Code structure index
+        "mcp__code_index__index_status",
+        "mcp__code_index__find_symbol",
+        "mcp__code_index__find_importers",
+        "mcp__code_index__list_routes",
+        "mcp__code_index__find_api_usage",
+        "mcp__code_index__file_outline",
     ],
 }
 
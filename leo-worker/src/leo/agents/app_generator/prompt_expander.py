@@ -39,6 +39,7 @@ class PromptExpander:
             system_prompt=self.system_prompt,
             model="sonnet",
             max_turns=5,  # Allow up to 5 turns for thorough expansion
+            use_client_pool=True,  # Reuse a warm CLI process across expansions
         )
 
         logger.info("✅ PromptExpander initialized with PROMPTING-GUIDE.md")
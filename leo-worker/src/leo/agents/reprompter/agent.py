@@ -106,6 +106,7 @@ class SimpleReprompter:
             allowed_tools=REPROMPTER_CONFIG["allowed_tools"],
             name=REPROMPTER_CONFIG["name"],
             cwd=app_path,  # Set working directory for Read/Bash tools
+            use_client_pool=True,  # Reuse a warm CLI process across iterations
         )
 
         logger.info(f"✅ SimpleReprompter initialized for {app_path}")
@@ -171,6 +172,9 @@ Use smart judgment to merge appropriately based on the user's guidance.
 ## GIT STATUS
 {context['git_status']}
 
+## CODE STRUCTURE (routes and endpoints from the code index)
+{context['code_structure']}
+
 ## RECENT TASKS (Last {CONTEXT_CONFIG['task_history_limit']} - for context)
 {context['recent_tasks']}
 
@@ -205,6 +209,9 @@ Analyze the current state and generate the next development task prompt.
 ## GIT STATUS
 {context['git_status']}
 
+## CODE STRUCTURE (routes and endpoints from the code index)
+{context['code_structure']}
+
 ## RECENT TASKS (Last {CONTEXT_CONFIG['task_history_limit']} - for loop detection)
 {context['recent_tasks']}
 
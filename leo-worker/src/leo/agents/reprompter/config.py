@@ -30,6 +30,7 @@ CONTEXT_CONFIG = {
     "max_plan_lines": 200,                # First N lines per plan file (preview)
     "error_log_lines": 100,               # Tail N lines of error logs
     "task_history_limit": 5,              # Show last N tasks for loop detection
+    "code_index_max_routes": 40,          # Routes listed per section in the code structure overview
 }
 
 # Reprompter modes
@@ -9,6 +9,9 @@ import subprocess
 from pathlib import Path
 from typing import Dict
 
+from cc_tools.code_index.index import query_index
+from leo.changelog import ChangelogIndex
+
 from .config import CONTEXT_CONFIG
 
 
@@ -36,6 +39,7 @@ class ContextGatherer:
             'error_logs': self._read_error_logs(app_path),
             'git_status': self._run_git_status(app_path),
             'recent_tasks': self._get_recent_tasks(app_path),
+            'code_structure': self._read_code_index(app_path),
         }
 
     def _read_session_context(self, app_path: str) -> str:
@@ -107,82 +111,54 @@ class ContextGatherer:
         - Older files: Last 100 lines (was: 200)
 
         Reads from summary_changes/ for token efficiency, falls back to changelog/ if unavailable.
+        Tails are read via the changelog index (seek to the needed entries, not whole files).
         """
         app_path_obj = Path(app_path)
 
         # Try summary_changes/ first (MUCH more token-efficient)
         summary_dir = app_path_obj.parent / "summary_changes"
         if summary_dir.exists():
-            max_entries = CONTEXT_CONFIG["max_changelog_entries"]
-            files = sorted(summary_dir.glob("summary-*.md"), reverse=True)[:max_entries]
-
-            if files:
-                content = []
-                max_lines_latest = 300  # Hard limit for latest (was: unlimited)
-                max_lines_older = 100   # Reduced from 200
-
-                for i, f in enumerate(files):
-                    try:
-                        all_lines = f.read_text().splitlines()
-
-                        # Latest file (i==0): Last 300 lines (recent work)
-                        if i == 0:
-                            if len(all_lines) > max_lines_latest:
-                                truncated_lines = all_lines[-max_lines_latest:]
-                                preview = "\n".join(truncated_lines)
-                                content.append(f"=== {f.name} (last {max_lines_latest} lines - latest) ===\n{preview}")
-                            else:
-                                content.append(f"=== {f.name} (latest) ===\n{f.read_text()}")
-                        else:
-                            # Older files: Last 100 lines only
-                            if len(all_lines) > max_lines_older:
-                                truncated_lines = all_lines[-max_lines_older:]
-                                preview = "\n".join(truncated_lines)
-                                content.append(f"=== {f.name} (last {max_lines_older} lines - older) ===\n{preview}")
-                            else:
-                                content.append(f"=== {f.name} (older) ===\n{f.read_text()}")
-                    except Exception as e:
-                        content.append(f"=== {f.name} ===\nError reading: {e}")
-
-                return "\n\n".join(content)
+            content = self._read_changelog_tails(ChangelogIndex(summary_dir, "summary"), "")
+            if content:
+                return content
 
         # Fallback to full changelog/ if summary_changes/ doesn't exist (backwards compatibility)
         changelog_dir = app_path_obj.parent / "changelog"
         if not changelog_dir.exists():
             return "No changelog found."
 
-        max_entries = CONTEXT_CONFIG["max_changelog_entries"]
-        files = sorted(changelog_dir.glob("changelog-*.md"), reverse=True)[:max_entries]
+        content = self._read_changelog_tails(ChangelogIndex(changelog_dir, "changelog"), "VERBOSE ")
+        return content or "No changelog entries found."
 
-        if not files:
-            return "No changelog entries found."
+    def _read_changelog_tails(self, index: ChangelogIndex, label: str) -> str:
+        """
+        Tail the newest changelog files: 300 lines of the latest, 100 of older ones.
+
+        Args:
+            index: Index of the changelog directory to read
+            label: Label prefix for section headers ("" or "VERBOSE ")
+
+        Returns:
+            Formatted sections, or "" if the directory has no changelog files
+        """
+        files = index.latest_files(CONTEXT_CONFIG["max_changelog_entries"])
+        separator = ", " if label else " - "
 
         content = []
-        max_lines_latest = 300  # Reduced from 1000 (same limit as summary)
+        max_lines_latest = 300  # Hard limit for latest (was: unlimited)
         max_lines_older = 100   # Reduced from 200
 
-        for i, f in enumerate(files):
+        for i, name in enumerate(files):
+            max_lines, age = (max_lines_latest, "latest") if i == 0 else (max_lines_older, "older")
             try:
-                all_lines = f.read_text().splitlines()
-
-                # Latest file: 300 lines max (reduced for consistency)
-                if i == 0:
-                    if len(all_lines) > max_lines_latest:
-                        truncated_lines = all_lines[-max_lines_latest:]
-                        preview = "\n".join(truncated_lines)
-                        content.append(f"=== {f.name} (last {max_lines_latest} lines, VERBOSE latest) ===\n{preview}")
-                    else:
-                        content.append(f"=== {f.name} (VERBOSE latest) ===\n{f.read_text()}")
+                lines, truncated = index.read_tail(name, max_lines)
+                preview = "\n".join(lines)
+                if truncated:
+                    content.append(f"=== {name} (last {max_lines} lines{separator}{label}{age}) ===\n{preview}")
                 else:
-                    # Older files: 100 lines max
-                    if len(all_lines) > max_lines_older:
-                        truncated_lines = all_lines[-max_lines_older:]
-                        preview = "\n".join(truncated_lines)
-                        content.append(f"=== {f.name} (last {max_lines_older} lines, VERBOSE older) ===\n{preview}")
-                    else:
-                        content.append(f"=== {f.name} (VERBOSE older) ===\n{f.read_text()}")
+                    content.append(f"=== {name} ({label}{age}) ===\n{preview}")
             except Exception as e:
-                content.append(f"=== {f.name} ===\nError reading: {e}")
+                content.append(f"=== {name} ===\nError reading: {e}")
 
         return "\n\n".join(content)
 
@@ -308,6 +284,20 @@ class ContextGatherer:
         except Exception as e:
             return f"Error running git: {e}"
 
+    def _read_code_index(self, app_path: str) -> str:
+        """
+        Routes and API endpoints from the code index (same index as the
+        code_index MCP tool; only changed files are re-parsed).
+        """
+        if not Path(app_path).is_dir():
+            return "No app directory."
+
+        try:
+            max_routes = CONTEXT_CONFIG["code_index_max_routes"]
+            return query_index(Path(app_path), lambda index: index.summary(max_routes))
+        except Exception as e:
+            return f"Error reading code index: {e}"
+
     def _get_recent_tasks(self, app_path: str) -> str:
         """Read last N tasks from session for loop detection."""
         session_file = Path(app_path) / ".agent_session.json"
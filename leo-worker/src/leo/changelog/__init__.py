@@ -0,0 +1,10 @@
+"""
+Leo Changelog Index - Append-only entry index for changelog/ and summary_changes/.
+
+Serves README file listings and "latest entries" reads without re-reading
+the whole changelog history on every iteration.
+"""
+
+from .index import ChangelogIndex, ChangelogFileStats, ENTRY_MARKER
+
+__all__ = ["ChangelogIndex", "ChangelogFileStats", "ENTRY_MARKER"]
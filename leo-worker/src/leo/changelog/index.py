@@ -0,0 +1,290 @@
+"""
+Append-only index of changelog entries.
+
+Each changelog directory (changelog/, summary_changes/) keeps a
+.index.jsonl file with one record per entry:
+
+    {"file": "changelog-003.md", "offset": 1234, "length": 890,
+     "lines": 21, "timestamp": "2026-01-05T14:03:00"}
+
+Offsets and lengths are in bytes, so readers can seek straight to the
+last N entries of a file instead of reading the whole history. The
+index is reconciled against the files on disk with a stat() per file;
+only bytes past the last indexed entry are ever scanned.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Heading that starts every changelog/summary entry
+ENTRY_MARKER = "## 📅"
+
+INDEX_FILENAME = ".index.jsonl"
+
+# Timestamp format used in entry headings (e.g. "Oct 19, 2026 12:28 AM")
+HEADING_TIMESTAMP_FORMAT = "%b %d, %Y %I:%M %p"
+
+
+@dataclass
+class ChangelogFileStats:
+    """Per-file numbers for the README index."""
+
+    name: str
+    entries: int
+    size_bytes: int
+
+
+def _heading_timestamp(entry_text: str) -> Optional[str]:
+    """Parse the ISO timestamp out of an entry heading, if possible."""
+    heading = entry_text.split("\n", 1)[0][len(ENTRY_MARKER):].strip()
+    try:
+        return datetime.strptime(heading.split(" - ", 1)[0], HEADING_TIMESTAMP_FORMAT).isoformat()
+    except ValueError:
+        return None
+
+
+class ChangelogIndex:
+    """
+    Entry index for one changelog directory.
+
+    Usage:
+        index = ChangelogIndex(changelog_dir, "changelog")
+        index.record_append("changelog-001.md", offset, entry)
+        for stats in index.files():
+            ...
+        lines, truncated = index.read_tail("changelog-001.md", max_lines=300)
+    """
+
+    def __init__(self, directory: Path, file_prefix: str):
+        """
+        Args:
+            directory: Directory holding the numbered changelog files
+            file_prefix: File name prefix ("changelog" or "summary")
+        """
+        self.directory = Path(directory)
+        self.file_prefix = file_prefix
+        self.index_file = self.directory / INDEX_FILENAME
+        self._records: Optional[Dict[str, List[dict]]] = None
+
+    # ------------------------------------------------------------------
+    # Loading / reconciliation
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> 'ChangelogIndex':
+        """(Re)load the index and reconcile it with the files on disk."""
+        self._records = None
+        self._ensure_loaded()
+        return self
+
+    def _ensure_loaded(self) -> Dict[str, List[dict]]:
+        if self._records is None:
+            self._records = self._load()
+            self._sync()
+        return self._records
+
+    def _load(self) -> Dict[str, List[dict]]:
+        records: Dict[str, List[dict]] = {}
+        if not self.index_file.exists():
+            return records
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn last line from a crash mid-append
+                    records.setdefault(record["file"], []).append(record)
+        except OSError as e:
+            logger.warning(f"Failed to read changelog index {self.index_file}: {e}")
+        for file_records in records.values():
+            file_records.sort(key=lambda r: r["offset"])
+        return records
+
+    def _changelog_files(self) -> List[str]:
+        """Numbered changelog file names on disk, oldest first."""
+        try:
+            names = [
+                entry.name for entry in os.scandir(self.directory)
+                if entry.name.startswith(f"{self.file_prefix}-") and entry.name.endswith(".md")
+            ]
+        except FileNotFoundError:
+            return []
+        return sorted(names)
+
+    def _sync(self) -> None:
+        """Bring the index up to date with the files on disk (stat + tail scan only)."""
+        records = self._records
+        on_disk = self._changelog_files()
+        rewrite = False
+        appended: List[dict] = []
+
+        # Files that disappeared
+        for name in list(records):
+            if name not in on_disk:
+                del records[name]
+                rewrite = True
+
+        for name in on_disk:
+            try:
+                size = (self.directory / name).stat().st_size
+            except OSError:
+                continue
+            file_records = records.get(name, [])
+            indexed_end = max((r["offset"] + r["length"] for r in file_records), default=0)
+
+            if size < indexed_end:
+                # File was replaced/truncated (e.g. reset from git) - rescan fully
+                file_records = []
+                indexed_end = 0
+                rewrite = True
+            if size > indexed_end:
+                scanned = self._scan(name, indexed_end)
+                file_records = file_records + scanned
+                appended.extend(scanned)
+            if file_records:
+                records[name] = file_records
+
+        if rewrite:
+            self._write_all()
+        elif appended:
+            self._append_records(appended)
+
+    def _scan(self, name: str, start: int) -> List[dict]:
+        """Find entries in a file from a byte offset onwards."""
+        marker = ENTRY_MARKER.encode("utf-8")
+        try:
+            with open(self.directory / name, "rb") as f:
+                f.seek(start)
+                data = f.read()
+        except OSError as e:
+            logger.warning(f"Failed to scan {name} for changelog index: {e}")
+            return []
+
+        positions = []
+        pos = data.find(marker)
+        while pos != -1:
+            # Only headings at the start of a line count
+            if pos == 0 or data[pos - 1:pos] == b"\n":
+                positions.append(pos)
+            pos = data.find(marker, pos + len(marker))
+
+        scanned = []
+        for i, pos in enumerate(positions):
+            end = positions[i + 1] if i + 1 < len(positions) else len(data)
+            text = data[pos:end].decode("utf-8", errors="replace")
+            scanned.append({
+                "file": name,
+                "offset": start + pos,
+                "length": end - pos,
+                "lines": text.count("\n"),
+                "timestamp": _heading_timestamp(text),
+            })
+        if scanned:
+            logger.debug(f"Indexed {len(scanned)} existing entries in {name}")
+        return scanned
+
+    def _append_records(self, new_records: List[dict]) -> None:
+        try:
+            with open(self.index_file, "a", encoding="utf-8") as f:
+                for record in new_records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to update changelog index {self.index_file}: {e}")
+
+    def _write_all(self) -> None:
+        """Rewrite the index from memory (only after files were replaced/removed)."""
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                for name in sorted(self._records):
+                    for record in self._records[name]:
+                        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            logger.warning(f"Failed to rewrite changelog index {self.index_file}: {e}")
+
+    # ------------------------------------------------------------------
+    # Writer API
+    # ------------------------------------------------------------------
+
+    def record_append(self, file_name: str, offset: int, entry: str) -> None:
+        """
+        Record an entry that was just written to a changelog file.
+
+        Args:
+            file_name: Changelog file the entry was written to
+            offset: Byte offset of the entry in that file
+            entry: Entry text as written
+        """
+        records = self._ensure_loaded()
+        file_records = records.setdefault(file_name, [])
+        if any(r["offset"] == offset for r in file_records):
+            return  # Already picked up by _sync()
+        record = {
+            "file": file_name,
+            "offset": offset,
+            "length": len(entry.encode("utf-8")),
+            "lines": entry.count("\n"),
+            "timestamp": _heading_timestamp(entry) or datetime.now().isoformat(timespec="seconds"),
+        }
+        file_records.append(record)
+        self._append_records([record])
+
+    # ------------------------------------------------------------------
+    # Reader API
+    # ------------------------------------------------------------------
+
+    def files(self) -> List[ChangelogFileStats]:
+        """Entry count and size per file, oldest first."""
+        records = self._ensure_loaded()
+        stats = []
+        for name in self._changelog_files():
+            try:
+                size = (self.directory / name).stat().st_size
+            except OSError:
+                continue
+            stats.append(ChangelogFileStats(name=name, entries=len(records.get(name, [])), size_bytes=size))
+        return stats
+
+    def total_entries(self) -> int:
+        return sum(len(r) for r in self._ensure_loaded().values())
+
+    def latest_files(self, limit: int) -> List[str]:
+        """Newest `limit` file names, newest first."""
+        self._ensure_loaded()
+        return list(reversed(self._changelog_files()))[:limit]
+
+    def read_tail(self, file_name: str, max_lines: int) -> Tuple[List[str], bool]:
+        """
+        Read the last `max_lines` lines of a file, seeking past older entries.
+
+        Returns:
+            Tuple of (lines, truncated) where truncated is True if the file
+            has more than max_lines lines.
+        """
+        file_records = self._ensure_loaded().get(file_name, [])
+
+        start = 0
+        lines = 0
+        for record in reversed(file_records):
+            lines += record["lines"]
+            if lines >= max_lines:
+                start = record["offset"]
+                break
+
+        with open(self.directory / file_name, "rb") as f:
+            f.seek(start)
+            all_lines = f.read().decode("utf-8", errors="replace").splitlines()
+
+        truncated = start > 0 or len(all_lines) > max_lines
+        return all_lines[-max_lines:], truncated
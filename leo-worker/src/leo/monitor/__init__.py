@@ -8,6 +8,7 @@ Also provides user-friendly summaries for non-developer users.
 """
 
 from .collector import LogCollector
+from .heuristics import HeuristicVerdict, classify_trajectory
 from .summarizer import HaikuAnalyzer, TrajectoryAnalysis, FriendlySummarizer, FriendlyUpdate
 from .streamer import ProcessMonitorStreamer, get_process_monitor_streamer, set_process_monitor_streamer
 
@@ -15,6 +16,8 @@ __all__ = [
     "LogCollector",
     "HaikuAnalyzer",
     "TrajectoryAnalysis",
+    "HeuristicVerdict",
+    "classify_trajectory",
     "FriendlySummarizer",
     "FriendlyUpdate",
     "ProcessMonitorStreamer",
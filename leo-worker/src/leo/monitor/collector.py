@@ -3,10 +3,16 @@ Log Collector - Buffers conversation entries for summarization.
 
 Collects conversation log entries from cc-agent's ConversationLogger
 and buffers them for periodic summarization by HaikuSummarizer.
+
+Batching is activity-driven: a window closes early once it holds enough
+entries or estimated tokens, stretches out while activity is low, and an
+idle collector doesn't wake up at all until the next entry arrives.
 """
 
 import asyncio
 import logging
+import random
+import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass, field
@@ -14,68 +20,197 @@ from dataclasses import dataclass, field
 logger = logging.getLogger(__name__)
 
 
+# Entries kept per window; beyond this the buffer is reservoir-sampled
+# (aggregates still count every entry)
+DEFAULT_MAX_ENTRIES_PER_WINDOW = 2000
+
+# Adaptive batching defaults
+DEFAULT_MIN_BATCH_ENTRIES = 5  # Fewer entries than this -> stretch the window
+DEFAULT_MAX_INTERVAL_SECONDS = 180  # Longest a quiet window is stretched to
+DEFAULT_MAX_BATCH_ENTRIES = 400  # Emit early at this many entries
+DEFAULT_MAX_BATCH_TOKENS = 30_000  # Emit early at this much estimated agent output
+
+# Rough chars-per-token for estimating batch size from text
+CHARS_PER_TOKEN = 4
+
+# Longest string kept per field of a buffered entry. Prompts only use the
+# first ~200 chars, and full Write/Edit payloads would otherwise sit in the
+# buffer for the whole window.
+MAX_BUFFERED_FIELD_CHARS = 300
+
+
+def _slim_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return value[:MAX_BUFFERED_FIELD_CHARS]
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    return None
+
+
+def _slim_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of an entry with only what analysis reads (no thinking, no payloads)."""
+    slim: Dict[str, Any] = {}
+    for key, value in entry.items():
+        if key == "thinking_blocks":
+            continue
+        if key == "text_blocks":
+            slim[key] = [block[:MAX_BUFFERED_FIELD_CHARS] for block in value[:1]]
+        elif key == "tool_uses":
+            slim[key] = [
+                {
+                    "name": tool.get("name", "unknown"),
+                    "input": {
+                        k: _slim_value(v) for k, v in tool.get("input", {}).items()
+                        if _slim_value(v) is not None
+                    } if isinstance(tool.get("input"), dict) else {},
+                }
+                for tool in value
+            ]
+        else:
+            slim[key] = _slim_value(value) if isinstance(value, str) else value
+    return slim
+
+
+@dataclass
+class BatchStats:
+    """
+    Running aggregates over every entry added to a window.
+
+    Maintained by LogCollector.add_entry so readers never rescan entries.
+    """
+    entry_count: int = 0
+    sampled_out: int = 0
+    agents: Dict[str, int] = field(default_factory=dict)
+    entry_types: Dict[str, int] = field(default_factory=dict)
+    tool_usage: Dict[str, int] = field(default_factory=dict)
+    total_cost: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    text_chars: int = 0
+
+    @property
+    def estimated_tokens(self) -> int:
+        """Approximate size of the agent text/thinking in this window."""
+        return self.text_chars // CHARS_PER_TOKEN
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Fold one entry into the aggregates."""
+        self.entry_count += 1
+        agent = entry.get("agent", "unknown")
+        self.agents[agent] = self.agents.get(agent, 0) + 1
+        entry_type = entry.get("type", "unknown")
+        self.entry_types[entry_type] = self.entry_types.get(entry_type, 0) + 1
+
+        if entry_type == "result":
+            self.total_cost += entry.get("cost_usd", 0) or 0
+            self.input_tokens += entry.get("input_tokens", 0) or 0
+            self.output_tokens += entry.get("output_tokens", 0) or 0
+        elif entry_type == "assistant_message":
+            for tool in entry.get("tool_uses", []):
+                name = tool.get("name", "unknown")
+                self.tool_usage[name] = self.tool_usage.get(name, 0) + 1
+            for block in entry.get("text_blocks", []) + entry.get("thinking_blocks", []):
+                self.text_chars += len(block)
+
+    def merge(self, other: 'BatchStats') -> 'BatchStats':
+        """Combine with the aggregates of a later window."""
+        merged = BatchStats(
+            entry_count=self.entry_count + other.entry_count,
+            sampled_out=self.sampled_out + other.sampled_out,
+            agents=dict(self.agents),
+            entry_types=dict(self.entry_types),
+            tool_usage=dict(self.tool_usage),
+            total_cost=self.total_cost + other.total_cost,
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            text_chars=self.text_chars + other.text_chars,
+        )
+        for target, source in (
+            (merged.agents, other.agents),
+            (merged.entry_types, other.entry_types),
+            (merged.tool_usage, other.tool_usage),
+        ):
+            for key, count in source.items():
+                target[key] = target.get(key, 0) + count
+        return merged
+
+    @classmethod
+    def from_entries(cls, entries: List[Dict[str, Any]]) -> 'BatchStats':
+        stats = cls()
+        for entry in entries:
+            stats.add(entry)
+        return stats
+
+
 @dataclass
 class LogBatch:
-    """A batch of log entries ready for summarization."""
+    """
+    A batch of log entries ready for summarization.
+
+    `entries` may be a sample of the window (see LogCollector); the
+    aggregate properties always cover every entry via `stats`.
+    """
     entries: List[Dict[str, Any]]
     window_start: datetime
     window_end: datetime
     generation_id: Optional[str] = None
+    stats: Optional[BatchStats] = None
+
+    def __post_init__(self) -> None:
+        if self.stats is None:
+            self.stats = BatchStats.from_entries(self.entries)
 
     @property
     def agent_names(self) -> List[str]:
         """Get unique agent names in this batch."""
-        return list(set(e.get("agent", "unknown") for e in self.entries))
+        return list(self.stats.agents)
 
     @property
     def entry_types(self) -> Dict[str, int]:
         """Count entries by type."""
-        counts: Dict[str, int] = {}
-        for e in self.entries:
-            t = e.get("type", "unknown")
-            counts[t] = counts.get(t, 0) + 1
-        return counts
+        return self.stats.entry_types
 
     @property
     def total_cost(self) -> float:
         """Sum costs from result entries."""
-        return sum(
-            e.get("cost_usd", 0) or 0
-            for e in self.entries
-            if e.get("type") == "result"
-        )
+        return self.stats.total_cost
 
     @property
     def total_tokens(self) -> Dict[str, int]:
         """Sum tokens from result entries."""
-        input_tokens = sum(
-            e.get("input_tokens", 0) or 0
-            for e in self.entries
-            if e.get("type") == "result"
-        )
-        output_tokens = sum(
-            e.get("output_tokens", 0) or 0
-            for e in self.entries
-            if e.get("type") == "result"
-        )
-        return {"input": input_tokens, "output": output_tokens}
+        return {"input": self.stats.input_tokens, "output": self.stats.output_tokens}
 
     @property
     def tool_usage(self) -> Dict[str, int]:
         """Count tool uses by tool name."""
-        counts: Dict[str, int] = {}
-        for e in self.entries:
-            if e.get("type") == "assistant_message":
-                for tool in e.get("tool_uses", []):
-                    name = tool.get("name", "unknown")
-                    counts[name] = counts.get(name, 0) + 1
-        return counts
+        return self.stats.tool_usage
+
+    @property
+    def entry_count(self) -> int:
+        """Entries seen in the window (including any sampled out)."""
+        return self.stats.entry_count
+
+    def merge(self, newer: 'LogBatch') -> 'LogBatch':
+        """Combine with the next consecutive batch into one covering both windows."""
+        return LogBatch(
+            entries=self.entries + newer.entries,
+            window_start=self.window_start,
+            window_end=newer.window_end,
+            generation_id=newer.generation_id,
+            stats=self.stats.merge(newer.stats)
+        )
 
 
 class LogCollector:
     """
     Collects conversation log entries and emits batches for summarization.
 
+    A window is emitted:
+    - early, once it reaches max_batch_entries or max_batch_tokens
+    - after batch_interval_seconds, if it has at least min_batch_entries
+    - after max_interval_seconds otherwise (quiet windows are stretched)
+    The timer sleeps without a deadline while no entries are buffered.
+
     Usage:
         collector = LogCollector(batch_interval_seconds=60)
         collector.set_batch_callback(on_batch)
@@ -91,7 +226,12 @@ class LogCollector:
     def __init__(
         self,
         batch_interval_seconds: int = 60,
-        generation_id: Optional[str] = None
+        generation_id: Optional[str] = None,
+        max_entries_per_window: int = DEFAULT_MAX_ENTRIES_PER_WINDOW,
+        min_batch_entries: int = DEFAULT_MIN_BATCH_ENTRIES,
+        max_interval_seconds: int = DEFAULT_MAX_INTERVAL_SECONDS,
+        max_batch_entries: int = DEFAULT_MAX_BATCH_ENTRIES,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS
     ):
         """
         Initialize log collector.
@@ -99,12 +239,26 @@ class LogCollector:
         Args:
             batch_interval_seconds: How often to emit batches (default: 60s)
             generation_id: Optional ID for the current generation
+            max_entries_per_window: Entries kept per batch before sampling kicks in
+            min_batch_entries: Windows smaller than this are stretched
+            max_interval_seconds: Upper bound for a stretched window
+            max_batch_entries: Emit as soon as a window has this many entries
+            max_batch_tokens: Emit as soon as a window has this many estimated tokens
         """
         self.batch_interval = batch_interval_seconds
         self.generation_id = generation_id
+        self.max_entries_per_window = max_entries_per_window
+        self.min_batch_entries = min_batch_entries
+        self.max_interval = max(max_interval_seconds, batch_interval_seconds)
+        self.max_batch_entries = max_batch_entries
+        self.max_batch_tokens = max_batch_tokens
 
         self._entries: List[Dict[str, Any]] = []
+        self._seqs: List[int] = []  # Arrival order of _entries (sampling reorders slots)
+        self._stats = BatchStats()
         self._window_start: Optional[datetime] = None
+        self._window_opened: Optional[float] = None  # monotonic time of first entry in window
+        self._wakeup = asyncio.Event()
         self._batch_callback: Optional[Callable[[LogBatch], None]] = None
         self._timer_task: Optional[asyncio.Task] = None
         self._running = False
@@ -153,47 +307,108 @@ class LogCollector:
         Add a conversation log entry to the buffer.
 
         This is called synchronously from the conversation callback,
-        so we just append and let the timer handle batching.
+        so we just fold it into the running aggregates, buffer a slimmed
+        copy and let the timer handle batching. Past max_entries_per_window
+        the buffer becomes a uniform reservoir sample of the window.
         """
-        self._entries.append(entry)
+        seq = self._stats.entry_count
+        self._stats.add(entry)
+        entry = _slim_entry(entry)
+
+        if len(self._entries) < self.max_entries_per_window:
+            self._entries.append(entry)
+            self._seqs.append(seq)
+        else:
+            self._stats.sampled_out += 1
+            slot = random.randrange(seq + 1)
+            if slot < self.max_entries_per_window:
+                self._entries[slot] = entry
+                self._seqs[slot] = seq
 
         # Set window start on first entry
         if self._window_start is None:
             self._window_start = datetime.utcnow()
 
+        # Wake the timer only when its decision changes: window opened,
+        # window no longer "quiet", or window full
+        if self._window_opened is None:
+            self._window_opened = time.monotonic()
+            self._wakeup.set()
+        elif self._stats.entry_count == self.min_batch_entries or self._batch_full():
+            self._wakeup.set()
+
+    def _batch_full(self) -> bool:
+        return (
+            self._stats.entry_count >= self.max_batch_entries
+            or self._stats.estimated_tokens >= self.max_batch_tokens
+        )
+
     async def _batch_timer(self) -> None:
-        """Background task that emits batches periodically."""
+        """Background task that emits batches as windows close."""
         while self._running:
             try:
-                await asyncio.sleep(self.batch_interval)
-                await self._emit_batch()
+                reason = await self._wait_for_window()
+                await self._emit_batch(reason)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in batch timer: {e}")
 
-    async def _emit_batch(self) -> None:
+    async def _wait_for_window(self) -> str:
+        """Sleep until the current window should be emitted; returns why."""
+        # Idle: no periodic wakeups until the first entry arrives
+        while self._window_opened is None:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+        while True:
+            self._wakeup.clear()
+            if self._batch_full():
+                return "size"
+            quiet = self._stats.entry_count < self.min_batch_entries
+            target = self.max_interval if quiet else self.batch_interval
+            remaining = target - (time.monotonic() - self._window_opened)
+            if remaining <= 0:
+                return "stretched" if quiet else "interval"
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _emit_batch(self, reason: str = "final") -> None:
         """Emit current entries as a batch and reset buffer."""
         async with self._lock:
             if not self._entries:
                 return
 
-            # Create batch
-            batch = LogBatch(
-                entries=self._entries.copy(),
-                window_start=self._window_start or datetime.utcnow(),
-                window_end=datetime.utcnow(),
-                generation_id=self.generation_id
-            )
-
-            # Reset buffer
-            self._entries = []
+            # Swap buffers out (no copy)
+            entries, seqs, stats = self._entries, self._seqs, self._stats
+            self._entries, self._seqs, self._stats = [], [], BatchStats()
+            window_start = self._window_start or datetime.utcnow()
             self._window_start = datetime.utcnow()
+            self._window_opened = None
+
+        if stats.sampled_out:
+            # Sampling replaced slots out of order - restore arrival order
+            order = sorted(range(len(entries)), key=seqs.__getitem__)
+            entries = [entries[i] for i in order]
+            logger.info(f"Batch sampled: kept {len(entries)} of {stats.entry_count} entries")
+
+        batch = LogBatch(
+            entries=entries,
+            window_start=window_start,
+            window_end=datetime.utcnow(),
+            generation_id=self.generation_id,
+            stats=stats
+        )
 
         # Invoke callback
         if self._batch_callback:
             try:
-                logger.debug(f"Emitting batch: {len(batch.entries)} entries, agents: {batch.agent_names}")
+                logger.debug(
+                    f"Emitting batch ({reason}): {batch.entry_count} entries, "
+                    f"~{stats.estimated_tokens} tokens, agents: {batch.agent_names}"
+                )
                 self._batch_callback(batch)
             except Exception as e:
                 logger.error(f"Error in batch callback: {e}")
@@ -0,0 +1,153 @@
+"""
+Trajectory Heuristics - Local pre-classifier for process monitor batches.
+
+Recognizes the common trajectory patterns straight from the structured
+log entries, so clear-cut windows get a score without an LLM call:
+
+- Repeated identical tool calls (same tool, same input)
+- Error-retry loops (error entries / failed results)
+- Builds re-run over and over (tool results aren't logged, so a build
+  command run N times in one window is taken as N-1 failures)
+- Long stretches of read-only exploration
+- Clean windows: edits made, no errors, no repeats
+
+Anything that doesn't clearly match returns None and goes to the LLM.
+"""
+
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .collector import LogBatch
+
+# Same tool + same input this many times is a loop
+REPEAT_STRUGGLING = 3
+REPEAT_INEFFICIENT = 5
+
+# Error entries / failed results in one window
+ERRORS_STRUGGLING = 2
+ERRORS_INEFFICIENT = 4
+
+# Build commands run in one window
+BUILD_RUNS_STRUGGLING = 3
+BUILD_RUNS_INEFFICIENT = 5
+
+# Consecutive read-only calls that count as a long exploration stretch
+READ_STRETCH = 20
+
+READ_ONLY_TOOLS = frozenset({"Read", "Glob", "Grep", "LS"})
+EDIT_TOOLS = frozenset({"Write", "Edit", "MultiEdit"})
+
+BUILD_COMMAND = re.compile(
+    r"\b(npm|pnpm|yarn|bun)\s+(run\s+)?(build|typecheck|type-check|lint)\b"
+    r"|\btsc\b|\bvite\s+build\b|\bnext\s+build\b"
+)
+
+
+@dataclass
+class HeuristicVerdict:
+    """Trajectory assessment produced without an LLM."""
+    score: str  # EFFICIENT, GOOD, STRUGGLING, INEFFICIENT
+    signals: List[str]
+    summary: str
+
+
+def _tool_calls(batch: LogBatch) -> List[Tuple[str, Dict[str, Any]]]:
+    """(tool name, input) for every tool call, in order."""
+    calls = []
+    for e in batch.entries:
+        if e.get("type") == "assistant_message":
+            for tool in e.get("tool_uses", []):
+                tool_input = tool.get("input")
+                calls.append((tool.get("name", "unknown"), tool_input if isinstance(tool_input, dict) else {}))
+    return calls
+
+
+def _call_key(name: str, tool_input: Dict[str, Any]) -> str:
+    return name + ":" + json.dumps(tool_input, sort_keys=True, default=str)
+
+
+def _describe_call(name: str, tool_input: Dict[str, Any]) -> str:
+    target = tool_input.get("file_path") or tool_input.get("pattern") or tool_input.get("command")
+    if target:
+        return f"{name} {str(target)[:60]}"
+    return name
+
+
+def _longest_read_stretch(calls: List[Tuple[str, Dict[str, Any]]]) -> int:
+    longest = current = 0
+    for name, _ in calls:
+        current = current + 1 if name in READ_ONLY_TOOLS else 0
+        longest = max(longest, current)
+    return longest
+
+
+def _summary(batch: LogBatch, calls: List[Tuple[str, Dict[str, Any]]], detail: str) -> str:
+    agents = ", ".join(batch.agent_names) or "Agent"
+    top_tools = ", ".join(f"{name} x{count}" for name, count in Counter(n for n, _ in calls).most_common(3))
+    activity = f"{len(calls)} tool calls ({top_tools})" if calls else f"{batch.entry_count} log entries"
+    return f"{agents}: {activity}. {detail}"
+
+
+def classify_trajectory(batch: LogBatch) -> Optional[HeuristicVerdict]:
+    """
+    Score a batch locally if it matches a known pattern.
+
+    Args:
+        batch: LogBatch to classify
+
+    Returns:
+        HeuristicVerdict, or None if the window is ambiguous (use the LLM)
+    """
+    calls = _tool_calls(batch)
+
+    repeats: Counter = Counter()
+    call_by_key: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    for name, tool_input in calls:
+        key = _call_key(name, tool_input)
+        repeats[key] += 1
+        call_by_key.setdefault(key, (name, tool_input))
+    worst_key, worst_count = repeats.most_common(1)[0] if repeats else ("", 0)
+    errors = batch.entry_types.get("error", 0) + sum(
+        1 for e in batch.entries if e.get("type") == "result" and not e.get("success", False)
+    )
+    build_runs = sum(
+        1 for name, tool_input in calls
+        if name == "Bash" and BUILD_COMMAND.search(str(tool_input.get("command", "")))
+    )
+    read_stretch = _longest_read_stretch(calls)
+    edits = sum(batch.tool_usage.get(name, 0) for name in EDIT_TOOLS)
+
+    signals: List[str] = []
+
+    if worst_count >= REPEAT_STRUGGLING:
+        signals.append(f"Repeated {_describe_call(*call_by_key[worst_key])} {worst_count} times")
+    if errors >= ERRORS_STRUGGLING:
+        signals.append(f"{errors} errors/failed runs in window")
+    if build_runs >= BUILD_RUNS_STRUGGLING:
+        signals.append(f"Build re-run {build_runs} times (likely failing)")
+
+    if (
+        worst_count >= REPEAT_INEFFICIENT
+        or errors >= ERRORS_INEFFICIENT
+        or build_runs >= BUILD_RUNS_INEFFICIENT
+    ):
+        score = "INEFFICIENT"
+        detail = "Stuck in a loop without clear progress."
+    elif signals:
+        score = "STRUGGLING"
+        detail = "Repeating work or retrying after failures."
+    elif read_stretch >= READ_STRETCH and not edits:
+        score = "GOOD"
+        signals.append(f"Long exploration: {read_stretch} read-only calls, no edits")
+        detail = "Exploring the codebase before making changes."
+    elif edits and errors == 0 and worst_count <= 1:
+        score = "EFFICIENT"
+        signals.append("Clean implementation, no retries")
+        detail = f"Made {edits} file edits with no errors."
+    else:
+        return None  # Ambiguous - let the LLM look at it
+
+    return HeuristicVerdict(score=score, signals=signals[:3], summary=_summary(batch, calls, detail))
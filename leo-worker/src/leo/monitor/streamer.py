@@ -7,15 +7,24 @@ Orchestrates the full flow:
 3. Periodically analyzes with HaikuAnalyzer (for devs) and FriendlySummarizer (for users)
 4. Emits process_monitor messages (devs) and friendly_log messages (users) via WSI
 5. Writes analysis to artifacts log file
+
+Analysis runs in a background task with both LLM calls in parallel. While
+one batch is being analyzed, newer batches are coalesced into a single
+pending batch rather than stacking up requests. Trivial batches (a handful
+of entries, or only read-only tool calls) skip the LLM entirely, and
+batches the heuristic pre-classifier can score are answered locally.
 """
 
 import asyncio
 import json
 import logging
+import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, Optional, Callable, TYPE_CHECKING
 
 from .collector import LogCollector, LogBatch
+from .heuristics import classify_trajectory
 from .summarizer import HaikuAnalyzer, TrajectoryAnalysis, FriendlySummarizer, FriendlyUpdate
 
 if TYPE_CHECKING:
@@ -23,6 +32,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# How long stop() waits for the final analysis to be sent
+FINAL_ANALYSIS_TIMEOUT_SECONDS = 45.0
+
+# Recent per-call latencies kept for get_stats()
+LATENCY_SAMPLES = 50
+
+# Batches smaller than this aren't worth an LLM call
+MIN_ANALYSIS_ENTRIES = 3
+
+# Tools that only look around; a window of nothing but these is skipped
+READ_ONLY_TOOLS = frozenset({"Read", "Glob", "Grep", "LS"})
+
+# Entry types that always warrant analysis, however small the batch
+NOTABLE_ENTRY_TYPES = ("result", "error")
+
 
 class ProcessMonitorStreamer:
     """
@@ -48,7 +72,8 @@ class ProcessMonitorStreamer:
         wsi_client,
         batch_interval_seconds: int = 60,
         api_key: Optional[str] = None,
-        artifacts_dir: Optional[str] = None
+        artifacts_dir: Optional[str] = None,
+        on_analysis_timing: Optional[Callable[[str, float, str], None]] = None
     ):
         """
         Initialize process monitor streamer.
@@ -58,6 +83,8 @@ class ProcessMonitorStreamer:
             batch_interval_seconds: How often to emit analysis (default: 60s)
             api_key: Anthropic API key for Haiku (defaults to env var)
             artifacts_dir: Directory for writing log files (optional)
+            on_analysis_timing: Called with (analysis, seconds, outcome) after
+                                each LLM call, e.g. metrics.record_monitor_analysis
         """
         self.wsi_client = wsi_client
         self.collector = LogCollector(batch_interval_seconds=batch_interval_seconds)
@@ -68,6 +95,19 @@ class ProcessMonitorStreamer:
         self._generation_id: Optional[str] = None
         self._artifacts_dir = artifacts_dir
         self._log_file: Optional[Path] = None
+        self._on_analysis_timing = on_analysis_timing
+
+        # In-flight analysis and the batch waiting behind it (coalesced)
+        self._analysis_task: Optional[asyncio.Task] = None
+        self._pending_batch: Optional[LogBatch] = None
+        self._coalesced_batches = 0
+        self._skipped_analyses: Dict[str, int] = {}
+        self._heuristic_analyses = 0
+        self._llm_analyses = 0
+        self._latencies: Dict[str, deque] = {
+            "trajectory": deque(maxlen=LATENCY_SAMPLES),
+            "friendly": deque(maxlen=LATENCY_SAMPLES),
+        }
 
         # Set up callback from collector to analyzer
         self.collector.set_batch_callback(self._on_batch)
@@ -102,9 +142,25 @@ class ProcessMonitorStreamer:
         if not self._running:
             return
 
+        # Final batch is emitted here and queued behind any in-flight analysis
         await self.collector.stop()
         self._running = False
-        logger.info("ProcessMonitorStreamer stopped")
+
+        if self._analysis_task and not self._analysis_task.done():
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(self._analysis_task),
+                    timeout=FINAL_ANALYSIS_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Final analysis still running after {FINAL_ANALYSIS_TIMEOUT_SECONDS:.0f}s - cancelling")
+                self._analysis_task.cancel()
+            except Exception as e:
+                logger.error(f"Final analysis failed: {e}")
+        logger.info(
+            f"ProcessMonitorStreamer stopped (heuristic: {self._heuristic_analyses}, "
+            f"llm: {self._llm_analyses}, skipped: {sum(self._skipped_analyses.values())})"
+        )
 
     def add_entry(self, entry: Dict[str, Any]) -> None:
         """
@@ -119,21 +175,124 @@ class ProcessMonitorStreamer:
         """
         Handle a batch ready for analysis.
 
-        Called by LogCollector when batch interval elapses.
-        Runs both trajectory analysis (devs) and friendly summary (users).
+        Called by LogCollector when batch interval elapses. Only schedules
+        work: if an analysis is still in flight, the batch is merged into the
+        pending one and picked up when the current analysis finishes.
         """
-        try:
-            # Analyze for dev mode (trajectory analysis)
-            analysis = self.analyzer.analyze(batch)
-            if analysis:
-                asyncio.create_task(self._send_analysis(analysis))
+        if self._analysis_task and not self._analysis_task.done():
+            if self._pending_batch:
+                self._pending_batch = self._pending_batch.merge(batch)
+                self._coalesced_batches += 1
+                logger.info(
+                    f"Analysis still in flight - coalesced batch "
+                    f"({self._pending_batch.entry_count} entries pending)"
+                )
+            else:
+                self._pending_batch = batch
+            return
 
-            # Generate friendly summary for user mode
-            friendly = self.friendly_summarizer.summarize(batch)
+        self._analysis_task = asyncio.create_task(self._process_batches(batch))
+
+    async def _process_batches(self, batch: LogBatch) -> None:
+        """Analyze a batch, then any batch that was coalesced while it ran."""
+        while batch is not None:
+            try:
+                await self._process_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to process batch: {e}")
+            batch, self._pending_batch = self._pending_batch, None
+
+    @staticmethod
+    def _skip_reason(batch: LogBatch) -> Optional[str]:
+        """Why a batch doesn't need LLM analysis, or None if it does."""
+        if any(batch.entry_types.get(t) for t in NOTABLE_ENTRY_TYPES):
+            return None
+        if batch.entry_count < MIN_ANALYSIS_ENTRIES:
+            return "too_small"
+        if batch.tool_usage and READ_ONLY_TOOLS.issuperset(batch.tool_usage):
+            return "read_only"
+        return None
+
+    async def _process_batch(self, batch: LogBatch) -> None:
+        """Run trajectory analysis (devs) and friendly summary (users) concurrently."""
+        skip_reason = self._skip_reason(batch)
+        if skip_reason:
+            # No trajectory to report; users still get a (canned) progress update
+            self._skipped_analyses[skip_reason] = self._skipped_analyses.get(skip_reason, 0) + 1
+            logger.info(f"Skipping LLM analysis ({skip_reason}, {batch.entry_count} entries)")
+            friendly = await self.friendly_summarizer.summarize(batch, use_llm=False)
             if friendly:
-                asyncio.create_task(self._send_friendly_update(friendly))
+                await self._send_friendly_update(friendly)
+            return
+
+        started = time.monotonic()
+        verdict = classify_trajectory(batch)
+        if verdict:
+            # Clear-cut window: score locally, canned friendly message, no LLM calls
+            self._heuristic_analyses += 1
+            self._observe_timing("heuristic", time.monotonic() - started, "ok")
+            logger.debug(f"Heuristic verdict {verdict.score}: {verdict.signals}")
+            analysis = self.analyzer.analyze_locally(batch, verdict)
+            friendly = await self.friendly_summarizer.summarize(batch, use_llm=False)
+            await asyncio.gather(self._send_analysis(analysis), self._send_friendly_update(friendly))
+            return
+
+        self._llm_analyses += 1
+        analysis, friendly = await asyncio.gather(
+            self._timed("trajectory", self.analyzer.analyze(batch)),
+            self._timed("friendly", self.friendly_summarizer.summarize(batch)),
+        )
+        sends = []
+        if analysis:
+            sends.append(self._send_analysis(analysis))
+        if friendly:
+            sends.append(self._send_friendly_update(friendly))
+        await asyncio.gather(*sends)
+
+    async def _timed(self, analysis: str, coro):
+        """Await one LLM call, recording its latency and outcome."""
+        started = time.monotonic()
+        outcome = "error"
+        try:
+            result = await coro
+            outcome = "ok" if result else "empty"
+            return result
         except Exception as e:
-            logger.error(f"Failed to process batch: {e}")
+            logger.error(f"{analysis} analysis failed: {e}")
+            return None
+        finally:
+            elapsed = time.monotonic() - started
+            self._latencies[analysis].append(elapsed)
+            logger.debug(f"{analysis} analysis took {elapsed:.2f}s ({outcome})")
+            self._observe_timing(analysis, elapsed, outcome)
+
+    def _observe_timing(self, analysis: str, seconds: float, outcome: str) -> None:
+        if self._on_analysis_timing:
+            try:
+                self._on_analysis_timing(analysis, seconds, outcome)
+            except Exception as e:
+                logger.warning(f"Failed to record analysis timing: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Analysis latency and coalescing counters for logging/debugging."""
+        return {
+            "in_flight": bool(self._analysis_task and not self._analysis_task.done()),
+            "pending_entries": self._pending_batch.entry_count if self._pending_batch else 0,
+            "coalesced_batches": self._coalesced_batches,
+            "skipped_analyses": dict(self._skipped_analyses),
+            "heuristic_analyses": self._heuristic_analyses,
+            "llm_analyses": self._llm_analyses,
+            "short_circuit_rate": round(
+                self._heuristic_analyses / max(1, self._heuristic_analyses + self._llm_analyses), 3
+            ),
+            "latency_seconds": {
+                name: {
+                    "last": round(samples[-1], 3) if samples else None,
+                    "max": round(max(samples), 3) if samples else None,
+                }
+                for name, samples in self._latencies.items()
+            },
+        }
 
     async def _send_analysis(self, analysis: TrajectoryAnalysis) -> None:
         """Send trajectory analysis via WSI and write to log file."""
@@ -157,8 +316,7 @@ class ProcessMonitorStreamer:
             # Write to log file (if configured)
             if self._log_file:
                 try:
-                    with open(self._log_file, "a") as f:
-                        f.write(json.dumps(message) + "\n")
+                    await asyncio.to_thread(self._append_log_line, json.dumps(message))
                 except Exception as e:
                     logger.warning(f"Failed to write to log file: {e}")
 
@@ -169,6 +327,10 @@ class ProcessMonitorStreamer:
         except Exception as e:
             logger.error(f"Failed to send process_monitor via WSI: {e}")
 
+    def _append_log_line(self, line: str) -> None:
+        with open(self._log_file, "a") as f:
+            f.write(line + "\n")
+
     async def _send_friendly_update(self, friendly: FriendlyUpdate) -> None:
         """Send friendly log update via WSI."""
         try:
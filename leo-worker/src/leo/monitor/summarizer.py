@@ -6,6 +6,9 @@ Provides both a summary of what happened and efficiency scoring.
 
 Also provides FriendlySummarizer for user-friendly status messages (non-dev users).
 
+Both analyzers use the async OpenAI client so a slow completion never
+blocks the event loop (WebSocket heartbeats, log streaming).
+
 Cost: ~$0.001 per analysis (very cheap)
 """
 
@@ -16,6 +19,7 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
 from .collector import LogBatch
+from .heuristics import HeuristicVerdict
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,9 @@ OPENAI_MODEL = "gpt-4o-mini"
 # Maximum tokens for output
 MAX_OUTPUT_TOKENS = 600
 
+# Per-request timeout; a stuck analysis must not hold up the next batch forever
+REQUEST_TIMEOUT_SECONDS = 30.0
+
 # System prompt for trajectory analysis (dev mode)
 ANALYZER_SYSTEM_PROMPT = """You are an agent trajectory analyzer. Given agent activity logs, analyze efficiency and summarize progress.
 
@@ -87,17 +94,17 @@ class HaikuAnalyzer:
         self._cumulative_tokens = {"input": 0, "output": 0}
 
     def _get_client(self):
-        """Lazy-load OpenAI client."""
+        """Lazy-load async OpenAI client."""
         if self._client is None:
             try:
                 import openai
-                self._client = openai.OpenAI(api_key=self.api_key)
+                self._client = openai.AsyncOpenAI(api_key=self.api_key, timeout=REQUEST_TIMEOUT_SECONDS)
             except ImportError:
                 logger.error("openai package not installed")
                 raise
         return self._client
 
-    def analyze(self, batch: LogBatch) -> Optional[TrajectoryAnalysis]:
+    async def analyze(self, batch: LogBatch) -> Optional[TrajectoryAnalysis]:
         """
         Analyze a batch of log entries for trajectory quality.
 
@@ -120,7 +127,7 @@ class HaikuAnalyzer:
 
             # Call GPT-4o-mini
             client = self._get_client()
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=OPENAI_MODEL,
                 max_tokens=MAX_OUTPUT_TOKENS,
                 messages=[
@@ -133,28 +140,15 @@ class HaikuAnalyzer:
             response_text = response.choices[0].message.content
             analysis_data = json.loads(response_text)
 
-            # Update cumulative stats
-            self._cumulative_cost += batch.total_cost
-            batch_tokens = batch.total_tokens
-            self._cumulative_tokens["input"] += batch_tokens["input"]
-            self._cumulative_tokens["output"] += batch_tokens["output"]
-
             # Extract trajectory data
             trajectory = analysis_data.get("trajectory", {})
 
-            return TrajectoryAnalysis(
-                generation_id=batch.generation_id,
-                window_start=batch.window_start.isoformat() + "Z",
-                window_end=batch.window_end.isoformat() + "Z",
+            return self._build_analysis(
+                batch,
                 summary=analysis_data.get("summary", "No summary available"),
-                trajectory_score=trajectory.get("score", "GOOD"),
-                trajectory_signals=trajectory.get("signals", []),
-                stats={
-                    "tokens": self._cumulative_tokens.copy(),
-                    "cost_usd": self._cumulative_cost,
-                    "tools": batch.tool_usage,
-                    "entry_count": len(batch.entries)
-                }
+                score=trajectory.get("score", "GOOD"),
+                signals=trajectory.get("signals", []),
+                source="llm"
             )
 
         except json.JSONDecodeError as e:
@@ -164,10 +158,57 @@ class HaikuAnalyzer:
             logger.error(f"Haiku analysis failed: {e}")
             return None  # No fallback - just skip
 
+    def analyze_locally(self, batch: LogBatch, verdict: HeuristicVerdict) -> TrajectoryAnalysis:
+        """Build the analysis for a batch the heuristic pre-classifier already scored."""
+        return self._build_analysis(
+            batch,
+            summary=verdict.summary,
+            score=verdict.score,
+            signals=verdict.signals,
+            source="heuristic"
+        )
+
+    def _build_analysis(
+        self,
+        batch: LogBatch,
+        summary: str,
+        score: str,
+        signals: List[str],
+        source: str
+    ) -> TrajectoryAnalysis:
+        """Wrap a scored batch in a TrajectoryAnalysis and update cumulative stats."""
+        self._cumulative_cost += batch.total_cost
+        batch_tokens = batch.total_tokens
+        self._cumulative_tokens["input"] += batch_tokens["input"]
+        self._cumulative_tokens["output"] += batch_tokens["output"]
+
+        return TrajectoryAnalysis(
+            generation_id=batch.generation_id,
+            window_start=batch.window_start.isoformat() + "Z",
+            window_end=batch.window_end.isoformat() + "Z",
+            summary=summary,
+            trajectory_score=score,
+            trajectory_signals=signals,
+            stats={
+                "tokens": self._cumulative_tokens.copy(),
+                "cost_usd": self._cumulative_cost,
+                "tools": batch.tool_usage,
+                "entry_count": batch.entry_count,
+                "source": source
+            }
+        )
+
     def _format_entries_for_prompt(self, entries: list) -> str:
         """Format log entries for the Haiku prompt."""
         lines = []
+        length = 0
+        counted = 0
         for e in entries:
+            # Output is capped at 4000 chars below - stop formatting once past it
+            length += sum(len(line) + 1 for line in lines[counted:])
+            counted = len(lines)
+            if length > 4000:
+                break
             entry_type = e.get("type", "unknown")
             agent = e.get("agent", "unknown")
             timestamp = e.get("timestamp", "")[:19]  # Trim to seconds
@@ -266,22 +307,23 @@ class FriendlySummarizer:
         self._client = None
 
     def _get_client(self):
-        """Lazy-load OpenAI client."""
+        """Lazy-load async OpenAI client."""
         if self._client is None:
             try:
                 import openai
-                self._client = openai.OpenAI(api_key=self.api_key)
+                self._client = openai.AsyncOpenAI(api_key=self.api_key, timeout=REQUEST_TIMEOUT_SECONDS)
             except ImportError:
                 logger.error("openai package not installed")
                 raise
         return self._client
 
-    def summarize(self, batch: LogBatch) -> Optional[FriendlyUpdate]:
+    async def summarize(self, batch: LogBatch, use_llm: bool = True) -> Optional[FriendlyUpdate]:
         """
         Generate a user-friendly summary from a batch of log entries.
 
         Args:
             batch: LogBatch containing entries to summarize
+            use_llm: False to pick a canned message from tool usage (no API call)
 
         Returns:
             FriendlyUpdate object or None if summarization fails/skipped
@@ -289,6 +331,9 @@ class FriendlySummarizer:
         if not batch.entries:
             return None
 
+        if not use_llm:
+            return self._fallback_summary(batch)
+
         if not self.api_key:
             logger.warning("No OpenAI API key - skipping friendly summary")
             return self._fallback_summary(batch)
@@ -299,7 +344,7 @@ class FriendlySummarizer:
 
             # Call GPT-4o-mini
             client = self._get_client()
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=OPENAI_MODEL,
                 max_tokens=100,  # Short responses only
                 messages=[
@@ -359,21 +404,11 @@ class FriendlySummarizer:
 
     def _fallback_summary(self, batch: LogBatch) -> FriendlyUpdate:
         """Generate a fallback summary when API is unavailable."""
-        # Analyze entries to pick appropriate message
-        has_writes = False
-        has_tests = False
-        has_bash = False
-
-        for e in batch.entries:
-            tools = e.get("tool_uses", [])
-            for tool in tools:
-                tool_name = tool.get("name", "")
-                if tool_name in ("Write", "Edit"):
-                    has_writes = True
-                elif "test" in tool_name.lower():
-                    has_tests = True
-                elif tool_name == "Bash":
-                    has_bash = True
+        # Pick from the batch's precomputed tool counts
+        tool_names = batch.tool_usage.keys()
+        has_writes = any(name in ("Write", "Edit") for name in tool_names)
+        has_tests = any("test" in name.lower() for name in tool_names)
+        has_bash = "Bash" in tool_names
 
         # Pick message based on activity
         if has_tests:
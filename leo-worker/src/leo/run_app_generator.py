@@ -89,6 +89,7 @@ async def main():
                 app_path=args.resume,
                 additional_instructions=args.prompt
             )
+            await agent.wait_for_finalization()  # Changelog/CLAUDE.md are written in the background
 
             logger.info("\n" + "="*80)
             logger.info("✅ APP MODIFICATION COMPLETE")
@@ -107,6 +108,7 @@ async def main():
                 user_prompt=args.prompt,
                 app_name=args.app_name
             )
+            await agent.wait_for_finalization()  # Changelog/CLAUDE.md are written in the background
 
             logger.info("\n" + "="*80)
             logger.info("✅ APP GENERATION COMPLETE")
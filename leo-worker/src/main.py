@@ -257,6 +257,7 @@ from runtime.utils.environment import load_config
 from runtime.utils.logging_config import setup_logging
 from runtime.utils.health import HealthChecker
 from runtime.utils.http_server import HTTPServer
+from runtime.utils.loop_monitor import LoopMonitor
 from runtime.utils import metrics
 
 class LeoContainer:
@@ -301,9 +302,14 @@ class LeoContainer:
 
         # Create monitoring components
         self.health_checker = HealthChecker()
+        self.loop_monitor = LoopMonitor(
+            interval=self.config.loop_lag_interval,
+            slow_callback_ms=self.config.slow_callback_ms
+        )
         self.http_server = HTTPServer(
             health_checker=self.health_checker,
-            port=8080  # Default monitoring port
+            port=8080,  # Default monitoring port
+            loop_monitor=self.loop_monitor
         )
 
         # Set system info metrics
@@ -328,6 +334,9 @@ class LeoContainer:
             # Setup signal handlers
             self.setup_signal_handlers()
 
+            # Start event loop instrumentation (lag histogram, optional slow-callback stacks)
+            self.loop_monitor.start()
+
             # Start HTTP server for metrics/health
             await self.http_server.start()
             self.logger.info("Monitoring endpoints available on port 8080")
@@ -360,6 +369,7 @@ class LeoContainer:
             # Cleanup
             if self.http_server:
                 await self.http_server.stop()
+            await self.loop_monitor.stop()
 
 async def main():
     """Entry point"""
@@ -4,6 +4,7 @@
 # from .s3_manager import S3Manager
 from .artifact_detector import detect_all_artifacts, DeploymentArtifacts
 from .git_manager import GitManager, GitHubRepo, push_to_github
+from .workspace_state import WorkspaceState, WorkspaceSnapshot, get_workspace_state
 
 __all__ = [
     'detect_all_artifacts',
@@ -11,4 +12,7 @@ __all__ = [
     'GitManager',
     'GitHubRepo',
     'push_to_github',
+    'WorkspaceState',
+    'WorkspaceSnapshot',
+    'get_workspace_state',
 ]
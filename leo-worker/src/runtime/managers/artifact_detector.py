@@ -6,7 +6,6 @@ Checks for:
 - Fly.io: fly.toml with app name
 """
 
-import os
 import re
 from pathlib import Path
 from typing import Optional
@@ -21,6 +20,44 @@ class DeploymentArtifacts:
     flyio_url: Optional[str] = None
 
 
+def parse_github_remote(git_config_content: str) -> Optional[str]:
+    """
+    Extract the GitHub URL from .git/config contents
+
+    Returns:
+        GitHub URL (https://github.com/user/repo) or None
+    """
+    # Match: url = https://github.com/user/repo.git
+    # Or:    url = git@github.com:user/repo.git
+    https_match = re.search(r'url\s*=\s*(https://github\.com/[^\s]+)', git_config_content)
+    if https_match:
+        # Remove .git suffix if present
+        return https_match.group(1).removesuffix('.git')
+
+    ssh_match = re.search(r'url\s*=\s*git@github\.com:([^\s]+)', git_config_content)
+    if ssh_match:
+        repo_path = ssh_match.group(1).removesuffix('.git')
+        return f"https://github.com/{repo_path}"
+
+    return None
+
+
+def parse_flyio_app(fly_toml_content: str) -> tuple[Optional[str], Optional[str]]:
+    """
+    Extract the Fly.io app name from fly.toml contents
+
+    Returns:
+        Tuple of (app_name, fly_url) or (None, None)
+    """
+    # Match: app = "my-app-name" or app = 'my-app-name'
+    match = re.search(r'app\s*=\s*["\']([^"\']+)["\']', fly_toml_content)
+    if match:
+        app_name = match.group(1)
+        return app_name, f"https://{app_name}.fly.dev"
+
+    return None, None
+
+
 def detect_github_remote(app_path: str) -> Optional[str]:
     """
     Detect GitHub remote URL from .git/config
@@ -34,23 +71,7 @@ def detect_github_remote(app_path: str) -> Optional[str]:
         return None
 
     try:
-        content = git_config.read_text()
-
-        # Match: url = https://github.com/user/repo.git
-        # Or:    url = git@github.com:user/repo.git
-        https_match = re.search(r'url\s*=\s*(https://github\.com/[^\s]+)', content)
-        if https_match:
-            url = https_match.group(1)
-            # Remove .git suffix if present
-            return url.rstrip('.git')
-
-        ssh_match = re.search(r'url\s*=\s*git@github\.com:([^\s]+)', content)
-        if ssh_match:
-            repo_path = ssh_match.group(1).rstrip('.git')
-            return f"https://github.com/{repo_path}"
-
-        return None
-
+        return parse_github_remote(git_config.read_text())
     except Exception:
         return None
 
@@ -68,17 +89,7 @@ def detect_flyio_deployment(app_path: str) -> tuple[Optional[str], Optional[str]
         return None, None
 
     try:
-        content = fly_toml.read_text()
-
-        # Match: app = "my-app-name" or app = 'my-app-name'
-        match = re.search(r'app\s*=\s*["\']([^"\']+)["\']', content)
-        if match:
-            app_name = match.group(1)
-            fly_url = f"https://{app_name}.fly.dev"
-            return app_name, fly_url
-
-        return None, None
-
+        return parse_flyio_app(fly_toml.read_text())
     except Exception:
         return None, None
 
@@ -87,20 +98,19 @@ def detect_all_artifacts(app_path: str) -> DeploymentArtifacts:
     """
     Detect all deployment artifacts from generated app
 
+    Served from the app's WorkspaceState, so files are only re-read when
+    their stat changes.
+
     Args:
         app_path: Path to generated app directory
 
     Returns:
         DeploymentArtifacts with detected URLs
     """
-    github_url = detect_github_remote(app_path)
-    flyio_app_name, flyio_url = detect_flyio_deployment(app_path)
-
-    return DeploymentArtifacts(
-        github_url=github_url,
-        flyio_app_name=flyio_app_name,
-        flyio_url=flyio_url
-    )
+    # Imported lazily: workspace_state builds on the parsers above
+    from .workspace_state import get_workspace_state
+
+    return get_workspace_state(app_path).snapshot().artifacts
 
 
 # Example usage
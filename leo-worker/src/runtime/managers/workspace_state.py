@@ -0,0 +1,155 @@
+"""
+Workspace State - One cached view of the generated app's config files
+
+Several places probe the same files in the app directory:
+- .git/config  -> GitHub remote (artifact detection)
+- fly.toml     -> Fly.io app (artifact detection)
+- .env         -> credentials to persist, DATABASE_URL for the RLS check
+
+WorkspaceState reads each file once and keeps the parsed result keyed by
+its stat (mtime, size, inode). snapshot() costs one stat() per file and
+only re-reads files that changed since the last call.
+
+Usage:
+    state = get_workspace_state(app_path)
+    snap = state.snapshot()
+    snap.artifacts.flyio_url
+    snap.credentials          # [{"key": ..., "value": ...}, ...]
+    snap.database_url         # DATABASE_URL_POOLING preferred
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+from .artifact_detector import DeploymentArtifacts, parse_flyio_app, parse_github_remote
+
+logger = structlog.get_logger(__name__)
+
+# Files tracked, relative to the app directory
+GIT_CONFIG = os.path.join(".git", "config")
+FLY_TOML = "fly.toml"
+ENV_FILE = ".env"
+
+StatKey = Tuple[int, int, int]  # (mtime_ns, size, inode)
+
+
+def parse_env_file(content: str) -> Dict[str, str]:
+    """
+    Parse KEY=VALUE lines from a .env file.
+
+    Comments, blank lines and empty values are skipped; values are kept as
+    written (quotes included) since they are persisted verbatim.
+    """
+    env: Dict[str, str] = {}
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        key = key.strip()
+        value = value.strip()
+        if key and value:
+            env[key] = value
+    return env
+
+
+@dataclass
+class WorkspaceSnapshot:
+    """Parsed state of the app's config files at one point in time."""
+    app_path: str
+    github_url: Optional[str] = None
+    flyio_app_name: Optional[str] = None
+    flyio_url: Optional[str] = None
+    env: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def artifacts(self) -> DeploymentArtifacts:
+        return DeploymentArtifacts(
+            github_url=self.github_url,
+            flyio_app_name=self.flyio_app_name,
+            flyio_url=self.flyio_url
+        )
+
+    @property
+    def credentials(self) -> List[Dict[str, str]]:
+        """All non-empty .env values as {"key", "value"} dicts (for Vault persistence)."""
+        return [{'key': key, 'value': value} for key, value in self.env.items()]
+
+    @property
+    def database_url(self) -> Optional[str]:
+        """DATABASE_URL_POOLING if set, else DATABASE_URL (quotes stripped)."""
+        url = self.env.get('DATABASE_URL_POOLING') or self.env.get('DATABASE_URL')
+        return url.strip('"\'') if url else None
+
+
+class WorkspaceState:
+    """
+    Stat-keyed cache of parsed config files for one app directory.
+
+    Each tracked file is re-read only when its (mtime, size, inode) changes;
+    a file that disappears drops back to its empty value.
+    """
+
+    def __init__(self, app_path: str) -> None:
+        self.app_path = app_path
+        # relative path -> (stat key, parsed value)
+        self._cache: Dict[str, Tuple[StatKey, Any]] = {}
+        self.reads = 0
+        self.hits = 0
+
+    def _load(self, relative_path: str, parse: Callable[[str], Any], default: Any) -> Any:
+        path = os.path.join(self.app_path, relative_path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._cache.pop(relative_path, None)
+            return default
+
+        key: StatKey = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._cache.get(relative_path)
+        if cached and cached[0] == key:
+            self.hits += 1
+            return cached[1]
+
+        try:
+            with open(path, 'r') as f:
+                value = parse(f.read())
+        except Exception as e:
+            logger.warning("workspace_state.read_failed", file=relative_path, error=str(e))
+            self._cache.pop(relative_path, None)
+            return default
+
+        self.reads += 1
+        self._cache[relative_path] = (key, value)
+        logger.debug("workspace_state.refreshed", file=relative_path)
+        return value
+
+    def snapshot(self) -> WorkspaceSnapshot:
+        """Current parsed state, refreshing only files whose stat changed."""
+        flyio_app_name, flyio_url = self._load(FLY_TOML, parse_flyio_app, (None, None))
+        return WorkspaceSnapshot(
+            app_path=self.app_path,
+            github_url=self._load(GIT_CONFIG, parse_github_remote, None),
+            flyio_app_name=flyio_app_name,
+            flyio_url=flyio_url,
+            env=dict(self._load(ENV_FILE, parse_env_file, {}))
+        )
+
+    def invalidate(self) -> None:
+        """Drop all cached files (e.g. after the workspace is replaced)."""
+        self._cache.clear()
+
+
+_states: Dict[str, WorkspaceState] = {}
+
+
+def get_workspace_state(app_path: str) -> WorkspaceState:
+    """Get the shared WorkspaceState for an app directory, creating if needed."""
+    key = os.path.realpath(app_path)
+    state = _states.get(key)
+    if state is None:
+        state = _states[key] = WorkspaceState(key)
+    return state
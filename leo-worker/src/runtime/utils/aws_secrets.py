@@ -3,17 +3,44 @@ AWS Secrets Manager Loader for Leo Container.
 
 Loads platform secrets from AWS Secrets Manager at container startup.
 Both local Docker and AWS Fargate use the same loading mechanism.
+
+Secrets are fetched in one BatchGetSecretValue call (bounded thread pool of
+GetSecretValue calls as fallback). Warm restarts can skip AWS entirely with
+the optional encrypted on-disk cache (LEO_SECRETS_CACHE_TTL + LEO_SECRETS_CACHE_KEY).
 """
 
+import json
 import os
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
 
 REGION = os.environ.get('AWS_REGION', 'us-east-1')
 SECRET_PREFIX = 'leo/'
 
+# BatchGetSecretValue accepts at most 20 secret IDs per call
+BATCH_SIZE = 20
+
+# Thread pool size for the per-secret fallback
+MAX_FETCH_WORKERS = 8
+
+# Optional encrypted cache for warm restarts (disabled unless TTL > 0 and a key is set)
+# Generate a key with: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
+CACHE_TTL_SECONDS = int(os.environ.get('LEO_SECRETS_CACHE_TTL', '0'))
+CACHE_KEY = os.environ.get('LEO_SECRETS_CACHE_KEY')
+CACHE_FILE = os.environ.get('LEO_SECRETS_CACHE_FILE', os.path.join(tempfile.gettempdir(), 'leo-secrets-cache.bin'))
+
 # Secret mappings: AWS secret name → environment variable
 # Uses 'leo/' prefix to match leo-monorepo-v3 convention
 #
@@ -63,6 +90,126 @@ def get_secret(client, secret_name: str) -> str | None:
         raise
 
 
+def get_secrets_batch(client, secret_names: list[str]) -> tuple[dict[str, str | None], dict[str, ClientError]]:
+    """
+    Fetch several secrets with BatchGetSecretValue.
+
+    Args:
+        client: boto3 Secrets Manager client
+        secret_names: Names of the secrets to fetch
+
+    Returns:
+        Tuple of (values, errors): values maps name → secret string (None if
+        the secret doesn't exist), errors maps name → ClientError
+
+    Raises:
+        ClientError: If the batch call itself fails (e.g. missing
+            secretsmanager:BatchGetSecretValue permission)
+        AttributeError: If the installed boto3 predates BatchGetSecretValue
+    """
+    values: dict[str, str | None] = {}
+    errors: dict[str, ClientError] = {}
+
+    for start in range(0, len(secret_names), BATCH_SIZE):
+        chunk = secret_names[start:start + BATCH_SIZE]
+        response = client.batch_get_secret_value(SecretIdList=chunk)
+
+        for secret in response.get('SecretValues', []):
+            values[secret['Name']] = secret.get('SecretString')
+        for error in response.get('Errors', []):
+            secret_name = error.get('SecretId', '')
+            # Secret not found is acceptable for optional secrets
+            if error.get('ErrorCode') == 'ResourceNotFoundException':
+                values[secret_name] = None
+            else:
+                errors[secret_name] = ClientError(
+                    {'Error': {'Code': error.get('ErrorCode', 'Unknown'), 'Message': error.get('Message', '')}},
+                    'BatchGetSecretValue',
+                )
+
+    return values, errors
+
+
+def get_secrets_concurrently(client, secret_names: list[str]) -> tuple[dict[str, str | None], dict[str, ClientError], dict[str, float]]:
+    """
+    Fetch secrets with parallel GetSecretValue calls (fallback for batch retrieval).
+
+    Returns:
+        Tuple of (values, errors, timings): timings maps name → seconds
+    """
+    def fetch(secret_name: str):
+        started = time.monotonic()
+        try:
+            return secret_name, get_secret(client, secret_name), None, time.monotonic() - started
+        except ClientError as error:
+            return secret_name, None, error, time.monotonic() - started
+
+    values: dict[str, str | None] = {}
+    errors: dict[str, ClientError] = {}
+    timings: dict[str, float] = {}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, max(len(secret_names), 1))) as pool:
+        for secret_name, value, error, elapsed in pool.map(fetch, secret_names):
+            timings[secret_name] = elapsed
+            if error is not None:
+                errors[secret_name] = error
+            else:
+                values[secret_name] = value
+
+    return values, errors, timings
+
+
+def _cache_cipher():
+    """Fernet cipher for the secrets cache, or None if caching is disabled."""
+    if CACHE_TTL_SECONDS <= 0 or not CACHE_KEY or not CRYPTOGRAPHY_AVAILABLE:
+        return None
+    try:
+        return Fernet(CACHE_KEY.encode())
+    except ValueError:
+        print('   ⚠️  LEO_SECRETS_CACHE_KEY is not a valid Fernet key - cache disabled')
+        return None
+
+
+def read_secrets_cache() -> dict[str, str | None] | None:
+    """
+    Read cached secrets if the cache exists, decrypts and is younger than the TTL.
+
+    Returns:
+        Mapping of secret name → value (None = not found in AWS), or None on miss
+    """
+    cipher = _cache_cipher()
+    if cipher is None or not os.path.exists(CACHE_FILE):
+        return None
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            payload = cipher.decrypt(f.read(), ttl=CACHE_TTL_SECONDS)
+        cached = json.loads(payload)
+    except (InvalidToken, OSError, ValueError):
+        # Expired, written with another key, or corrupt
+        return None
+    # Only usable if it covers every mapped secret
+    if not all(name in cached for name in SECRET_MAPPINGS):
+        return None
+    return cached
+
+
+def write_secrets_cache(values: dict[str, str | None]) -> None:
+    """Encrypt and store fetched secrets (owner-only permissions, atomic replace)."""
+    cipher = _cache_cipher()
+    if cipher is None:
+        return
+    try:
+        token = cipher.encrypt(json.dumps(values).encode())
+        cache_dir = os.path.dirname(CACHE_FILE) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.leo-secrets-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(token)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, CACHE_FILE)
+    except OSError as error:
+        print(f'   ⚠️  Could not write secrets cache: {error}')
+
+
 def load_secrets_from_aws() -> None:
     """
     Load all secrets from AWS Secrets Manager and populate os.environ.
@@ -77,49 +224,72 @@ def load_secrets_from_aws() -> None:
     print(f'   Region: {REGION}')
     print(f'   Prefix: {SECRET_PREFIX}')
 
-    # Create AWS Secrets Manager client
-    try:
-        client = boto3.client('secretsmanager', region_name=REGION)
-    except NoCredentialsError:
-        print('\n❌ AWS credentials not found\n')
-        print('Troubleshooting:')
-        print('  1. For local Docker: Mount ~/.aws directory as volume')
-        print('  2. For Fargate: Ensure task execution role is configured')
-        print('  3. Check AWS_PROFILE environment variable (if using profiles)')
-        print('  4. Verify credentials: aws sts get-caller-identity\n')
-        sys.exit(1)
-    except Exception as error:
-        print(f'\n❌ Failed to create AWS Secrets Manager client: {error}\n')
-        print('Troubleshooting:')
-        print(f'  1. Check AWS_REGION is set correctly (current: {REGION})')
-        print('  2. Verify AWS credentials are configured')
-        print('  3. For Fargate: Ensure task execution role has secretsmanager:GetSecretValue permission\n')
-        sys.exit(1)
+    started = time.monotonic()
+    secret_names = list(SECRET_MAPPINGS)
+    timings: dict[str, float] = {}
+    errors: dict[str, ClientError] = {}
+
+    values = read_secrets_cache()
+    if values is not None:
+        source = 'encrypted cache'
+    else:
+        # Create AWS Secrets Manager client
+        try:
+            client = boto3.client('secretsmanager', region_name=REGION)
+        except NoCredentialsError:
+            print('\n❌ AWS credentials not found\n')
+            print('Troubleshooting:')
+            print('  1. For local Docker: Mount ~/.aws directory as volume')
+            print('  2. For Fargate: Ensure task execution role is configured')
+            print('  3. Check AWS_PROFILE environment variable (if using profiles)')
+            print('  4. Verify credentials: aws sts get-caller-identity\n')
+            sys.exit(1)
+        except Exception as error:
+            print(f'\n❌ Failed to create AWS Secrets Manager client: {error}\n')
+            print('Troubleshooting:')
+            print(f'  1. Check AWS_REGION is set correctly (current: {REGION})')
+            print('  2. Verify AWS credentials are configured')
+            print('  3. For Fargate: Ensure task execution role has secretsmanager:GetSecretValue permission\n')
+            sys.exit(1)
+
+        # Fetch all secrets: one batch call, per-secret thread pool as fallback
+        try:
+            batch_started = time.monotonic()
+            values, errors = get_secrets_batch(client, secret_names)
+            # One call for all secrets: reported once, not per secret
+            source = f'BatchGetSecretValue ({(time.monotonic() - batch_started) * 1000:.0f} ms batch call)'
+        except (ClientError, AttributeError) as error:
+            print(f'   ⚠️  Batch retrieval unavailable ({error}), fetching secrets in parallel')
+            values, errors, timings = get_secrets_concurrently(client, secret_names)
+            source = 'GetSecretValue (parallel)'
+
+        if not errors:
+            write_secrets_cache(values)
+
+    total_elapsed = time.monotonic() - started
 
-    # Fetch all secrets
     loaded = []
     missing = []
-    failed = []
+    failed = list(errors.items())
 
     for secret_name, env_var in SECRET_MAPPINGS.items():
-        try:
-            value = get_secret(client, secret_name)
-            if value:
-                # Successfully loaded
-                os.environ[env_var] = value
-                loaded.append((env_var, value))
-            else:
-                # Secret doesn't exist in AWS (ResourceNotFoundException)
-                missing.append(secret_name)
-        except ClientError as error:
-            # Failed to fetch (permissions, network, etc.)
-            failed.append((secret_name, error))
+        if secret_name in errors:
+            continue
+        value = values.get(secret_name)
+        if value:
+            # Successfully loaded
+            os.environ[env_var] = value
+            loaded.append((env_var, value, timings.get(secret_name)))
+        else:
+            # Secret doesn't exist in AWS (ResourceNotFoundException)
+            missing.append(secret_name)
 
     # Log results
-    print(f'   ✅ Loaded {len(loaded)} secrets successfully')
+    print(f'   ✅ Loaded {len(loaded)} secrets successfully via {source} in {total_elapsed * 1000:.0f} ms')
     if loaded:
-        for env_var, value in loaded:
-            print(f'      {env_var}: {obfuscate(value)}')
+        for env_var, value, elapsed in loaded:
+            timing = f' ({elapsed * 1000:.0f} ms)' if elapsed is not None else ''
+            print(f'      {env_var}: {obfuscate(value)}{timing}')
 
     if missing:
         print(f'   ⚠️  {len(missing)} secrets not found in AWS (may be optional):')
@@ -137,7 +307,7 @@ def load_secrets_from_aws() -> None:
             print(f'    Error: {error_code}: {error_msg}')
 
         print('\nTroubleshooting:')
-        print('  1. Verify IAM permissions: secretsmanager:GetSecretValue')
+        print('  1. Verify IAM permissions: secretsmanager:GetSecretValue (and BatchGetSecretValue)')
         print('  2. Check AWS credentials are valid (aws sts get-caller-identity)')
         print(f'  3. Confirm secrets exist: aws secretsmanager list-secrets --region {REGION}')
         print('  4. For local dev: Ensure ~/.aws credentials are mounted in Docker')
@@ -31,6 +31,10 @@ class Config:
     real_mode_suggestion_timeout: int  # Timeout for get_next_prompt() in seconds
     real_mode_fallback_to_mock: bool  # Fallback to mock mode on failure
 
+    # Event loop instrumentation
+    loop_lag_interval: float  # Seconds between loop lag samples
+    slow_callback_ms: int  # Block duration reported as slow callback (0 = detector off)
+
     def validate(self) -> None:
         """Validate configuration"""
         # Required for all modes
@@ -82,6 +86,10 @@ def load_config() -> Config:
         real_mode_generate_timeout=int(os.environ.get('REAL_MODE_GENERATE_TIMEOUT', '1800')),
         real_mode_suggestion_timeout=int(os.environ.get('REAL_MODE_SUGGESTION_TIMEOUT', '60')),
         real_mode_fallback_to_mock=os.environ.get('REAL_MODE_FALLBACK_TO_MOCK', 'false').lower() == 'true',
+
+        # Event loop instrumentation
+        loop_lag_interval=float(os.environ.get('LOOP_LAG_INTERVAL', '0.5')),
+        slow_callback_ms=int(os.environ.get('SLOW_CALLBACK_MS', '0')),
     )
 
     config.validate()
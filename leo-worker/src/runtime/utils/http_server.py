@@ -5,6 +5,7 @@ Provides:
 - /metrics - Prometheus metrics endpoint
 - /health - Health check endpoint
 - /ready - Readiness check endpoint
+- /debug/loop - Event loop lag and slow callbacks (when a LoopMonitor is attached)
 """
 
 import asyncio
@@ -14,6 +15,7 @@ from typing import Optional
 import structlog
 
 from .health import HealthChecker
+from .loop_monitor import LoopMonitor
 
 logger = structlog.get_logger()
 
@@ -25,15 +27,22 @@ class HTTPServer:
     Runs alongside the main WebSocket client to provide observability.
     """
 
-    def __init__(self, health_checker: HealthChecker, port: int = 8080) -> None:
+    def __init__(
+        self,
+        health_checker: HealthChecker,
+        port: int = 8080,
+        loop_monitor: Optional[LoopMonitor] = None
+    ) -> None:
         """
         Initialize HTTP server.
 
         Args:
             health_checker: HealthChecker instance for health/readiness checks
             port: Port to listen on (default: 8080)
+            loop_monitor: LoopMonitor served at /debug/loop (optional)
         """
         self.health_checker = health_checker
+        self.loop_monitor = loop_monitor
         self.port = port
         self.app: Optional[web.Application] = None
         self.runner: Optional[web.AppRunner] = None
@@ -53,6 +62,7 @@ class HTTPServer:
             self.app.router.add_get('/metrics', self.metrics_handler)
             self.app.router.add_get('/health', self.health_handler)
             self.app.router.add_get('/ready', self.ready_handler)
+            self.app.router.add_get('/debug/loop', self.debug_loop_handler)
 
             # Start server
             self.runner = web.AppRunner(self.app)
@@ -63,7 +73,7 @@ class HTTPServer:
             logger.info(
                 "HTTP server started",
                 port=self.port,
-                endpoints=['/metrics', '/health', '/ready']
+                endpoints=['/metrics', '/health', '/ready', '/debug/loop']
             )
 
         except Exception as e:
@@ -171,3 +181,26 @@ class HTTPServer:
                 },
                 status=503
             )
+
+    async def debug_loop_handler(self, request: web.Request) -> web.Response:
+        """
+        Event loop debug endpoint.
+
+        Returns lag percentiles and the stacks of recent slow callbacks.
+        Returns 404 if no loop monitor is attached.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            JSON response with loop monitor snapshot
+        """
+        if not self.loop_monitor:
+            return web.json_response({'error': 'loop monitor not enabled'}, status=404)
+
+        try:
+            return web.json_response(self.loop_monitor.snapshot())
+
+        except Exception as e:
+            logger.error("Error reading loop monitor", error=str(e), exc_info=True)
+            return web.json_response({'error': str(e)}, status=500)
@@ -0,0 +1,182 @@
+"""
+Event loop instrumentation for Leo Container.
+
+Provides:
+- Loop lag sampler: sleeps for a fixed interval and measures how late it
+  wakes up; every sample goes to the leo_event_loop_lag_seconds histogram
+- Slow-callback detector (optional): a watchdog thread pings the loop and,
+  if the ping isn't answered within the threshold, captures the loop
+  thread's stack while it is still blocked
+- snapshot() for the /debug/loop endpoint
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+import structlog
+
+from . import metrics
+
+logger = structlog.get_logger()
+
+# Recent lag samples kept for percentiles in snapshot()
+LAG_WINDOW = 600
+
+# Slow callback records kept for /debug/loop
+MAX_SLOW_CALLBACKS = 50
+
+# Frames kept per captured stack
+STACK_LIMIT = 30
+
+
+class LoopMonitor:
+    """
+    Measures event loop lag and catches callbacks that block the loop.
+
+    Usage:
+        monitor = LoopMonitor(interval=0.5, slow_callback_ms=250)
+        monitor.start()          # from inside the running loop
+        ...
+        monitor.snapshot()       # dict for /debug/loop
+        await monitor.stop()
+    """
+
+    def __init__(self, interval: float = 0.5, slow_callback_ms: Optional[float] = None) -> None:
+        """
+        Initialize loop monitor.
+
+        Args:
+            interval: Seconds between lag samples
+            slow_callback_ms: Block duration that counts as a slow callback
+                              (None or 0 disables the watchdog thread)
+        """
+        self.interval = interval
+        self.slow_callback_ms = slow_callback_ms or None
+        self.lags: Deque[float] = deque(maxlen=LAG_WINDOW)
+        self.max_lag = 0.0
+        self.samples = 0
+        self.slow_callbacks: Deque[Dict[str, Any]] = deque(maxlen=MAX_SLOW_CALLBACKS)
+        self.slow_callback_count = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._sampler_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        """Start sampling (and the watchdog, if enabled). Must be called from the loop."""
+        if self._sampler_task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._sampler_task = asyncio.create_task(self._sample())
+
+        if self.slow_callback_ms:
+            self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+        logger.info(
+            "Loop monitor started",
+            interval=self.interval,
+            slow_callback_ms=self.slow_callback_ms
+        )
+
+    async def stop(self) -> None:
+        """Stop sampling and the watchdog thread."""
+        self._stop_event.set()
+        if self._sampler_task:
+            self._sampler_task.cancel()
+            try:
+                await self._sampler_task
+            except asyncio.CancelledError:
+                pass
+            self._sampler_task = None
+        if self._watchdog:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+        logger.debug("Loop monitor stopped")
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            self.lags.append(lag)
+            self.samples += 1
+            self.max_lag = max(self.max_lag, lag)
+            metrics.record_loop_lag(lag)
+
+    def _watch(self) -> None:
+        """Watchdog thread: ping the loop, capture its stack if the ping is late."""
+        threshold = self.slow_callback_ms / 1000.0
+        while not self._stop_event.is_set():
+            answered = threading.Event()
+            pinged_at = time.monotonic()
+            try:
+                self._loop.call_soon_threadsafe(answered.set)
+            except RuntimeError:
+                return  # Loop closed
+
+            if not answered.wait(threshold):
+                # Loop is blocked right now - grab the stack before it moves on
+                stack = self._capture_loop_stack()
+                while not answered.wait(0.05):
+                    if self._stop_event.is_set():
+                        return
+                self._record_slow_callback(time.monotonic() - pinged_at, stack)
+
+            self._stop_event.wait(threshold)
+
+    def _capture_loop_stack(self) -> List[str]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return []
+        return [line.rstrip() for line in traceback.format_stack(frame, limit=STACK_LIMIT)]
+
+    def _record_slow_callback(self, duration: float, stack: List[str]) -> None:
+        self.slow_callback_count += 1
+        self.slow_callbacks.append({
+            "timestamp": datetime.now().isoformat(),
+            "duration_ms": round(duration * 1000, 1),
+            "stack": stack,
+        })
+        metrics.record_slow_callback()
+        logger.warning(
+            "Event loop blocked",
+            duration_ms=round(duration * 1000, 1),
+            location=stack[-1].strip().splitlines()[0] if stack else "unknown"
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current lag statistics and recent slow callbacks."""
+        lags = sorted(self.lags)
+
+        def percentile(p: float) -> float:
+            if not lags:
+                return 0.0
+            return lags[min(len(lags) - 1, int(p * len(lags)))]
+
+        return {
+            "running": self._sampler_task is not None,
+            "interval_seconds": self.interval,
+            "samples": self.samples,
+            "lag_ms": {
+                "last": round(self.lags[-1] * 1000, 2) if self.lags else None,
+                "p50": round(percentile(0.50) * 1000, 2),
+                "p99": round(percentile(0.99) * 1000, 2),
+                "max": round(self.max_lag * 1000, 2),
+                "window": len(lags),
+            },
+            "slow_callback_threshold_ms": self.slow_callback_ms,
+            "slow_callbacks_total": self.slow_callback_count,
+            "slow_callbacks": list(self.slow_callbacks),
+        }
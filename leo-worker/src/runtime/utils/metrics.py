@@ -7,6 +7,9 @@ Provides:
 - Error metrics (errors by type, retry counts)
 - Message metrics (messages sent/received by type)
 - Performance metrics (latency histograms)
+- Agent cost metrics (USD, calls and tokens by agent/model)
+- Event loop metrics (loop lag, slow callbacks)
+- Process monitor metrics (analysis latency)
 """
 
 from prometheus_client import Counter, Gauge, Histogram, Summary, Info
@@ -92,6 +95,78 @@ message_processing_seconds = Summary(
     ['message_type']
 )
 
+# Agent Cost Metrics
+# Gauges (not counters): values mirror the CostTracker ledger, which is reset
+# per generation (1 container = 1 generation).
+agent_cost_usd = Gauge(
+    'leo_agent_cost_usd',
+    'Accumulated agent cost in USD for the current generation',
+    ['agent', 'model']
+)
+
+agent_calls = Gauge(
+    'leo_agent_calls',
+    'Agent runs recorded for the current generation',
+    ['agent', 'model']
+)
+
+agent_tokens = Gauge(
+    'leo_agent_tokens',
+    'Tokens used for the current generation',
+    ['agent', 'model', 'token_type']  # token_type: input, output, cache_read, cache_write
+)
+
+agent_cache_hit_ratio = Gauge(
+    'leo_agent_cache_hit_ratio',
+    'Fraction of prompt tokens read from the prompt cache',
+    ['agent', 'model']
+)
+
+# Helper Client Pool Metrics
+client_pool_requests = Gauge(
+    'leo_client_pool_requests',
+    'Helper client pool acquisitions',
+    ['role', 'result']  # result: hit, miss
+)
+
+client_pool_evictions = Gauge(
+    'leo_client_pool_evictions',
+    'Pooled clients dropped (dead, failed reset, or errored)',
+    ['role']
+)
+
+client_pool_spawn_seconds = Gauge(
+    'leo_client_pool_spawn_seconds',
+    'Average CLI spawn+connect latency for pooled clients',
+    ['role']
+)
+
+client_pool_idle = Gauge(
+    'leo_client_pool_idle',
+    'Warm idle clients currently held by the pool',
+    ['role']
+)
+
+# Event Loop Metrics
+event_loop_lag_seconds = Histogram(
+    'leo_event_loop_lag_seconds',
+    'How late the event loop woke up for a scheduled sleep',
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+)
+
+event_loop_slow_callbacks_total = Counter(
+    'leo_event_loop_slow_callbacks_total',
+    'Callbacks that blocked the event loop longer than the slow-callback threshold'
+)
+
+# Process Monitor Metrics
+monitor_analysis_seconds = Histogram(
+    'leo_monitor_analysis_seconds',
+    'Latency of process monitor LLM calls',
+    ['analysis', 'outcome'],  # analysis: trajectory, friendly, heuristic; outcome: ok, empty, error
+    buckets=[0.25, 0.5, 1, 2, 5, 10, 20, 30, 60]
+)
+
 # System Info
 system_info = Info(
     'leo_websocket_info',
@@ -281,3 +356,79 @@ def set_system_info(version: str, python_version: str, generator_mode: str) -> N
         )
     except Exception as e:
         logger.warning("Failed to set system info metric", error=str(e))
+
+
+def record_cost_ledger(snapshot) -> None:
+    """
+    Export the CostTracker ledger as per-agent, per-model gauges.
+
+    Args:
+        snapshot: CostSnapshot from CostTracker.get_instance().snapshot()
+    """
+    try:
+        for (agent, model), totals in snapshot.by_agent_model().items():
+            agent_cost_usd.labels(agent=agent, model=model).set(totals.cost_usd)
+            agent_calls.labels(agent=agent, model=model).set(totals.calls)
+            agent_tokens.labels(agent=agent, model=model, token_type="input").set(totals.input_tokens)
+            agent_tokens.labels(agent=agent, model=model, token_type="output").set(totals.output_tokens)
+            agent_tokens.labels(agent=agent, model=model, token_type="cache_read").set(totals.cache_read_tokens)
+            agent_tokens.labels(agent=agent, model=model, token_type="cache_write").set(totals.cache_write_tokens)
+            agent_cache_hit_ratio.labels(agent=agent, model=model).set(totals.cache_hit_ratio)
+        logger.debug("Metrics: Cost ledger exported", buckets=len(snapshot.entries))
+    except Exception as e:
+        logger.warning("Failed to record cost ledger metrics", error=str(e))
+
+
+def record_client_pool_stats(stats: dict) -> None:
+    """
+    Export helper client pool stats.
+
+    Args:
+        stats: ClientPool.get_instance().get_stats() (role -> counters)
+    """
+    try:
+        for role, role_stats in stats.items():
+            client_pool_requests.labels(role=role, result="hit").set(role_stats["hits"])
+            client_pool_requests.labels(role=role, result="miss").set(role_stats["misses"])
+            client_pool_evictions.labels(role=role).set(role_stats["evictions"])
+            client_pool_spawn_seconds.labels(role=role).set(role_stats["avg_spawn_seconds"])
+            client_pool_idle.labels(role=role).set(role_stats["idle"])
+        logger.debug("Metrics: Client pool stats exported", roles=len(stats))
+    except Exception as e:
+        logger.warning("Failed to record client pool metrics", error=str(e))
+
+
+def record_loop_lag(lag_seconds: float) -> None:
+    """
+    Record one event loop lag sample.
+
+    Args:
+        lag_seconds: Delay beyond the scheduled wake-up time
+    """
+    try:
+        event_loop_lag_seconds.observe(lag_seconds)
+    except Exception as e:
+        logger.warning("Failed to record loop lag metric", error=str(e))
+
+
+def record_slow_callback() -> None:
+    """Record a callback that blocked the event loop past the threshold."""
+    try:
+        event_loop_slow_callbacks_total.inc()
+    except Exception as e:
+        logger.warning("Failed to record slow callback metric", error=str(e))
+
+
+def record_monitor_analysis(analysis: str, duration_seconds: float, outcome: str) -> None:
+    """
+    Record one process monitor LLM call.
+
+    Args:
+        analysis: Which analysis ran (trajectory, friendly, heuristic)
+        duration_seconds: Call duration in seconds
+        outcome: ok, empty or error
+    """
+    try:
+        monitor_analysis_seconds.labels(analysis=analysis, outcome=outcome).observe(duration_seconds)
+    except Exception as e:
+        logger.warning("Failed to record monitor analysis metric", error=str(e))
@@ -9,3 +9,26 @@ LOG_TRUNCATE_PROMPT_REPROMPTER = 5000 # Reprompter suggestion logs
 LOG_TRUNCATE_PROMPT_MESSAGE = 5000    # Log message display (e.g., "Next task: ...")
 LOG_TRUNCATE_PROMPT_CONFIRM = 5000    # Confirm suggestion logs
 LOG_TRUNCATE_PROMPT_EXECUTE = 5000    # Executing task logs (e.g., "Executing: ...")
+
+# Upper bound (seconds) on waiting for background changelog/CLAUDE.md writes before a checkpoint
+ITERATION_DOCS_TIMEOUT = 120
+
+# Resume hydration (git)
+# App repos are cloned with --filter=blob:none (commit history, file contents fetched on demand).
+# A depth > 0 additionally makes the clone shallow; full history is then fetched in the background.
+RESUME_CLONE_DEPTH = 0
+# Artifacts repo (logs, sessions, changelogs) only needs its latest tree on a fresh workspace
+ARTIFACTS_FETCH_DEPTH = 1
+
+# Graceful shutdown (prepare_shutdown)
+# Seconds the orchestrator waits before force-killing the container (SHUTDOWN_TIMEOUT_MS in
+# leo-web wsi-server.ts); used when prepare_shutdown doesn't carry timeout_seconds
+SHUTDOWN_GRACE_PERIOD = 60
+# Seconds of the grace period kept back for all_work_complete and teardown
+SHUTDOWN_SAFETY_MARGIN = 10
+# Repo discovery fallback when the app path wasn't recorded
+REPO_DISCOVERY_MAX_DEPTH = 3
+REPO_DISCOVERY_IGNORE_DIRS = frozenset({
+    "node_modules", ".git", ".next", ".cache", ".turbo", "dist", "build", "coverage",
+    "leo-artifacts", "changelog", "summary_changes", "screenshots", "__pycache__", ".venv",
+})
@@ -376,6 +376,7 @@ class ControlCommandMessage(WSIMessage):
     type: str = "control_command"
     command: str  # "pause", "resume", "cancel", "stop_request", "prepare_shutdown"
     reason: Optional[str] = None
+    timeout_seconds: Optional[float] = None  # prepare_shutdown: grace period before force kill
 
 
 class ShutdownReadyMessage(WSIMessage):
@@ -15,8 +15,9 @@ import asyncio
 import logging
 import os
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Set, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 from datetime import datetime
 
 if TYPE_CHECKING:
@@ -27,6 +28,10 @@ logger = logging.getLogger(__name__)
 # Supported image extensions
 IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp'}
 
+# Files remembered as seen (LRU). Files that fall out are older than the
+# 60s recency window by then, so they are simply re-marked as seen.
+MAX_TRACKED_FILES = 5000
+
 
 class ScreenshotWatcher:
     """
@@ -61,8 +66,8 @@ class ScreenshotWatcher:
         self.debounce_seconds = debounce_seconds
 
         # Tracking state
-        self._seen_files: Set[str] = set()
-        self._file_timestamps: dict[str, float] = {}
+        # file path -> last processed time (0 = seen but never sent), LRU-bounded
+        self._seen_files: "OrderedDict[str, float]" = OrderedDict()
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
@@ -131,13 +136,12 @@ class ScreenshotWatcher:
             file_key = str(file_path)
 
             # Check debounce
-            last_seen = self._file_timestamps.get(file_key, 0)
+            last_seen = self._seen_files.get(file_key, 0)
             if time.time() - last_seen < self.debounce_seconds:
                 return
 
             # Update timestamp
-            self._file_timestamps[file_key] = time.time()
-            self._seen_files.add(file_key)
+            self._mark_seen(file_key, time.time())
 
             # Detect stage and description
             stage = self._detect_stage_from_path(file_path)
@@ -160,6 +164,13 @@ class ScreenshotWatcher:
         except Exception as e:
             logger.error(f"Error processing screenshot {file_path}: {e}")
 
+    def _mark_seen(self, file_key: str, timestamp: float) -> None:
+        """Record a file as seen, evicting the least recently seen past MAX_TRACKED_FILES."""
+        self._seen_files[file_key] = timestamp
+        self._seen_files.move_to_end(file_key)
+        while len(self._seen_files) > MAX_TRACKED_FILES:
+            self._seen_files.popitem(last=False)
+
     async def _scan_directory(self) -> None:
         """Scan watch directory for new screenshots."""
         if not self.watch_dir.exists():
@@ -182,7 +193,7 @@ class ScreenshotWatcher:
                                 await self._process_screenshot(path)
                             else:
                                 # Mark as seen to avoid future checks
-                                self._seen_files.add(file_key)
+                                self._mark_seen(file_key, 0)
                         except OSError:
                             pass
 
@@ -236,7 +247,6 @@ class ScreenshotWatcher:
     def clear_seen(self) -> None:
         """Clear the set of seen files (for testing or reset)."""
         self._seen_files.clear()
-        self._file_timestamps.clear()
         logger.debug("Cleared seen files cache")
 
 
@@ -6,11 +6,15 @@ WSI Protocol v2.1 specifications.
 """
 
 import logging
+from collections import deque
 from enum import Enum
 from typing import Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# States kept in state_history
+MAX_STATE_HISTORY = 100
+
 
 # ============================================================================
 # Connection States
@@ -89,7 +93,9 @@ class StateMachine:
             initial_state: Starting state (default: CONNECTING)
         """
         self._state = initial_state
-        self._state_history = [initial_state]
+        # Bounded: a reused connection transitions for the life of the worker
+        self._state_history: deque = deque([initial_state], maxlen=MAX_STATE_HISTORY)
+        self._transition_count = 0
         logger.debug(f"State machine initialized: {initial_state.value}")
 
     @property
@@ -99,8 +105,8 @@ class StateMachine:
 
     @property
     def state_history(self) -> list:
-        """Get state transition history"""
-        return self._state_history.copy()
+        """Get recent state transition history (last MAX_STATE_HISTORY states)"""
+        return list(self._state_history)
 
     def can_transition_to(self, new_state: ConnectionState) -> bool:
         """
@@ -135,6 +141,7 @@ class StateMachine:
         old_state = self._state
         self._state = new_state
         self._state_history.append(new_state)
+        self._transition_count += 1
 
         log_msg = f"State transition: {old_state.value}  {new_state.value}"
         if reason:
@@ -210,10 +217,11 @@ class StateMachine:
         logger.info(f"Resetting state machine from {self._state.value} to READY")
         self._state = ConnectionState.READY
         self._state_history.append(ConnectionState.READY)
+        self._transition_count += 1
 
     def __repr__(self) -> str:
         """String representation"""
-        return f"<StateMachine state={self._state.value} history_length={len(self._state_history)}>"
+        return f"<StateMachine state={self._state.value} transitions={self._transition_count}>"
 
     def __str__(self) -> str:
         """Human-readable string"""